@@ -19,6 +19,9 @@ import sys
 import os
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+from latency_histogram import LatencyHistogram
+
 # Set style
 plt.style.use('seaborn-v0_8-whitegrid')
 sns.set_palette("husl")
@@ -142,6 +145,8 @@ def create_dashboard(df, output_dir=None):
     avg_time = df['extraction_time_ms'].mean() / 1000
     avg_accuracy = passed_df['category_accuracy'].mean() if not passed_df.empty else 0
     avg_items = passed_df['found_items'].mean() if not passed_df.empty else 0
+    latency = LatencyHistogram.from_values(pd.to_numeric(df.loc[df['status'] != 'SKIPPED', 'extraction_time_ms'], errors='coerce'))
+    tail = {name: (value or 0) / 1000 for name, value in latency.percentiles().items()}
     
     summary_text = f"""
     ╔════════════════════════════════════════╗
@@ -152,6 +157,10 @@ def create_dashboard(df, output_dir=None):
     ║  Failed:             {total_tests - passed_tests:>6}            ║
     ║                                        ║
     ║  Avg Extraction:     {avg_time:>6.1f}s           ║
+    ║  p50 Extraction:     {tail['p50']:>6.1f}s           ║
+    ║  p90 Extraction:     {tail['p90']:>6.1f}s           ║
+    ║  p99 Extraction:     {tail['p99']:>6.1f}s           ║
+    ║  p99.9 Extraction:   {tail['p99_9']:>6.1f}s           ║
     ║  Category Accuracy:  {avg_accuracy:>6.1f}%          ║
     ║  Avg Items Found:    {avg_items:>6.1f}           ║
     ╚════════════════════════════════════════╝
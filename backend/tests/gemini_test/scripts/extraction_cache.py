@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Content-Addressed Cache for /pdf/extract Responses
+
+Successful extraction responses are stored on disk under a key built from
+(PDF SHA-256, model, prompt version), so re-running the accuracy suite only
+calls the API for samples whose bytes, model or extraction prompt changed.
+The model is the one the response says served it, not the one the caller
+asked for: an entry is only returned when its served model matches the
+expected one, so a backend that switched or fell back to another model
+doesn't get its old responses reported under the new model's name.
+
+The prompt version defaults to a short hash of the prompt template in
+GeminiService.extractFromPdf, so editing the prompt invalidates the cache
+without anyone having to remember to bump a number.
+
+Entries are evicted least-recently-used first once the cache grows past its
+size budget; a hit refreshes the entry's mtime, which is the recency order.
+
+Usage:
+    python3 extraction_cache.py                  # Show cache contents
+    python3 extraction_cache.py --max-mb 50      # Evict down to a 50 MB budget
+    python3 extraction_cache.py --clear
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+SCRIPT_DIR = Path(__file__).parent
+CACHE_DIR = SCRIPT_DIR.parent / '.cache' / 'extractions'
+GEMINI_SERVICE_TS = SCRIPT_DIR.parents[2] / 'src' / 'infrastructure' / 'services' / 'GeminiService.ts'
+
+DEFAULT_MODEL = 'gemini-3-flash-preview'
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+_EXTRACT_PROMPT = re.compile(r'async extractFromPdf\(.*?const prompt = `(.*?)`;', re.DOTALL)
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def prompt_version(service_path: Path = GEMINI_SERVICE_TS) -> str:
+    """Short hash of the extractFromPdf prompt template (whole file if the template can't be found)"""
+    try:
+        source = service_path.read_text()
+    except OSError:
+        return 'unknown'
+    match = _EXTRACT_PROMPT.search(source)
+    return hashlib.sha256((match.group(1) if match else source).encode()).hexdigest()[:12]
+
+
+class ExtractionCache:
+    """One JSON file per entry; an in-memory OrderedDict mirrors the files oldest-first"""
+
+    def __init__(self, directory: Path = CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        entries = []
+        for path in self.directory.glob('*.json'):
+            stat = path.stat()
+            entries.append((stat.st_mtime, path.name, stat.st_size))
+        self.entries = OrderedDict((name, size) for _, name, size in sorted(entries))
+        self.total_bytes = sum(self.entries.values())
+
+    @staticmethod
+    def key(pdf_sha256: str, model: str, prompt: str) -> str:
+        return hashlib.sha256(f'{pdf_sha256}:{model}:{prompt}'.encode()).hexdigest()
+
+    def get(self, pdf_sha256: str, model: str, prompt: str) -> Optional[Dict[str, Any]]:
+        """Cached entry ({'response', 'extraction_time_ms', ...}) served by `model`, or None"""
+        name = self.key(pdf_sha256, model, prompt) + '.json'
+        path = self.directory / name
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            self.entries.pop(name, None)
+            return None
+        if entry.get('served_model') != model:  # Older entries only recorded the requested model
+            return None
+
+        os.utime(path)
+        self.entries.move_to_end(name)
+        return entry
+
+    def put(self, pdf_sha256: str, model: str, prompt: str, response: Dict[str, Any],
+            extraction_time_ms: int, pdf_name: str = ''):
+        """Store a successful response under the model that served it, then evict down to the size budget"""
+        if response.get('success') is not True:
+            return
+        name = self.key(pdf_sha256, model, prompt) + '.json'
+        path = self.directory / name
+        tmp = path.with_suffix('.tmp')
+        with open(tmp, 'w') as f:
+            json.dump({
+                'pdf': pdf_name,
+                'pdf_sha256': pdf_sha256,
+                'served_model': model,
+                'prompt_version': prompt,
+                'stored_at': time.time(),
+                'extraction_time_ms': extraction_time_ms,
+                'response': response,
+            }, f)
+        os.replace(tmp, path)
+
+        self.total_bytes -= self.entries.pop(name, 0)
+        self.entries[name] = path.stat().st_size
+        self.total_bytes += self.entries[name]
+        self.evict()
+
+    def evict(self, max_bytes: Optional[int] = None) -> int:
+        """Drop least-recently-used entries until the cache fits; returns entries removed"""
+        budget = self.max_bytes if max_bytes is None else max_bytes
+        removed = 0
+        while self.total_bytes > budget and self.entries:
+            name, size = self.entries.popitem(last=False)
+            try:
+                (self.directory / name).unlink()
+            except FileNotFoundError:
+                pass
+            self.total_bytes -= size
+            removed += 1
+        return removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Inspect or trim the /pdf/extract response cache')
+    parser.add_argument('--dir', default=str(CACHE_DIR), help=f'Cache directory (default: {CACHE_DIR})')
+    parser.add_argument('--max-mb', type=float, help='Evict least-recently-used entries down to this size')
+    parser.add_argument('--clear', action='store_true', help='Remove every entry')
+    args = parser.parse_args()
+
+    cache = ExtractionCache(Path(args.dir))
+    if args.clear or args.max_mb is not None:
+        removed = cache.evict(0 if args.clear else int(args.max_mb * 1024 * 1024))
+        print(f'  ✓ Evicted {removed} entries')
+
+    print(f'Cache: {cache.directory}  ({len(cache.entries)} entries, {cache.total_bytes / 1024:.1f} KB)')
+    print(f'Current prompt version: {prompt_version()}')
+    for name in reversed(cache.entries):
+        with open(cache.directory / name) as f:
+            entry = json.load(f)
+        print(f"  {entry['pdf']:<40} {entry.get('served_model', '?'):<24} prompt {entry['prompt_version']}  "
+              f"{entry['extraction_time_ms']:>6}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Mergeable Log-Bucketed Latency Histogram
+
+HDR-style histogram for extraction_time_ms: values below 2 × 10^digits ms
+get their own bucket, and above that each power of two is split into the
+same number of linear sub-buckets, so every recorded value is kept to
+`digits` significant figures (under 1% error at the default of 2) in a
+fixed ~2k-slot array, however many samples are recorded.
+
+Histograms built from different CSV runs merge by adding counts, and
+serialize to a small sparse JSON object stored in metrics_<ts>.json under
+performance_metrics.latency_histogram. Percentile queries bisect a cached
+cumulative array, so their cost does not depend on the number of samples.
+
+Usage:
+    python3 latency_histogram.py                              # Every results/test_data_*.csv
+    python3 latency_histogram.py ../results/test_data_2026*.csv
+    python3 latency_histogram.py --metrics ../results/metrics_20260201_183822.json
+"""
+
+import argparse
+import bisect
+import csv
+import glob
+import json
+import math
+from itertools import accumulate
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+SCRIPT_DIR = Path(__file__).parent
+RESULTS_DIR = SCRIPT_DIR.parent / 'results'
+
+DEFAULT_DIGITS = 2
+DEFAULT_HIGHEST_MS = 60 * 60 * 1000  # Anything slower is clamped into the top bucket
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+class LatencyHistogram:
+    """Counts of integer-millisecond latencies in log-linear buckets"""
+
+    def __init__(self, digits: int = DEFAULT_DIGITS, highest_ms: int = DEFAULT_HIGHEST_MS):
+        self.digits = digits
+        self.highest_ms = highest_ms
+        self.sub_bits = math.ceil(math.log2(2 * 10 ** digits))
+        self.half = 1 << (self.sub_bits - 1)
+        self.counts = [0] * (self.index(highest_ms) + 1)
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+        self._cumulative: Optional[List[int]] = None
+
+    def index(self, value: int) -> int:
+        shift = max(value.bit_length() - self.sub_bits, 0)
+        return self.half * shift + (value >> shift)
+
+    def bounds(self, index: int) -> tuple:
+        """(lowest, highest) value that lands in the bucket"""
+        shift = max(index // self.half - 1, 0)
+        lowest = (index - self.half * shift) << shift
+        return lowest, lowest + (1 << shift) - 1
+
+    def record(self, value_ms: float, count: int = 1):
+        """Add a latency; negative and NaN values are ignored"""
+        if value_ms != value_ms or value_ms < 0:
+            return
+        value = min(int(round(value_ms)), self.highest_ms)
+        self.counts[self.index(value)] += count
+        self.total += count
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        self._cumulative = None
+
+    def merge(self, other: 'LatencyHistogram') -> 'LatencyHistogram':
+        """Add another histogram's counts into this one"""
+        if (other.digits, other.highest_ms) != (self.digits, self.highest_ms):
+            raise ValueError(f'Cannot merge a {other.digits}-digit/{other.highest_ms}ms histogram '
+                             f'into a {self.digits}-digit/{self.highest_ms}ms one')
+        for index, count in enumerate(other.counts):
+            if count:
+                self.counts[index] += count
+        self.total += other.total
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+        self._cumulative = None
+        return self
+
+    def percentile(self, p: float) -> Optional[int]:
+        """Highest value equivalent to the p-th percentile sample (None when empty)"""
+        if not self.total:
+            return None
+        if self._cumulative is None:
+            self._cumulative = list(accumulate(self.counts))
+        rank = max(math.ceil(p / 100 * self.total), 1)
+        index = bisect.bisect_left(self._cumulative, rank)
+        _, highest = self.bounds(index)
+        return max(min(highest, self.max), self.min)
+
+    def percentiles(self, ps: Iterable[float] = PERCENTILES) -> Dict[str, Optional[int]]:
+        """{'p50': ..., 'p99_9': ...} (the key format used in metrics JSON)"""
+        return {f'p{p:g}'.replace('.', '_'): self.percentile(p) for p in ps}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'unit': 'ms',
+            'significant_digits': self.digits,
+            'highest_ms': self.highest_ms,
+            'count': self.total,
+            'min': self.min,
+            'max': self.max,
+            'buckets': [[index, count] for index, count in enumerate(self.counts) if count],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'LatencyHistogram':
+        histogram = cls(data.get('significant_digits', DEFAULT_DIGITS), data.get('highest_ms', DEFAULT_HIGHEST_MS))
+        for index, count in data.get('buckets', []):
+            histogram.counts[index] = count
+        histogram.total = data.get('count', sum(histogram.counts))
+        histogram.min = data.get('min')
+        histogram.max = data.get('max')
+        return histogram
+
+    @classmethod
+    def from_values(cls, values: Iterable[float], **kwargs) -> 'LatencyHistogram':
+        """Build from a column of latencies (a list, NumPy array or pandas Series)"""
+        histogram = cls(**kwargs)
+        for value in values:
+            histogram.record(float(value))
+        return histogram
+
+    @classmethod
+    def from_csv(cls, path: Path, column: str = 'extraction_time_ms', **kwargs) -> 'LatencyHistogram':
+        """Histogram of one test_data CSV; SKIPPED rows and non-numeric cells are left out"""
+        histogram = cls(**kwargs)
+        with open(path, newline='') as f:
+            for row in csv.DictReader(f):
+                if row.get('status') == 'SKIPPED':
+                    continue
+                try:
+                    histogram.record(float(row[column]))
+                except (KeyError, TypeError, ValueError):
+                    pass
+        return histogram
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Merge extraction latencies from test_data CSVs into a histogram')
+    parser.add_argument('csv', nargs='*', help='test_data CSVs to merge (default: every results/test_data_*.csv)')
+    parser.add_argument('--column', default='extraction_time_ms', help='Latency column (default: extraction_time_ms)')
+    parser.add_argument('--digits', type=int, default=DEFAULT_DIGITS,
+                        help=f'Significant digits kept per value (default: {DEFAULT_DIGITS})')
+    parser.add_argument('--metrics', help='Also write the merged histogram and percentiles into this metrics JSON')
+    args = parser.parse_args()
+
+    paths = args.csv or sorted(glob.glob(str(RESULTS_DIR / 'test_data_*.csv')))
+    if not paths:
+        print(f'No test_data CSVs found in {RESULTS_DIR}')
+        raise SystemExit(1)
+
+    merged = LatencyHistogram(args.digits)
+    for path in paths:
+        histogram = LatencyHistogram.from_csv(Path(path), args.column, digits=args.digits)
+        summary = '  '.join(f"{k.replace('_', '.')} {v}ms" for k, v in histogram.percentiles().items() if v is not None)
+        print(f'  {Path(path).name:<32} n={histogram.total:<5} {summary}')
+        merged.merge(histogram)
+
+    print()
+    print(f'Merged: n={merged.total}  min {merged.min}ms  max {merged.max}ms')
+    for name, value in merged.percentiles().items():
+        print(f"  {name.replace('_', '.'):<6} {value}ms")
+
+    if args.metrics:
+        with open(args.metrics) as f:
+            metrics = json.load(f)
+        performance = metrics.setdefault('performance_metrics', {})
+        performance.update({f'{name}_extraction_ms': value for name, value in merged.percentiles().items()})
+        performance['latency_histogram'] = merged.to_dict()
+        with open(args.metrics, 'w') as f:
+            json.dump(metrics, f, indent=2)
+        print(f'  ✓ Updated {args.metrics}')
+
+
+if __name__ == '__main__':
+    main()
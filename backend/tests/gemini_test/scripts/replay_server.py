@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Local Replay Server for /pdf/extract and quick-estimate
+
+Stand-in for the backend + Gemini so the harnesses and visualizers can be
+load-tested offline. Serves recorded responses instead of calling the model:
+
+    POST /api/v{0,1}/pdf/extract              gemini_test/test_result_*.json
+    POST /api/v{0,1}/pricing/quick-estimate   pricing_test/quick_estimate/results/*_grounding_*.json
+                                              (matched on experience level and skills)
+    POST /api/v{0,1}/users/signup, /users/verify-otp, GET /api/v{0,1}/health
+
+Each response is delayed by a latency sampled from the recorded
+extraction_time_ms distribution (results/test_data_*.csv), and a configurable
+fraction of requests fail with the backend's 429 rate-limit body. The same
+PDF bytes always replay the same recording; latency and error draws come from
+a seeded RNG, per request in arrival order.
+
+Requires: pip install aiohttp
+
+Usage:
+    python3 replay_server.py                                   # http://localhost:3000
+    python3 replay_server.py --port 3100 --latency-scale 0.1 --error-rate 0.05
+    API_URL=http://localhost:3100/api/v0 python3 run_pdf_accuracy.py
+"""
+
+import argparse
+import asyncio
+import csv
+import glob
+import hashlib
+import json
+import random
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from aiohttp import web
+
+SCRIPT_DIR = Path(__file__).parent
+GEMINI_TEST_DIR = SCRIPT_DIR.parent
+QUICK_ESTIMATE_RESULTS = GEMINI_TEST_DIR.parent / 'pricing_test' / 'quick_estimate' / 'results'
+
+DEFAULT_LATENCY_MS = [2000.0]  # used when no CSV with successful rows is found
+
+
+def load_pdf_recordings(pattern: str) -> List[Dict[str, Any]]:
+    """Recorded /pdf/extract responses, in file-name order"""
+    recordings = []
+    for path in sorted(glob.glob(pattern)):
+        with open(path) as f:
+            recordings.append(json.load(f))
+    return recordings
+
+
+def load_quick_estimates(results_dir: Path) -> Dict[bool, Dict[str, Dict[Optional[str], Dict[str, Any]]]]:
+    """
+    {grounding: {experience_level: {skills: result}}} from every results file,
+    newest recording winning; each level's skills are kept oldest-recorded first.
+    """
+    recorded = {True: {}, False: {}}
+    for prefix, grounding in (('with_grounding', True), ('without_grounding', False)):
+        for path in sorted(results_dir.glob(f'{prefix}_*.json')):
+            with open(path) as f:
+                for result in json.load(f).get('results', []):
+                    by_skills = recorded[grounding].setdefault(result.get('experience_level'), {})
+                    skills = normalize_skills(result.get('skills'))
+                    by_skills.pop(skills, None)
+                    by_skills[skills] = result
+    return recorded
+
+
+def normalize_skills(skills: Optional[str]) -> Optional[str]:
+    """'UI Design,  Branding ' -> 'ui design, branding' so request and recording spellings match"""
+    if not skills:
+        return None
+    return ', '.join(s.strip().lower() for s in skills.split(',') if s.strip())
+
+
+def find_quick_estimate(by_level: Dict[str, Dict[Optional[str], Dict[str, Any]]],
+                        level: Optional[str], skills: Optional[str]) -> Optional[Dict[str, Any]]:
+    """The recording for (level, skills); the level's newest recording when those skills weren't recorded"""
+    by_skills = by_level.get(level)
+    if not by_skills:
+        return None
+    result = by_skills.get(normalize_skills(skills))
+    return result if result is not None else next(reversed(by_skills.values()))
+
+
+def load_latencies(pattern: str) -> List[float]:
+    """extraction_time_ms of every PASSED row in the matching test_data CSVs"""
+    latencies = []
+    for path in sorted(glob.glob(pattern)):
+        with open(path, newline='') as f:
+            for row in csv.DictReader(f):
+                if row.get('status') == 'PASSED':
+                    try:
+                        latencies.append(float(row['extraction_time_ms']))
+                    except (KeyError, ValueError):
+                        pass
+    return latencies or DEFAULT_LATENCY_MS
+
+
+def quick_estimate_response(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Rebuild the API response a results-file entry was extracted from"""
+    if not result.get('success'):
+        return {'success': False, 'message': result.get('error', 'Unknown error')}
+    return {
+        'success': True,
+        'data': {key: result.get(key) for key in (
+            'estimate', 'ai_researched_costs', 'ai_researched_income',
+            'market_research', 'calculation_breakdown', 'sources')},
+    }
+
+
+class ReplayServer:
+    """Holds the recordings and the seeded RNG shared by all handlers"""
+
+    def __init__(self, pdf_recordings: List[Dict[str, Any]], quick_estimates: Dict[bool, Dict[str, Dict]],
+                 latencies: List[float], latency_scale: float = 1.0, error_rate: float = 0.0,
+                 retry_after: int = 1, seed: int = 42):
+        self.pdf_recordings = pdf_recordings
+        self.quick_estimates = quick_estimates
+        self.latencies = latencies
+        self.latency_scale = latency_scale
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.rng = random.Random(seed)
+        self.next_user_id = 1
+        self.stats = {'requests': 0, 'rate_limited': 0}
+
+    def draw(self) -> tuple:
+        """(latency seconds, rate-limited?) for the next request"""
+        latency = self.rng.choice(self.latencies) * self.latency_scale / 1000
+        return latency, self.rng.random() < self.error_rate
+
+    def rate_limited(self) -> web.Response:
+        self.stats['rate_limited'] += 1
+        return web.json_response(
+            {'success': False, 'error': {'message': 'Too many requests. Please try again in a minute.',
+                                         'retryAfter': self.retry_after}},
+            status=429, headers={'Retry-After': str(self.retry_after)})
+
+    async def replay(self, build) -> web.Response:
+        self.stats['requests'] += 1
+        latency, limited = self.draw()
+        if limited:
+            return self.rate_limited()
+        await asyncio.sleep(latency)
+        body, status = build()
+        return web.json_response(body, status=status)
+
+    async def health(self, request: web.Request) -> web.Response:
+        return web.json_response({'success': True, 'status': 'ok',
+                                  'timestamp': datetime.now(timezone.utc).isoformat(),
+                                  'environment': 'replay', 'version': request.match_info['version']})
+
+    async def signup(self, request: web.Request) -> web.Response:
+        user_id, self.next_user_id = self.next_user_id, self.next_user_id + 1
+        return web.json_response({'success': True, 'data': {'user': {'user_id': user_id}, 'otp': '123456'}},
+                                 status=201)
+
+    async def verify_otp(self, request: web.Request) -> web.Response:
+        return web.json_response({'success': True, 'data': {'token': 'replay-token'}})
+
+    async def pdf_extract(self, request: web.Request) -> web.Response:
+        digest = hashlib.sha256()
+        async for field in (await request.multipart()):
+            if field.name == 'pdf':
+                while chunk := await field.read_chunk():
+                    digest.update(chunk)
+
+        def build():
+            if not self.pdf_recordings:
+                return {'success': False, 'message': 'No recorded PDF responses'}, 500
+            index = int(digest.hexdigest(), 16) % len(self.pdf_recordings)
+            return self.pdf_recordings[index], 200
+
+        return await self.replay(build)
+
+    async def quick_estimate(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        grounding = request.query.get('use_grounding', 'true') != 'false'
+
+        def build():
+            result = find_quick_estimate(self.quick_estimates[grounding], body.get('experience_level'),
+                                         body.get('skills'))
+            if result is None:
+                return {'success': False, 'message': 'No recorded estimate for this experience level'}, 404
+            response = quick_estimate_response(result)
+            return response, 200 if response['success'] else 500
+
+        return await self.replay(build)
+
+    def app(self) -> web.Application:
+        app = web.Application(client_max_size=20 * 1024 * 1024)
+        prefix = '/api/{version:v[01]}'
+        app.add_routes([
+            web.get(f'{prefix}/health', self.health),
+            web.post(f'{prefix}/users/signup', self.signup),
+            web.post(f'{prefix}/users/verify-otp', self.verify_otp),
+            web.post(f'{prefix}/pdf/extract', self.pdf_extract),
+            web.post(f'{prefix}/pricing/quick-estimate', self.quick_estimate),
+        ])
+        return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay recorded /pdf/extract and quick-estimate responses')
+    parser.add_argument('--host', default='127.0.0.1', help='Bind address (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=3000, help='Port (default: 3000, like the backend)')
+    parser.add_argument('--pdf-recordings', default=str(GEMINI_TEST_DIR / 'test_result_*.json'),
+                        help='Glob of recorded /pdf/extract responses')
+    parser.add_argument('--quick-estimate-results', default=str(QUICK_ESTIMATE_RESULTS),
+                        help='Directory with with_/without_grounding_*.json results')
+    parser.add_argument('--latency-csv', default=str(GEMINI_TEST_DIR / 'results' / 'test_data_*.csv'),
+                        help='Glob of test_data CSVs to sample extraction_time_ms from')
+    parser.add_argument('--latency-scale', type=float, default=1.0,
+                        help='Multiply sampled latencies (0 = respond immediately)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with 429')
+    parser.add_argument('--retry-after', type=int, default=1, help='Retry-After seconds on 429 (default: 1)')
+    parser.add_argument('--seed', type=int, default=42, help='Seed for latency and error draws')
+    args = parser.parse_args()
+
+    latencies = load_latencies(args.latency_csv)
+    server = ReplayServer(
+        load_pdf_recordings(args.pdf_recordings),
+        load_quick_estimates(Path(args.quick_estimate_results)),
+        latencies, args.latency_scale, args.error_rate, args.retry_after, args.seed,
+    )
+
+    print(f'Replaying {len(server.pdf_recordings)} PDF recordings, '
+          f'{sum(len(s) for v in server.quick_estimates.values() for s in v.values())} quick estimates')
+    print(f'Latency: {len(latencies)} samples, median {sorted(latencies)[len(latencies) // 2]:.0f}ms '
+          f'× {args.latency_scale}  Error rate: {args.error_rate:.1%}')
+    print(f'Listening on http://{args.host}:{args.port}/api/v0 and /api/v1')
+    web.run_app(server.app(), host=args.host, port=args.port, print=None)
+    print(f"Served {server.stats['requests']} requests ({server.stats['rate_limited']} rate-limited)")
+
+
+if __name__ == '__main__':
+    main()
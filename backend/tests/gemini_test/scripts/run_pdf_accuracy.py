@@ -0,0 +1,503 @@
+#!/usr/bin/env python3
+"""
+AUREA PDF Extraction - Concurrent Accuracy Suite
+
+Python port of test-pdf-accuracy-comprehensive.sh. Uploads the sample PDFs
+to /pdf/extract with bounded concurrency over a pooled aiohttp session and
+scores each response in-process (same rules as the bash/jq version).
+
+Rows are appended to results/test_data_<ts>.csv as each test finishes, with
+the columns visualize_results.py reads; the summary goes to
+results/metrics_<ts>.json in the shell script's schema.
+
+Successful responses are cached by (PDF SHA-256, model, prompt version) via
+extraction_cache.py, so unchanged samples are not re-extracted; cached rows
+keep the extraction_time_ms measured when they were fetched. The model is
+taken from each response, and only entries served by --model are reused.
+
+Requires: pip install aiohttp
+
+Usage:
+    python3 run_pdf_accuracy.py
+    python3 run_pdf_accuracy.py --concurrency 8 --user-id 80
+    python3 run_pdf_accuracy.py --only 2.1 4.4 6.7
+    python3 run_pdf_accuracy.py --refresh          # Ignore cached responses (and re-cache them)
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import os
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import aiohttp
+
+from extraction_cache import CACHE_DIR, DEFAULT_MAX_BYTES, DEFAULT_MODEL, ExtractionCache, file_sha256, prompt_version
+from latency_histogram import LatencyHistogram
+
+SCRIPT_DIR = Path(__file__).parent
+SAMPLES_DIR = SCRIPT_DIR.parent / 'samples'
+RESULTS_DIR = SCRIPT_DIR.parent / 'results'
+
+API_URL = os.environ.get('API_URL', 'http://localhost:3000/api/v0')
+TEST_USER_ID = 80  # An existing user ID in your database
+
+TEST_SUITE_VERSION = '3.0.0'
+AI_MODELS = ['gemini-2.5-flash-lite', 'gemini-3-flash-preview']
+
+CSV_COLUMNS = [
+    'test_id', 'category', 'test_name', 'pdf_file', 'expected_categories', 'found_categories',
+    'found_items', 'category_accuracy', 'items_per_category', 'field_completeness',
+    'duration_extracted', 'duration_expected', 'duration_match', 'difficulty_expected',
+    'difficulty_found', 'difficulty_match', 'extraction_time_ms', 'model_used', 'status', 'error_message',
+]
+
+NETWORK_ERRORS = ('fetch failed', 'timeout', 'econnrefused', '503')
+
+
+@dataclass(frozen=True)
+class PdfTest:
+    """One run_test call from the shell suite"""
+    test_id: str
+    category: str
+    test_name: str
+    pdf: str
+    expected_categories: int
+    expected_duration: Optional[int]
+    expected_difficulty: str
+    test_type: str
+    expected_fields: str
+
+
+TESTS = [
+    PdfTest('0.1', 'BASELINE', 'Perfect Sample - Well Formatted Proposal', 'PROJECT PROPOSAL DOCUMENT.pdf',
+            5, 90, 'Complex', 'standard', 'project_name,title,description,duration,difficulty,licensing'),
+
+    PdfTest('1.1', 'MINIMAL', 'Sparse Info - Basic Extraction', '01-MINIMAL_PROJECT.pdf',
+            2, None, 'Easy', 'standard', 'project_name,title'),
+    PdfTest('1.2', 'MINIMAL', 'Implicit Timeline - ASAP interpretation', '01-MINIMAL_PROJECT.pdf',
+            2, 7, 'Easy', 'edge_case', 'project_name,difficulty'),
+    PdfTest('1.3', 'MINIMAL', 'Budget Keyword - Limited budget inference', '01-MINIMAL_PROJECT.pdf',
+            2, None, 'Easy', 'edge_case', 'project_name,difficulty'),
+
+    PdfTest('2.1', 'COMPLEX', 'Multi-Deliverable - Grouped Category Extraction', '02-COMPLEX_MULTI_DELIVERABLE.pdf',
+            8, 240, 'Complex', 'standard', 'project_name,title,description,duration,difficulty,licensing,usage_rights'),
+    PdfTest('2.2', 'COMPLEX', 'Timeline Calculation - Multi-phase Duration', '02-COMPLEX_MULTI_DELIVERABLE.pdf',
+            8, 240, 'Complex', 'edge_case', 'duration'),
+    PdfTest('2.3', 'COMPLEX', 'Items Array - Sub-component Extraction', '02-COMPLEX_MULTI_DELIVERABLE.pdf',
+            8, 240, 'Complex', 'edge_case', 'deliverables'),
+    PdfTest('2.4', 'COMPLEX', 'Technical Reqs - Feature List Extraction', '02-COMPLEX_MULTI_DELIVERABLE.pdf',
+            8, 240, 'Complex', 'standard', 'description'),
+    PdfTest('2.5', 'COMPLEX', 'Quality Standards - SLA/Compliance Detection', '02-COMPLEX_MULTI_DELIVERABLE.pdf',
+            8, 240, 'Complex', 'edge_case', 'usage_rights'),
+
+    PdfTest('3.1', 'VAGUE', 'Ambiguous Input - Graceful Handling', '03-VAGUE_REQUIREMENTS.pdf',
+            1, None, 'N/A', 'edge_case', 'project_name'),
+    PdfTest('3.2', 'VAGUE', 'Vague Timeline - Flexible deadline handling', '03-VAGUE_REQUIREMENTS.pdf',
+            1, None, 'N/A', 'edge_case', 'duration'),
+    PdfTest('3.3', 'VAGUE', 'Undefined Scope - Minimal categories', '03-VAGUE_REQUIREMENTS.pdf',
+            1, None, 'Medium', 'edge_case', 'deliverables,difficulty'),
+    PdfTest('3.4', 'VAGUE', 'Contradictory Info - Modern but not too modern', '03-VAGUE_REQUIREMENTS.pdf',
+            1, None, 'N/A', 'edge_case', 'description'),
+
+    PdfTest('4.1', 'MIXED', 'Mixed Formatting - Grouped Extraction', '04-MIXED_FORMAT.pdf',
+            6, 84, 'Hard', 'standard', 'project_name,title,description,duration,difficulty,licensing'),
+    PdfTest('4.2', 'MIXED', 'Tree Structure - Hierarchical List Parsing', '04-MIXED_FORMAT.pdf',
+            6, 84, 'Hard', 'edge_case', 'deliverables'),
+    PdfTest('4.3', 'MIXED', 'Box Characters - Section Detection', '04-MIXED_FORMAT.pdf',
+            6, 84, 'Hard', 'edge_case', 'title,description'),
+    PdfTest('4.4', 'MIXED', 'Phase Timeline - Week to Day Conversion', '04-MIXED_FORMAT.pdf',
+            6, 84, 'Hard', 'edge_case', 'duration'),
+    PdfTest('4.5', 'MIXED', 'Visual Rating - Symbol Based Difficulty', '04-MIXED_FORMAT.pdf',
+            6, 84, 'Hard', 'edge_case', 'difficulty'),
+    PdfTest('4.6', 'MIXED', 'Multi-Format Grouping - Bullets + Trees + Tables', '04-MIXED_FORMAT.pdf',
+            6, 84, 'Hard', 'stress', 'deliverables'),
+
+    PdfTest('5.1', 'TECHNICAL', 'Technical Doc - Grouped Extraction', '05-TECHNICAL_JARGON.pdf',
+            7, 120, 'Complex', 'standard', 'project_name,title,description,difficulty'),
+    PdfTest('5.2', 'TECHNICAL', 'Tech Stack - Framework/Tool Detection', '05-TECHNICAL_JARGON.pdf',
+            7, 120, 'Complex', 'edge_case', 'description'),
+    PdfTest('5.3', 'TECHNICAL', 'Microservices - Category Grouping', '05-TECHNICAL_JARGON.pdf',
+            7, 120, 'Complex', 'edge_case', 'deliverables'),
+    PdfTest('5.4', 'TECHNICAL', 'Abbreviations - Technical Acronym Handling', '05-TECHNICAL_JARGON.pdf',
+            7, 120, 'Complex', 'edge_case', 'description'),
+    PdfTest('5.5', 'TECHNICAL', 'Performance Reqs - SLA Metric Extraction', '05-TECHNICAL_JARGON.pdf',
+            7, 120, 'Complex', 'edge_case', 'usage_rights'),
+    PdfTest('5.6', 'TECHNICAL', 'Compliance - Regulatory Standards Detection', '05-TECHNICAL_JARGON.pdf',
+            7, 120, 'Complex', 'edge_case', 'licensing'),
+
+    PdfTest('6.1', 'BUDGET', 'Budget Doc - Grouped Extraction', '06-BUDGET_HEAVY.pdf',
+            10, 270, 'Complex', 'standard', 'project_name,title,description,duration,difficulty,licensing'),
+    PdfTest('6.2', 'BUDGET', 'Phase Categories - Multi-Phase Grouping', '06-BUDGET_HEAVY.pdf',
+            10, 270, 'Complex', 'edge_case', 'deliverables'),
+    PdfTest('6.3', 'BUDGET', 'Timeline - Month to Day Conversion', '06-BUDGET_HEAVY.pdf',
+            10, 270, 'Complex', 'edge_case', 'duration'),
+    PdfTest('6.4', 'BUDGET', 'Quantity Parsing - Items Array Extraction', '06-BUDGET_HEAVY.pdf',
+            10, 270, 'Complex', 'edge_case', 'deliverables'),
+    PdfTest('6.5', 'BUDGET', 'Module Grouping - Component Categories', '06-BUDGET_HEAVY.pdf',
+            10, 270, 'Complex', 'edge_case', 'deliverables'),
+    PdfTest('6.6', 'BUDGET', 'Training Materials - Educational Content Grouping', '06-BUDGET_HEAVY.pdf',
+            10, 270, 'Complex', 'edge_case', 'deliverables'),
+    PdfTest('6.7', 'BUDGET', 'Stress Test - Complete Grouped Extraction', '06-BUDGET_HEAVY.pdf',
+            10, 270, 'Complex', 'stress',
+            'project_name,title,description,duration,difficulty,licensing,usage_rights,deliverables'),
+]
+
+
+# ANSI colors
+class Colors:
+    GREEN = '\033[92m'
+    RED = '\033[91m'
+    YELLOW = '\033[93m'
+    BLUE = '\033[94m'
+    CYAN = '\033[96m'
+    PURPLE = '\033[95m'
+    BOLD = '\033[1m'
+    END = '\033[0m'
+
+
+def find_key(obj: Any, key: str) -> Any:
+    """First value stored under `key` anywhere in a JSON document (like the shell's grep -o | head -1)"""
+    if isinstance(obj, dict):
+        if key in obj and not isinstance(obj[key], (dict, list)):
+            return obj[key]
+        children = obj.values()
+    elif isinstance(obj, list):
+        children = obj
+    else:
+        return None
+    for child in children:
+        found = find_key(child, key)
+        if found is not None:
+            return found
+    return None
+
+
+def score_response(test: PdfTest, response: Dict[str, Any], extraction_ms: int) -> Dict[str, Any]:
+    """One CSV row, scored with the same rules as test-pdf-accuracy-comprehensive.sh"""
+    row = {
+        'test_id': test.test_id,
+        'category': test.category,
+        'test_name': test.test_name,
+        'pdf_file': str(SAMPLES_DIR / 'pdf' / test.pdf),
+        'expected_categories': test.expected_categories,
+        'difficulty_expected': test.expected_difficulty,
+        'extraction_time_ms': extraction_ms,
+        'model_used': find_key(response, 'model') or 'unknown',
+    }
+
+    if response.get('success') is not True:
+        row.update({
+            'found_categories': 0, 'found_items': 0, 'category_accuracy': 0, 'items_per_category': 0,
+            'field_completeness': 0, 'duration_extracted': 'N', 'duration_expected': 'N/A',
+            'duration_match': 'N/A', 'difficulty_found': 'N/A', 'difficulty_match': 'N/A',
+            'status': 'FAILED', 'error_message': find_key(response, 'message') or '',
+        })
+        return row
+
+    data = response.get('data') or {}
+    project = data.get('project') or {}
+    deliverables = data.get('deliverables') or []
+
+    project_name = project.get('project_name') or ''
+    title = project.get('title') or ''
+    description = project.get('description') or ''
+    duration = project.get('duration')
+    difficulty = project.get('difficulty') or ''
+
+    category_count = sum(1 for d in deliverables if 'deliverable_type' in d)
+    item_count = sum(len(d.get('items') or []) for d in deliverables)
+    thin_count = sum(1 for d in deliverables if len(d.get('items') or []) < 3)
+
+    fields_present = sum([bool(project_name), bool(title), len(description) > 10])
+
+    duration_extracted, duration_match = 'N', 'N/A'
+    if isinstance(duration, (int, float)):
+        fields_present += 1
+        duration_extracted = 'Y'
+        if test.expected_duration:
+            percent_diff = abs(int(duration) - test.expected_duration) * 100 // test.expected_duration
+            duration_match = 'EXACT' if percent_diff <= 20 else 'CLOSE' if percent_diff <= 50 else 'OFF'
+
+    difficulty_match = 'N/A'
+    if difficulty:
+        fields_present += 1
+        if test.expected_difficulty != 'N/A':
+            if difficulty == test.expected_difficulty:
+                difficulty_match = 'EXACT'
+            elif {difficulty, test.expected_difficulty} == {'Hard', 'Complex'}:
+                difficulty_match = 'CLOSE'
+            else:
+                difficulty_match = 'WRONG'
+
+    if test.expected_categories > 0:
+        category_accuracy = min(category_count * 100 // test.expected_categories, 100)
+    else:
+        category_accuracy = 100 if category_count == 0 else 0
+
+    row.update({
+        'found_categories': category_count,
+        'found_items': item_count,
+        'category_accuracy': category_accuracy,
+        'items_per_category': f'{item_count / category_count:.1f}' if category_count else 0,
+        'field_completeness': fields_present * 100 // 5,
+        'duration_extracted': duration_extracted,
+        'duration_expected': test.expected_duration if test.expected_duration is not None else 'N/A',
+        'duration_match': duration_match,
+        'difficulty_found': difficulty,
+        'difficulty_match': difficulty_match,
+        'status': 'PASSED',
+        'error_message': '',
+        '_thin_categories': thin_count,  # not a CSV column; summed into the metrics JSON
+    })
+    return row
+
+
+def skipped_row(test: PdfTest) -> Dict[str, Any]:
+    row = {column: 'N/A' for column in CSV_COLUMNS}
+    row.update({'test_id': test.test_id, 'category': test.category, 'test_name': test.test_name,
+                'pdf_file': str(SAMPLES_DIR / 'pdf' / test.pdf), 'difficulty_expected': test.expected_difficulty,
+                'status': 'SKIPPED', 'error_message': 'File not found'})
+    return row
+
+
+async def extract(session: aiohttp.ClientSession, pdf_path: Path, user_id: int,
+                  retries: int = 2) -> Dict[str, Any]:
+    """POST the PDF to /pdf/extract, retrying network errors like the shell loop"""
+    attempt = 0
+    while True:
+        form = aiohttp.FormData()
+        form.add_field('pdf', pdf_path.read_bytes(), filename=pdf_path.name, content_type='application/pdf')
+        form.add_field('user_id', str(user_id))
+        try:
+            async with session.post(f'{API_URL}/pdf/extract', data=form) as response:
+                text = await response.text()
+            if '"success"' in text:
+                return json.loads(text)
+            error = text
+            retryable = any(marker in text.lower() for marker in NETWORK_ERRORS)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            error = f'{type(e).__name__}: {e}'
+            retryable = True
+
+        if attempt >= retries or not retryable:
+            return {'success': False, 'message': error[:200]}
+        attempt += 1
+        await asyncio.sleep(5 * attempt * (0.5 + random.random()))
+
+
+async def timed_extract(session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, pdf_path: Path,
+                        user_id: int, retries: int) -> Tuple[Dict[str, Any], int]:
+    async with semaphore:
+        start = time.perf_counter()
+        response = await extract(session, pdf_path, user_id, retries)
+        return response, int((time.perf_counter() - start) * 1000)
+
+
+class CachedExtractor:
+    """
+    timed_extract() behind an ExtractionCache. Tests sharing a PDF wait on one
+    call instead of all missing at once; --refresh re-fetches each PDF once per run.
+    Responses are stored under the model they report, so a fallback model's
+    answers are never served back as the expected model's.
+    """
+
+    def __init__(self, cache: ExtractionCache, model: str, prompt: str, refresh: bool = False):
+        self.cache = cache
+        self.model = model
+        self.prompt = prompt
+        self.refresh = refresh
+        self.locks: Dict[str, asyncio.Lock] = {}
+        self.fetched = set()
+        self.hits = 0
+        self.calls = 0
+        self.other_models = 0
+
+    async def extract(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, pdf_path: Path,
+                      user_id: int, retries: int) -> Tuple[Dict[str, Any], int, bool]:
+        """(response, extraction_time_ms, served from cache?)"""
+        pdf_sha256 = file_sha256(pdf_path)
+        async with self.locks.setdefault(pdf_sha256, asyncio.Lock()):
+            if not self.refresh or pdf_sha256 in self.fetched:
+                entry = self.cache.get(pdf_sha256, self.model, self.prompt)
+                if entry is not None:
+                    self.hits += 1
+                    return entry['response'], entry['extraction_time_ms'], True
+
+            self.calls += 1
+            response, extraction_ms = await timed_extract(session, semaphore, pdf_path, user_id, retries)
+            served_model = find_key(response, 'model') or self.model
+            if served_model != self.model:
+                self.other_models += 1
+            self.cache.put(pdf_sha256, served_model, self.prompt, response, extraction_ms, pdf_path.name)
+            self.fetched.add(pdf_sha256)
+            return response, extraction_ms, False
+
+
+async def run_test(session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, test: PdfTest,
+                   user_id: int, retries: int, extractor: Optional[CachedExtractor] = None) -> Dict[str, Any]:
+    pdf_path = SAMPLES_DIR / 'pdf' / test.pdf
+    if not pdf_path.exists():
+        return skipped_row(test)
+
+    if extractor is None:
+        response, extraction_ms = await timed_extract(session, semaphore, pdf_path, user_id, retries)
+        cached = False
+    else:
+        response, extraction_ms, cached = await extractor.extract(session, semaphore, pdf_path, user_id, retries)
+
+    row = score_response(test, response, extraction_ms)
+    row['_cached'] = cached
+    return row
+
+
+def print_row(row: Dict[str, Any]):
+    label = f"Test {row['test_id']}: [{row['category']}] {row['test_name']}"
+    if row.get('_cached'):
+        label += ' (cached)'
+    if row['status'] == 'PASSED':
+        print(f"{Colors.GREEN}✓ {label}{Colors.END}  categories {row['found_categories']}/"
+              f"{row['expected_categories']}, completeness {row['field_completeness']}%, "
+              f"{row['extraction_time_ms']}ms ({Colors.PURPLE}{row['model_used']}{Colors.END})")
+    elif row['status'] == 'SKIPPED':
+        print(f"{Colors.YELLOW}⚠ {label} - SKIPPED (File not found){Colors.END}")
+    else:
+        print(f"{Colors.RED}✗ {label}: {row['error_message']}{Colors.END}")
+
+
+def summarize(rows: List[Dict[str, Any]], tests: List[PdfTest], elapsed: float,
+              files: Dict[str, str]) -> Dict[str, Any]:
+    """metrics_<ts>.json in the schema the shell script writes"""
+    edge_ids = {t.test_id for t in tests if t.test_type == 'edge_case'}
+    ran = [r for r in rows if r['status'] != 'SKIPPED']
+    passed = [r for r in rows if r['status'] == 'PASSED']
+    times = [r['extraction_time_ms'] for r in ran]
+    expected = sum(r['expected_categories'] for r in passed)
+    found = sum(r['found_categories'] for r in passed)
+    items = sum(r['found_items'] for r in passed)
+    latency = LatencyHistogram.from_values(times)
+
+    return {
+        'test_suite_version': TEST_SUITE_VERSION,
+        'generated_at': datetime.now().astimezone().isoformat(timespec='seconds'),
+        'overall_metrics': {
+            'total_tests': len(rows),
+            'passed': len(passed),
+            'failed': len(ran) - len(passed),
+            'skipped': len(rows) - len(ran),
+            'pass_rate': round(len(passed) / len(rows) * 100, 1) if rows else 0,
+            'edge_cases_passed': sum(1 for r in passed if r['test_id'] in edge_ids),
+            'edge_cases_total': len(edge_ids),
+        },
+        'deliverable_metrics': {
+            'expected_categories': expected,
+            'found_categories': found,
+            'category_accuracy': found * 100 // expected if expected else 0,
+            'total_items_found': items,
+            'avg_items_per_category': round(items / found, 1) if found else 0,
+            'thin_deliverable_warnings': sum(r.get('_thin_categories', 0) for r in passed),
+        },
+        'performance_metrics': {
+            'total_duration_seconds': int(elapsed),
+            'avg_extraction_ms': sum(times) // len(times) if times else 0,
+            'min_extraction_ms': min(times) if times else 0,
+            'max_extraction_ms': max(times) if times else 0,
+            **{f'{name}_extraction_ms': value for name, value in latency.percentiles().items()},
+            'latency_histogram': latency.to_dict(),
+        },
+        'ai_models': {'available': AI_MODELS},
+        'files': files,
+    }
+
+
+async def run_suite(tests: List[PdfTest], concurrency: int, user_id: int, retries: int,
+                    timeout: float, csv_path: Path,
+                    extractor: Optional[CachedExtractor] = None) -> List[Dict[str, Any]]:
+    semaphore = asyncio.Semaphore(concurrency)
+    connector = aiohttp.TCPConnector(limit=concurrency, keepalive_timeout=60)
+    rows = []
+    with open(csv_path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS, extrasaction='ignore')
+        writer.writeheader()
+        async with aiohttp.ClientSession(connector=connector,
+                                         timeout=aiohttp.ClientTimeout(total=timeout)) as session:
+            pending = [run_test(session, semaphore, test, user_id, retries, extractor)
+                       for test in tests]
+            for finished in asyncio.as_completed(pending):
+                row = await finished
+                writer.writerow(row)
+                f.flush()
+                print_row(row)
+                rows.append(row)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the PDF extraction accuracy suite concurrently')
+    parser.add_argument('--concurrency', type=int, default=4, help='Uploads in flight at once (default: 4)')
+    parser.add_argument('--user-id', type=int, default=TEST_USER_ID, help=f'Existing user ID (default: {TEST_USER_ID})')
+    parser.add_argument('--retries', type=int, default=2, help='Retries on network errors (default: 2)')
+    parser.add_argument('--timeout', type=float, default=180, help='Per-request timeout in seconds (default: 180)')
+    parser.add_argument('--only', nargs='*', help='Run only these test IDs, e.g. 2.1 4.4')
+    parser.add_argument('-o', '--output-dir', default=str(RESULTS_DIR), help='Results directory (default: ../results)')
+    parser.add_argument('--no-cache', action='store_true', help='Always call the API; do not read or write the cache')
+    parser.add_argument('--refresh', action='store_true', help='Re-extract every PDF once and overwrite its cache entry')
+    parser.add_argument('--cache-dir', default=str(CACHE_DIR), help='Response cache directory')
+    parser.add_argument('--cache-size-mb', type=float, default=DEFAULT_MAX_BYTES / 1024 / 1024,
+                        help='Cache size budget before LRU eviction (default: 200)')
+    parser.add_argument('--model', default=DEFAULT_MODEL, help=f'Model the backend should serve; only cached responses from it are reused (default: {DEFAULT_MODEL})')
+    parser.add_argument('--prompt-version', help='Override the prompt version (default: hash of the extraction prompt)')
+    args = parser.parse_args()
+
+    tests = [t for t in TESTS if not args.only or t.test_id in args.only]
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    csv_path = output_dir / f'test_data_{timestamp}.csv'
+    json_path = output_dir / f'metrics_{timestamp}.json'
+
+    print(f'{Colors.CYAN}[SETUP]{Colors.END} API: {API_URL}  Tests: {len(tests)}  Concurrency: {args.concurrency}')
+    extractor = None
+    if not args.no_cache:
+        cache = ExtractionCache(Path(args.cache_dir), int(args.cache_size_mb * 1024 * 1024))
+        extractor = CachedExtractor(cache, args.model, args.prompt_version or prompt_version(), args.refresh)
+        print(f'{Colors.CYAN}[CACHE]{Colors.END} {cache.directory} ({len(cache.entries)} entries)  '
+              f'Model: {extractor.model}  Prompt: {extractor.prompt}{"  (refresh)" if args.refresh else ""}')
+    print()
+
+    start = time.perf_counter()
+    rows = asyncio.run(run_suite(tests, args.concurrency, args.user_id, args.retries, args.timeout, csv_path,
+                                 extractor))
+    elapsed = time.perf_counter() - start
+
+    order = {t.test_id: i for i, t in enumerate(tests)}
+    rows.sort(key=lambda r: order[r['test_id']])
+    metrics = summarize(rows, tests, elapsed, {'csv': str(csv_path), 'json': str(json_path)})
+    if extractor is not None:
+        metrics['cache'] = {'hits': extractor.hits, 'api_calls': extractor.calls,
+                            'model': extractor.model, 'served_by_other_models': extractor.other_models,
+                            'prompt_version': extractor.prompt}
+    with open(json_path, 'w') as f:
+        json.dump(metrics, f, indent=2)
+
+    overall = metrics['overall_metrics']
+    print()
+    print(f"{Colors.BOLD}Passed {overall['passed']}/{overall['total_tests']} "
+          f"({overall['pass_rate']}%), {overall['skipped']} skipped, in {elapsed:.1f}s{Colors.END}")
+    performance = metrics['performance_metrics']
+    if performance['latency_histogram']['count']:
+        print(f"  Extraction p50 {performance['p50_extraction_ms']}ms  p90 {performance['p90_extraction_ms']}ms  "
+              f"p99 {performance['p99_extraction_ms']}ms  p99.9 {performance['p99_9_extraction_ms']}ms")
+    print(f'  📊 CSV Data Export:  {csv_path}')
+    print(f'  📋 JSON Metrics:     {json_path}')
+    print(f'  🐍 Visualization:    python3 {RESULTS_DIR / "visualize_results.py"} --csv {csv_path}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1158,6 +1158,9 @@ cat > "$JSON_REPORT" << EOF
 }
 EOF
 
+# Add tail-latency percentiles and the mergeable histogram (needs python3)
+python3 "$SCRIPT_DIR/latency_histogram.py" "$CSV_REPORT" --metrics "$JSON_REPORT" > /dev/null 2>&1 || true
+
 # Final output
 echo -e "${CYAN}┌─────────────────────────────────────────────────────────────────────────────┐${NC}"
 echo -e "${CYAN}│ OUTPUT FILES                                                                │${NC}"
@@ -1,5 +1,13 @@
+import argparse
+import bisect
 import json
+import os
 import random
+import re
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 
 random.seed(42)  # reproducible results
 
@@ -16,47 +24,382 @@ SKILLS_POOL = [
     "Marketing Design"
 ]
 
+# Minimum years of experience per level, mirroring SeniorityMultiplier.fromExperience
+# in backend/src/domain/entities/SeniorityLevel.ts. Every seniority label produced
+# here is bucketed from this table; check_backend_seniority() guards against drift.
+SENIORITY_THRESHOLDS = {
+    "junior": 0,
+    "mid": 2,
+    "senior": 5,
+    "expert": 10
+}
+
+SENIORITY_LEVELS = list(SENIORITY_THRESHOLDS)
+SENIORITY_BOUNDS = list(SENIORITY_THRESHOLDS.values())[1:]
+
 SENIORITY_BY_EXPERIENCE = {
-    "junior": range(0, 2),
-    "mid": range(2, 4),
-    "senior": range(4, 7),
-    "expert": range(7, 15)
+    level: range(start, end)
+    for (level, start), end in zip(SENIORITY_THRESHOLDS.items(), SENIORITY_BOUNDS + [15])
 }
 
+# Ranges this script used before it was aligned with the backend; kept only so
+# older datasets can be checked with --check-seniority
+LEGACY_SENIORITY_BOUNDS = [2, 4, 7]
+
+SENIORITY_TS_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..", "..", "src", "domain", "entities", "SeniorityLevel.ts"
+)
+
+RENT_CHOICES = [0, 50, 80, 100, 150, 200, 250, 300]
+MAX_SKILLS = 3
+
+SKILL_BITS = {skill: 1 << i for i, skill in enumerate(SKILLS_POOL)}
+
+def skills_to_mask(skills):
+    """Bitmask of SKILLS_POOL positions (bit i set = SKILLS_POOL[i] present)"""
+    mask = 0
+    for skill in skills:
+        mask |= SKILL_BITS[skill]
+    return mask
+
+def mask_to_skills(mask):
+    return [skill for skill, bit in SKILL_BITS.items() if mask & bit]
+
+def skill_idx_to_mask(skill_idx):
+    """Vectorized skills_to_mask over an (n, MAX_SKILLS) -1-padded skill_idx matrix"""
+    bits = np.left_shift(1, skill_idx.astype(np.int16), dtype=np.int16)
+    return np.bitwise_or.reduce(np.where(skill_idx >= 0, bits, 0), axis=1).astype(np.uint16)
+
 def pick_seniority(years):
-    for level, r in SENIORITY_BY_EXPERIENCE.items():
-        if years in r:
-            return level
-    return "expert"
+    return SENIORITY_LEVELS[bisect.bisect_right(SENIORITY_BOUNDS, years)]
+
+def pick_seniority_codes(years, bounds=SENIORITY_BOUNDS):
+    """Vectorized pick_seniority: bucket a whole years column into SENIORITY_LEVELS codes"""
+    return np.searchsorted(bounds, years, side="right").astype(np.int8)
+
+def seniority_disagreements(years, codes):
+    """
+    Compare existing seniority codes against the backend bucketing of `years`.
+    Returns the disagreeing row ids and a {(given, backend): count} summary.
+    """
+    expected = pick_seniority_codes(years)
+    rows = np.flatnonzero(np.asarray(codes) != expected)
+    pairs, counts = np.unique(
+        np.stack([np.asarray(codes)[rows], expected[rows]]), axis=1, return_counts=True
+    )
+    summary = {
+        (SENIORITY_LEVELS[given], SENIORITY_LEVELS[backend]): int(count)
+        for (given, backend), count in zip(pairs.T.tolist(), counts.tolist())
+    }
+    return rows, summary
 
-def generate_profile():
-    years_exp = random.randint(0, 10)
+def check_backend_seniority(ts_path=SENIORITY_TS_PATH):
+    """Parse fromExperience in SeniorityLevel.ts; returns its bounds if they differ from ours, else None"""
+    with open(ts_path) as f:
+        source = f.read()
+    body = source[source.index("fromExperience"):]
+    bounds = [int(v) for v in re.findall(r"years\s*<\s*(\d+)\)\s*return", body)[:len(SENIORITY_BOUNDS)]]
+    return None if bounds == SENIORITY_BOUNDS else bounds
+
+def generate_profile(rng=random):
+    years_exp = rng.randint(0, 10)
 
     profile = {
-        "monthly_rent": random.choice([0, 50, 80, 100, 150, 200, 250, 300]),
-        "equipment_cost": random.randint(100, 350),
-        "utilities_cost": random.randint(40, 120),
-        "materials_cost": random.randint(20, 100),
-        "desired_income": random.randint(600, 2200),
-        "billable_hours": random.randint(70, 140),
-        "profit_margin": round(random.uniform(0.08, 0.25), 2),
+        "monthly_rent": rng.choice(RENT_CHOICES),
+        "equipment_cost": rng.randint(100, 350),
+        "utilities_cost": rng.randint(40, 120),
+        "materials_cost": rng.randint(20, 100),
+        "desired_income": rng.randint(600, 2200),
+        "billable_hours": rng.randint(70, 140),
+        "profit_margin": round(rng.uniform(0.08, 0.25), 2),
         "years_experience": years_exp,
-        "skills": random.sample(
+        "skills": rng.sample(
             SKILLS_POOL,
-            k=random.randint(1, 3)
+            k=rng.randint(1, MAX_SKILLS)
         ),
         "seniority": pick_seniority(years_exp)
     }
+    profile["skills_mask"] = skills_to_mask(profile["skills"])
 
     return profile
 
 def generate_dataset(n=100):
     return [generate_profile() for _ in range(n)]
 
-if __name__ == "__main__":
-    data = generate_dataset(100)
+def generate_columns(n=100, seed=42, rng=None):
+    """
+    Vectorized generate_dataset: draws every field of n profiles as a column
+    from a seeded numpy Generator, using the same ranges as generate_profile.
+    Pass `rng` to keep drawing from an existing Generator instead of `seed`.
+
+    Skills are stored as `skill_idx`, an (n, MAX_SKILLS) array of SKILLS_POOL
+    indices padded with -1, and as a uint16 `skills_mask`; seniority as codes
+    into SENIORITY_LEVELS.
+    """
+    if rng is None:
+        rng = np.random.default_rng(seed)
+
+    years_exp = rng.integers(0, 10, size=n, dtype=np.int16, endpoint=True)
+
+    # random.sample without replacement: take the first k of a per-row shuffle
+    skill_count = rng.integers(1, MAX_SKILLS, size=n, dtype=np.int8, endpoint=True)
+    shuffled = np.argsort(rng.random((n, len(SKILLS_POOL))), axis=1)
+    skill_idx = shuffled[:, :MAX_SKILLS].astype(np.int8)
+    skill_idx[np.arange(MAX_SKILLS) >= skill_count[:, None]] = -1
+
+    return {
+        "monthly_rent": np.asarray(RENT_CHOICES, dtype=np.int32)[
+            rng.integers(0, len(RENT_CHOICES), size=n)
+        ],
+        "equipment_cost": rng.integers(100, 350, size=n, dtype=np.int32, endpoint=True),
+        "utilities_cost": rng.integers(40, 120, size=n, dtype=np.int32, endpoint=True),
+        "materials_cost": rng.integers(20, 100, size=n, dtype=np.int32, endpoint=True),
+        "desired_income": rng.integers(600, 2200, size=n, dtype=np.int32, endpoint=True),
+        "billable_hours": rng.integers(70, 140, size=n, dtype=np.int32, endpoint=True),
+        "profit_margin": np.round(rng.uniform(0.08, 0.25, size=n), 2),
+        "years_experience": years_exp,
+        "skill_idx": skill_idx,
+        "skills_mask": skill_idx_to_mask(skill_idx),
+        "seniority": pick_seniority_codes(years_exp),
+    }
+
+def columns_to_profiles(columns, start=0, stop=None):
+    """Export rows [start, stop) of generate_columns output as profile dicts"""
+    rows = slice(start, stop)
+    scalars = {
+        name: columns[name][rows].tolist()
+        for name in (
+            "monthly_rent", "equipment_cost", "utilities_cost", "materials_cost",
+            "desired_income", "billable_hours", "profit_margin", "years_experience",
+        )
+    }
+    skill_idx = columns["skill_idx"][rows].tolist()
+    skills_mask = columns["skills_mask"][rows].tolist()
+    seniority = columns["seniority"][rows].tolist()
+
+    profiles = []
+    for i in range(len(seniority)):
+        profile = {name: values[i] for name, values in scalars.items()}
+        profile["skills"] = [SKILLS_POOL[s] for s in skill_idx[i] if s >= 0]
+        profile["seniority"] = SENIORITY_LEVELS[seniority[i]]
+        profile["skills_mask"] = skills_mask[i]
+        profiles.append(profile)
+
+    return profiles
+
+def profiles_to_columns(profiles):
+    """Inverse of columns_to_profiles: pack profile dicts into generate_columns layout"""
+    columns = {
+        name: np.array([p[name] for p in profiles], dtype=dtype)
+        for name, dtype in (
+            ("monthly_rent", np.int32), ("equipment_cost", np.int32),
+            ("utilities_cost", np.int32), ("materials_cost", np.int32),
+            ("desired_income", np.int32), ("billable_hours", np.int32),
+            ("profit_margin", np.float64), ("years_experience", np.int16),
+        )
+    }
+    skill_pos = {skill: i for i, skill in enumerate(SKILLS_POOL)}
+    skill_idx = np.full((len(profiles), MAX_SKILLS), -1, dtype=np.int8)
+    for row, p in enumerate(profiles):
+        for col, skill in enumerate(p["skills"][:MAX_SKILLS]):
+            skill_idx[row, col] = skill_pos[skill]
+    columns["skill_idx"] = skill_idx
+    columns["skills_mask"] = skill_idx_to_mask(skill_idx)
+    columns["seniority"] = np.array(
+        [SENIORITY_LEVELS.index(p["seniority"]) for p in profiles], dtype=np.int8
+    )
+    return columns
 
-    with open("freelancer_pricing_test_data.json", "w") as f:
+def load_profiles(path):
+    """Load a generated .json array or .ndjson file into generate_columns layout"""
+    with open(path) as f:
+        if str(path).endswith((".ndjson", ".jsonl")):
+            profiles = [json.loads(line) for line in f if line.strip()]
+        else:
+            profiles = json.load(f)
+    return profiles_to_columns(profiles)
+
+def iter_column_chunks(n, chunk_size=10_000, seed=42):
+    """Yield n vectorized profiles as generate_columns tables of at most chunk_size rows"""
+    rng = np.random.default_rng(seed)
+    for start in range(0, n, chunk_size):
+        yield generate_columns(min(chunk_size, n - start), rng=rng)
+
+def iter_profile_chunks(n, chunk_size=10_000, vectorized=False, seed=42):
+    """Yield n profiles as lists of at most chunk_size, never holding more than one chunk"""
+    if vectorized:
+        for columns in iter_column_chunks(n, chunk_size, seed):
+            yield columns_to_profiles(columns)
+        return
+    for start in range(0, n, chunk_size):
+        yield generate_dataset(min(chunk_size, n - start))
+
+def write_ndjson(chunks, path):
+    """Write profile chunks as compact newline-delimited JSON; returns rows written"""
+    count = 0
+    with open(path, "w") as f:
+        for chunk in chunks:
+            f.write("".join(json.dumps(p, separators=(",", ":")) + "\n" for p in chunk))
+            count += len(chunk)
+    return count
+
+def write_columnar(column_chunks, directory):
+    """
+    Write generate_columns tables as a fixed-width columnar store: one raw
+    little-endian `<field>.bin` per column plus `schema.json` describing
+    dtypes and shapes. Chunks are appended as they arrive; returns rows written.
+    """
+    os.makedirs(directory, exist_ok=True)
+    files = {}
+    schema = {}
+    count = 0
+    try:
+        for columns in column_chunks:
+            for name, values in columns.items():
+                values = np.ascontiguousarray(values, dtype=values.dtype.newbyteorder("<"))
+                if name not in files:
+                    files[name] = open(os.path.join(directory, f"{name}.bin"), "wb")
+                    schema[name] = {"dtype": values.dtype.str, "shape": list(values.shape[1:])}
+                values.tofile(files[name])
+            count += len(columns["seniority"])
+    finally:
+        for f in files.values():
+            f.close()
+
+    with open(os.path.join(directory, "schema.json"), "w") as f:
+        json.dump({"rows": count, "columns": schema}, f, indent=2)
+    return count
+
+def open_columnar(directory, fields=None):
+    """Open a write_columnar store as read-only numpy.memmap columns (zero-copy slicing)"""
+    with open(os.path.join(directory, "schema.json")) as f:
+        schema = json.load(f)
+    rows = schema["rows"]
+    return {
+        name: np.memmap(os.path.join(directory, f"{name}.bin"), dtype=np.dtype(spec["dtype"]),
+                        mode="r", shape=(rows, *spec["shape"]))
+        for name, spec in schema["columns"].items()
+        if fields is None or name in fields
+    }
+
+def shard_seed(seed, shard_id):
+    """Independent, deterministic sub-seed for one shard of a sharded run"""
+    return np.random.SeedSequence(seed, spawn_key=(shard_id,))
+
+def generate_shard(n, shard_id, shard_size=100_000, seed=42):
+    """
+    Columns for shard `shard_id` of an n-profile sharded dataset. Shard
+    boundaries depend only on shard_size, so any shard can be regenerated
+    alone and the merged output does not depend on the worker count.
+    """
+    size = max(0, min(shard_size, n - shard_id * shard_size))
+    rng = np.random.default_rng(shard_seed(seed, shard_id))
+    return generate_columns(size, rng=rng)
+
+def _write_shard(job):
+    n, shard_id, shard_size, seed, chunk_size, path = job
+    columns = generate_shard(n, shard_id, shard_size, seed)
+    size = len(columns["seniority"])
+    chunks = (
+        columns_to_profiles(columns, start, start + chunk_size)
+        for start in range(0, size, chunk_size)
+    )
+    return write_ndjson(chunks, path)
+
+def generate_sharded(n, output, shard_size=100_000, workers=None, seed=42, chunk_size=10_000):
+    """Generate n profiles as NDJSON across a process pool, merging shards in order"""
+    n_shards = -(-n // shard_size)
+    shard_paths = [f"{output}.shard{i:05d}" for i in range(n_shards)]
+    jobs = [(n, i, shard_size, seed, chunk_size, path) for i, path in enumerate(shard_paths)]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        count = sum(pool.map(_write_shard, jobs))
+
+    with open(output, "wb") as out:
+        for path in shard_paths:
+            with open(path, "rb") as shard:
+                shutil.copyfileobj(shard, out)
+            os.remove(path)
+
+    return count
+
+def report_seniority(dataset, n, seed):
+    drift = check_backend_seniority()
+    if drift is not None:
+        print(f"SeniorityLevel.ts thresholds {drift} differ from SENIORITY_THRESHOLDS bounds {SENIORITY_BOUNDS}")
+
+    if dataset:
+        columns = load_profiles(dataset)
+        codes = columns["seniority"]
+        source = dataset
+    else:
+        columns = generate_columns(n, seed=seed)
+        codes = pick_seniority_codes(columns["years_experience"], LEGACY_SENIORITY_BOUNDS)
+        source = f"legacy ranges over {n} generated profiles"
+
+    rows, summary = seniority_disagreements(columns["years_experience"], codes)
+    print(f"{len(rows)}/{len(codes)} seniority labels disagree with the backend ({source})")
+    for (given, backend), count in sorted(summary.items(), key=lambda kv: -kv[1]):
+        print(f"  {given:>7} → {backend:<7} {count}")
+    if len(rows):
+        print(f"  First rows: {rows[:10].tolist()}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate freelancer pricing test profiles")
+    parser.add_argument("-n", "--count", type=int, default=100, help="Number of profiles (default: 100)")
+    parser.add_argument("-o", "--output", default="freelancer_pricing_test_data.json", help="Output file")
+    parser.add_argument("--vectorized", action="store_true", help="Draw profiles as numpy columns")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for --vectorized mode (default: 42)")
+    parser.add_argument("--format", choices=["json", "ndjson", "columnar"], default=None,
+                        help="json array (small runs), streamed ndjson, or a vectorized columnar "
+                             "directory for numpy.memmap (default: from output extension)")
+    parser.add_argument("--chunk-size", type=int, default=10_000, help="Profiles per chunk when streaming")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Generate vectorized ndjson shards across this many processes")
+    parser.add_argument("--shard-size", type=int, default=100_000, help="Profiles per shard (default: 100000)")
+    parser.add_argument("--check-seniority", nargs="?", const="", metavar="DATASET",
+                        help="Report rows whose seniority disagrees with the backend thresholds "
+                             "(default: compare the legacy ranges over --count generated profiles)")
+    args = parser.parse_args()
+
+    if args.check_seniority is not None:
+        report_seniority(args.check_seniority or None, args.count, args.seed)
+        return
+
+    fmt = args.format
+    if fmt is None:
+        fmt = "ndjson" if args.output.endswith((".ndjson", ".jsonl")) else "json"
+
+    if fmt == "columnar":
+        count = write_columnar(iter_column_chunks(args.count, args.chunk_size, args.seed), args.output)
+        print(f"Wrote {count} freelancer pricing profiles as columns → {args.output}/")
+        return
+
+    if args.workers is not None:
+        if fmt != "ndjson":
+            parser.error("--workers requires ndjson output")
+        count = generate_sharded(args.count, args.output, args.shard_size, args.workers,
+                                 args.seed, args.chunk_size)
+        print(f"Generated {count} freelancer pricing profiles in {-(-args.count // args.shard_size)} "
+              f"shards → {args.output}")
+        return
+
+    if fmt == "ndjson":
+        chunks = iter_profile_chunks(args.count, args.chunk_size, args.vectorized, args.seed)
+        count = write_ndjson(chunks, args.output)
+        print(f"Streamed {count} freelancer pricing profiles → {args.output}")
+        return
+
+    if args.vectorized:
+        data = columns_to_profiles(generate_columns(args.count, seed=args.seed))
+    else:
+        data = generate_dataset(args.count)
+
+    with open(args.output, "w") as f:
         json.dump(data, f, indent=2)
 
-    print("Generated 100 freelancer pricing profiles → freelancer_pricing_test_data.json")
+    print(f"Generated {args.count} freelancer pricing profiles → {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Market Benchmark Index from the Seed SQL
+
+Parses seeds/cambodia_market_benchmarks.sql once into a dense in-memory table
+indexed by (category, seniority_level, region), cached to disk as .npz and
+rebuilt only when the seed file changes. No Postgres needed.
+
+Rates are classified against the median/p75 in one vectorized pass, using the
+same buckets as GetMarketBenchmark and the quick-estimate `market.position`:
+    below_market  rate <  0.9 × median
+    at_market     rate <  1.1 × median
+    above_market  rate <  p75
+    premium       otherwise
+
+Usage:
+    python3 market_benchmarks.py                 # Print the parsed table
+    python3 market_benchmarks.py --classify      # Price + classify 1,000,000 generated profiles
+    python3 market_benchmarks.py --classify -n 5000000 --region cambodia
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+
+import generate_test_data
+import pricing_oracle
+from generate_test_data import SENIORITY_LEVELS, SKILLS_POOL
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+SEED_SQL = os.path.join(SCRIPT_DIR, "..", "..", "seeds", "cambodia_market_benchmarks.sql")
+CACHE_PATH = os.path.join(SCRIPT_DIR, ".cache", "market_benchmarks.npz")
+CACHE_VERSION = 1  # bump when the cached array layout changes
+
+POSITIONS = ["below_market", "at_market", "above_market", "premium"]
+
+_ROW = re.compile(
+    r"SELECT\s+category_id\s*,\s*'(?P<seniority>\w+)'\s*,\s*(?P<median>[\d.]+)\s*,\s*(?P<p75>[\d.]+)\s*,"
+    r"\s*(?P<sample>\d+)\s*,\s*'(?P<region>\w+)'\s*,\s*NOW\(\)\s*"
+    r"FROM\s+category\s+WHERE\s+(?P<where>.+?)\s*(?:ON\s+CONFLICT|;|$)",
+    re.IGNORECASE | re.DOTALL,
+)
+_CONDITION = re.compile(r"category_name\s+(=|ILIKE)\s+'([^']*)'", re.IGNORECASE)
+_HEADING = re.compile(r"^--\s*(.+?)\s+benchmarks\b", re.MULTILINE)
+
+
+def _like_to_regex(pattern: str) -> str:
+    return "^" + ".*".join(re.escape(part) for part in pattern.split("%")) + "$"
+
+
+def category_matches(where: str, category_name: str) -> bool:
+    """Evaluate a seed WHERE clause (= / ILIKE joined by OR) against a category name"""
+    for op, value in _CONDITION.findall(where):
+        if op == "=" and category_name == value:
+            return True
+        if op.upper() == "ILIKE" and re.match(_like_to_regex(value), category_name, re.IGNORECASE):
+            return True
+    return False
+
+
+def parse_seed_sql(path: str = SEED_SQL) -> List[Dict]:
+    """
+    One dict per INSERT ... SELECT in the seed file. `category` is the
+    "-- <name> benchmarks" heading above the statement (or its WHERE clause
+    when there is none); `where` keeps the clause for category_matches().
+    """
+    with open(path) as f:
+        chunks = f.read().split("INSERT INTO market_benchmarks")
+
+    rows = []
+    heading = None
+    for i, chunk in enumerate(chunks):
+        match = _ROW.search(re.sub(r"--[^\n]*", "", chunk)) if i else None
+        if match:
+            where = " ".join(match["where"].split())
+            rows.append({
+                "category": heading or where,
+                "where": where,
+                "seniority_level": match["seniority"].lower(),
+                "region": match["region"].lower(),
+                "median_hourly_rate": float(match["median"]),
+                "percentile_75_rate": float(match["p75"]),
+                "sample_size": int(match["sample"]),
+            })
+        headings = _HEADING.findall(chunk)
+        if headings:
+            heading = headings[-1]
+    return rows
+
+
+@dataclass
+class BenchmarkIndex:
+    """Dense (category, seniority, region) table; NaN where the seed has no row"""
+    categories: np.ndarray
+    wheres: np.ndarray
+    regions: np.ndarray
+    median: np.ndarray
+    p75: np.ndarray
+    sample_size: np.ndarray
+
+    @classmethod
+    def from_rows(cls, rows: List[Dict]) -> "BenchmarkIndex":
+        categories = list(dict.fromkeys(r["category"] for r in rows))
+        wheres = [next(r["where"] for r in rows if r["category"] == c) for c in categories]
+        regions = list(dict.fromkeys(r["region"] for r in rows))
+        shape = (len(categories), len(SENIORITY_LEVELS), len(regions))
+        index = cls(np.array(categories), np.array(wheres), np.array(regions),
+                    np.full(shape, np.nan), np.full(shape, np.nan), np.zeros(shape, dtype=np.int32))
+        for r in rows:
+            key = (categories.index(r["category"]), SENIORITY_LEVELS.index(r["seniority_level"]),
+                   regions.index(r["region"]))
+            index.median[key] = r["median_hourly_rate"]
+            index.p75[key] = r["percentile_75_rate"]
+            index.sample_size[key] = r["sample_size"]
+        return index
+
+    def get(self, category: str, seniority_level: str, region: str = "cambodia") -> Optional[Dict]:
+        key = (list(self.categories).index(category), SENIORITY_LEVELS.index(seniority_level),
+               list(self.regions).index(region))
+        if np.isnan(self.median[key]):
+            return None
+        return {"median_hourly_rate": float(self.median[key]),
+                "percentile_75_rate": float(self.p75[key]),
+                "sample_size": int(self.sample_size[key])}
+
+    def region_code(self, region: str) -> int:
+        return list(self.regions).index(region)
+
+    def skill_categories(self) -> np.ndarray:
+        """Category code per SKILLS_POOL entry (-1 when no seed row matches), plus a trailing -1 for padding"""
+        codes = [next((i for i, where in enumerate(self.wheres) if category_matches(where, skill)), -1)
+                 for skill in SKILLS_POOL]
+        return np.array(codes + [-1], dtype=np.int16)
+
+    def profile_categories(self, skill_idx: np.ndarray) -> np.ndarray:
+        """First benchmarked skill's category per profile row (-1 when none is benchmarked)"""
+        per_skill = self.skill_categories()[skill_idx]
+        has = per_skill >= 0
+        first = per_skill[np.arange(len(per_skill)), np.argmax(has, axis=1)]
+        return np.where(has.any(axis=1), first, -1)
+
+    def classify(self, rates: np.ndarray, categories: np.ndarray, seniority: np.ndarray,
+                 regions) -> np.ndarray:
+        """Index into POSITIONS per rate; -1 where no benchmark or rate exists"""
+        valid = (categories >= 0) & np.isfinite(rates)
+        key = (np.where(valid, categories, 0), seniority, regions)
+        median = np.where(valid, self.median[key], np.nan)
+        p75 = np.where(valid, self.p75[key], np.nan)
+
+        positions = np.select(
+            [rates < median * 0.9, rates < median * 1.1, rates < p75, rates >= p75],
+            [0, 1, 2, 3], default=-1,
+        ).astype(np.int8)
+        return np.where(np.isnan(median), -1, positions).astype(np.int8)
+
+    def save(self, path: str, digest: str):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        np.savez(path, digest=digest, categories=self.categories, wheres=self.wheres, regions=self.regions,
+                 median=self.median, p75=self.p75, sample_size=self.sample_size)
+
+
+def load_index(seed_path: str = SEED_SQL, cache_path: str = CACHE_PATH, refresh: bool = False) -> BenchmarkIndex:
+    """Parsed seed table, served from the .npz cache unless the seed file changed"""
+    with open(seed_path, "rb") as f:
+        digest = f"v{CACHE_VERSION}:{hashlib.sha256(f.read()).hexdigest()}"
+
+    if not refresh and os.path.exists(cache_path):
+        with np.load(cache_path) as data:
+            if str(data["digest"]) == digest:
+                return BenchmarkIndex(data["categories"], data["wheres"], data["regions"], data["median"],
+                                      data["p75"], data["sample_size"])
+
+    index = BenchmarkIndex.from_rows(parse_seed_sql(seed_path))
+    index.save(cache_path, digest)
+    return index
+
+
+def print_table(index: BenchmarkIndex):
+    print(f"  {'Category':<24} {'Level':<8} {'Region':<10} {'Median':>8} {'P75':>8} {'N':>4}")
+    print(f"  {'-'*24} {'-'*8} {'-'*10} {'-'*8} {'-'*8} {'-'*4}")
+    for c, category in enumerate(index.categories):
+        for s, level in enumerate(SENIORITY_LEVELS):
+            for r, region in enumerate(index.regions):
+                if not np.isnan(index.median[c, s, r]):
+                    print(f"  {category:<24} {level:<8} {region:<10} "
+                          f"${index.median[c, s, r]:>7.2f} ${index.p75[c, s, r]:>7.2f} {index.sample_size[c, s, r]:>4}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Market benchmark index built from the seed SQL")
+    parser.add_argument("--seed-sql", default=SEED_SQL, help="Seed file to parse")
+    parser.add_argument("--refresh", action="store_true", help="Ignore the on-disk cache")
+    parser.add_argument("--classify", action="store_true", help="Classify generated profile rates")
+    parser.add_argument("-n", "--count", type=int, default=1_000_000, help="Profiles to classify")
+    parser.add_argument("--region", default="cambodia", help="Benchmark region (default: cambodia)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = load_index(args.seed_sql, refresh=args.refresh)
+    print(f"Benchmark index ready in {(time.perf_counter() - start) * 1000:.1f} ms "
+          f"({int(np.isfinite(index.median).sum())} benchmarks)")
+
+    if not args.classify:
+        print_table(index)
+        return
+
+    columns = generate_test_data.generate_columns(args.count)
+    rates = pricing_oracle.calculate_with_breakdown(columns)["base_hourly_rate"]
+
+    start = time.perf_counter()
+    positions = index.classify(rates, index.profile_categories(columns["skill_idx"]),
+                               columns["seniority"], index.region_code(args.region))
+    elapsed = time.perf_counter() - start
+
+    print(f"Classified {len(rates)} rates in {elapsed:.3f}s")
+    counts = np.bincount(positions + 1, minlength=len(POSITIONS) + 1)
+    for label, count in zip(["no_benchmark"] + POSITIONS, counts):
+        print(f"  {label:<14} {count:>10} ({count / max(len(rates), 1) * 100:5.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
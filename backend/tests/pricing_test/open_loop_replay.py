@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Open-Loop Trace Replayer
+
+Fires requests at their scheduled timestamps whether or not earlier requests
+have finished, instead of the closed loop in the shell scripts (where a slow
+response silently delays everything after it and hides queueing).
+
+Two schedules:
+    trace    a workload_trace.py NDJSON file; sessions run independently, and
+             a request that needs an earlier response of its own session
+             (user_id, token, session_id) waits for it
+    poisson  one endpoint (--step) hit at --rate requests/s for --duration s,
+             all sharing one pre-authenticated user
+
+Every request records its intended start (from the schedule) and its actual
+start. response_time_ms is measured from the intended start, so time spent
+waiting behind a slow server is counted (coordinated-omission corrected);
+service_time_ms is the uncorrected send-to-response time for comparison.
+
+Rows stream to results/open_loop_<ts>.csv using the test_data_*.csv columns
+(category = step, extraction_time_ms = corrected latency), so
+gemini_test/results/visualize_results.py --csv can load it directly.
+
+Requires: pip install aiohttp
+
+Usage:
+    python3 open_loop_replay.py trace.ndjson
+    python3 open_loop_replay.py trace.ndjson --speed 10 --base-url http://localhost:3100/api/v1
+    python3 open_loop_replay.py --poisson --step quick_estimate --rate 2 --duration 60
+"""
+
+import argparse
+import asyncio
+import csv
+import os
+import random
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+import aiohttp
+import numpy as np
+
+import generate_test_data
+import workload_trace
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_DIR = os.path.join(SCRIPT_DIR, "results")
+BASE_URL = os.environ.get("API_BASE_URL", "http://localhost:3000/api/v1")
+
+POISSON_STEPS = ("quick_estimate", "pdf_extract", "signup")
+
+CSV_COLUMNS = [
+    # test_data_*.csv columns read by visualize_results.py
+    "test_id", "category", "test_name", "pdf_file", "expected_categories", "found_categories",
+    "found_items", "category_accuracy", "items_per_category", "field_completeness",
+    "duration_extracted", "duration_expected", "duration_match", "difficulty_expected",
+    "difficulty_found", "difficulty_match", "extraction_time_ms", "model_used", "status", "error_message",
+    # open-loop timing
+    "session", "seq", "method", "http_status", "intended_start_ms", "actual_start_ms",
+    "start_delay_ms", "service_time_ms", "response_time_ms",
+]
+NOT_APPLICABLE = {c: "N/A" for c in CSV_COLUMNS[4:16]}
+
+PLACEHOLDERS = ("otp", "user_id", "session_id", "run")
+
+
+def fill(value: Any, state: Dict[str, Any]) -> Any:
+    """Substitute {otp}/{user_id}/{session_id}/{run}; a bare placeholder keeps the captured value's type"""
+    if isinstance(value, dict):
+        return {k: fill(v, state) for k, v in value.items()}
+    if isinstance(value, list):
+        return [fill(v, state) for v in value]
+    if isinstance(value, str) and "{" in value:
+        for name in PLACEHOLDERS:
+            token = "{" + name + "}"
+            if value == token and name in state:
+                return state[name]
+            if token in value and name in state:
+                value = value.replace(token, str(state[name]))
+    return value
+
+
+def unresolved(value: Any) -> Optional[str]:
+    """First placeholder still present after fill(), if any"""
+    if isinstance(value, dict):
+        value = list(value.values())
+    if isinstance(value, list):
+        return next((u for u in map(unresolved, value) if u), None)
+    if isinstance(value, str):
+        return next((name for name in PLACEHOLDERS if "{" + name + "}" in value), None)
+    return None
+
+
+def capture(step: str, body: Dict[str, Any], state: Dict[str, Any]):
+    """Remember the response values later steps of the session refer to"""
+    data = body.get("data") or {}
+    if step == "signup":
+        user_id = (data.get("user") or {}).get("user_id") or data.get("user_id")
+        if user_id is not None:
+            state["user_id"] = user_id
+        state["otp"] = str(data.get("otp") or "123456")
+    elif step == "verify_otp" and data.get("token"):
+        state["token"] = data["token"]
+    elif step == "onboarding_start" and data.get("session_id"):
+        state["session_id"] = data["session_id"]
+
+
+class Replayer:
+    """Fires trace records against the API and streams one CSV row per request"""
+
+    def __init__(self, session: aiohttp.ClientSession, writer: csv.DictWriter, out, base_url: str, t0: float,
+                 run: str):
+        self.session = session
+        self.writer = writer
+        self.out = out
+        self.base_url = base_url.rstrip("/")
+        self.t0 = t0
+        self.run = run  # Fills {run} in signup emails so each replay signs up fresh users
+        self.pdfs: Dict[str, bytes] = {}
+        self.latencies: Dict[str, List[tuple]] = {}
+        self.errors: Dict[str, int] = {}
+
+    def now_ms(self) -> float:
+        return (time.perf_counter() - self.t0) * 1000
+
+    def _pdf(self, name: str) -> bytes:
+        if name not in self.pdfs:
+            with open(os.path.join(workload_trace.PDF_SAMPLES_DIR, name), "rb") as f:
+                self.pdfs[name] = f.read()
+        return self.pdfs[name]
+
+    async def fire(self, record: Dict[str, Any], intended_ms: float, state: Dict[str, Any]):
+        step = record["step"]
+        row = {**NOT_APPLICABLE, "test_id": f"{record['session']}.{record['seq']}", "category": step,
+               "test_name": record["path"], "pdf_file": record.get("pdf") or "N/A", "model_used": "unknown",
+               "session": record["session"], "seq": record["seq"], "method": record["method"],
+               "intended_start_ms": round(intended_ms, 3), "error_message": ""}
+
+        path = fill(record["path"], state)
+        body = fill(record.get("body"), state)
+        form = fill(record.get("form"), state)
+        missing = unresolved([path, body, form])
+
+        actual_ms = self.now_ms()
+        if missing:
+            row.update({"status": "SKIPPED", "http_status": "", "error_message": f"no {missing} from earlier steps",
+                        "actual_start_ms": round(actual_ms, 3), "start_delay_ms": round(actual_ms - intended_ms, 3),
+                        "service_time_ms": 0, "response_time_ms": 0, "extraction_time_ms": 0})
+            self._write(row)
+            return
+
+        kwargs = {"headers": {"Authorization": f"Bearer {state['token']}"}} if "token" in state else {}
+        if record.get("pdf"):
+            data = aiohttp.FormData()
+            data.add_field("pdf", self._pdf(record["pdf"]), filename=record["pdf"], content_type="application/pdf")
+            for key, value in (form or {}).items():
+                data.add_field(key, str(value))
+            kwargs["data"] = data
+        elif body is not None:
+            kwargs["json"] = body
+
+        http_status, payload, error = "", {}, ""
+        try:
+            async with self.session.request(record["method"], self.base_url + path, **kwargs) as response:
+                http_status = response.status
+                try:
+                    payload = await response.json(content_type=None)
+                except ValueError:
+                    error = f"HTTP {http_status}: non-JSON response"
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            error = f"{type(e).__name__}: {e}"
+        done_ms = self.now_ms()
+
+        payload = payload if isinstance(payload, dict) else {}
+        success = payload.get("success") is True
+        if success:
+            capture(step, payload, state)
+        else:
+            detail = payload.get("error")
+            message = payload.get("message") or (detail.get("message") if isinstance(detail, dict) else detail)
+            error = error or message or f"HTTP {http_status}"
+
+        model = ((payload.get("data") or {}).get("metadata") or {}).get("model") if success else None
+        row.update({
+            "status": "PASSED" if success else "FAILED",
+            "http_status": http_status,
+            "error_message": error,
+            "model_used": model or "unknown",
+            "actual_start_ms": round(actual_ms, 3),
+            "start_delay_ms": round(actual_ms - intended_ms, 3),
+            "service_time_ms": round(done_ms - actual_ms, 3),
+            "response_time_ms": round(done_ms - intended_ms, 3),
+            "extraction_time_ms": int(round(done_ms - intended_ms)),
+        })
+        self._write(row)
+
+    def _write(self, row: Dict[str, Any]):
+        self.writer.writerow(row)
+        self.out.flush()
+        if row["status"] == "SKIPPED":
+            return
+        self.latencies.setdefault(row["category"], []).append((row["response_time_ms"], row["service_time_ms"]))
+        if row["status"] == "FAILED":
+            self.errors[row["category"]] = self.errors.get(row["category"], 0) + 1
+
+
+async def sleep_until(t0: float, offset_s: float):
+    delay = t0 + offset_s - time.perf_counter()
+    if delay > 0:
+        await asyncio.sleep(delay)
+
+
+async def run_session(replayer: Replayer, queue: asyncio.Queue, length: int):
+    """One trace session: requests in order, each waiting for the previous response"""
+    state: Dict[str, Any] = {"run": replayer.run}
+    for _ in range(length):
+        record, intended_ms = await queue.get()
+        await replayer.fire(record, intended_ms, state)
+
+
+async def replay_trace(replayer: Replayer, records: Iterator[Dict[str, Any]], speed: float):
+    queues: Dict[int, asyncio.Queue] = {}
+    tasks = set()
+    for record in records:
+        offset = record["t"] / speed
+        await sleep_until(replayer.t0, offset)
+        queue = queues.get(record["session"])
+        if queue is None:
+            queue = queues[record["session"]] = asyncio.Queue()
+            task = asyncio.create_task(run_session(replayer, queue, workload_trace.session_length(record["kind"])))
+            task.add_done_callback(lambda t, s=record["session"]: (tasks.discard(t), queues.pop(s, None)))
+            tasks.add(task)
+        queue.put_nowait((record, offset * 1000))
+    if tasks:
+        await asyncio.wait(tasks)
+
+
+def iter_poisson(step: str, rate: float, duration: float, seed: int) -> Iterator[Dict[str, Any]]:
+    """Single-step records at Poisson arrival times, bodies built from generated profiles"""
+    rng = random.Random(seed)
+    arrivals = workload_trace.iter_arrivals(random.Random(seed + 1), [(0.0, rate)], duration)
+    kind = {"quick_estimate": "quick_estimate", "pdf_extract": "pdf", "signup": "quick_estimate"}[step]
+    for i, t in enumerate(arrivals):
+        profile = generate_test_data.generate_profile(rng)
+        requests = workload_trace.session_requests(i, kind, profile, rng, seed)
+        request = next(r for r in requests if r["step"] == step)
+        yield {"t": round(t, 6), "session": i, "seq": 0, "kind": kind, **request}
+
+
+async def replay_poisson(replayer: Replayer, records: Iterator[Dict[str, Any]], state: Dict[str, Any]):
+    tasks = set()
+    for record in records:
+        await sleep_until(replayer.t0, record["t"])
+        task = asyncio.create_task(replayer.fire(record, record["t"] * 1000, state))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+    if tasks:
+        await asyncio.wait(tasks)
+
+
+async def authenticate(session: aiohttp.ClientSession, base_url: str, seed: int, run: str) -> Dict[str, Any]:
+    """Signed-in state shared by every Poisson request (not timed)"""
+    profile = generate_test_data.generate_profile(random.Random(seed))
+    requests = workload_trace.session_requests(int(time.time()), "quick_estimate", profile, random.Random(seed), seed)
+    state: Dict[str, Any] = {"run": run}
+    for request in requests[:2]:  # signup, verify_otp
+        async with session.post(base_url.rstrip("/") + request["path"], json=fill(request["body"], state)) as r:
+            capture(request["step"], await r.json(content_type=None), state)
+    if "token" not in state:
+        raise SystemExit("Could not sign in a user for the Poisson run")
+    return state
+
+
+def print_summary(replayer: Replayer, elapsed: float):
+    print()
+    print(f"  {'Endpoint':<20} {'N':>7} {'Err':>5}   {'p50':>9} {'p90':>9} {'p99':>9}   "
+          f"{'p99 uncorrected':>15}")
+    for step, values in sorted(replayer.latencies.items()):
+        corrected, service = np.array(values).T
+        p50, p90, p99 = np.percentile(corrected, [50, 90, 99])
+        print(f"  {step:<20} {len(values):>7} {replayer.errors.get(step, 0):>5}   "
+              f"{p50:>7.0f}ms {p90:>7.0f}ms {p99:>7.0f}ms   {np.percentile(service, 99):>13.0f}ms")
+    total = sum(len(v) for v in replayer.latencies.values())
+    print(f"\n  {total} requests in {elapsed:.1f}s ({total / max(elapsed, 1e-9):.1f} req/s)")
+
+
+async def run(args) -> str:
+    os.makedirs(args.output_dir, exist_ok=True)
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    path = os.path.join(args.output_dir, f"open_loop_{timestamp}.csv")
+    run_id = args.run_id or timestamp.replace("_", "")
+
+    connector = aiohttp.TCPConnector(limit=args.max_connections, keepalive_timeout=60)
+    timeout = aiohttp.ClientTimeout(total=args.timeout)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        state = await authenticate(session, args.base_url, args.seed, run_id) if args.poisson else None
+        with open(path, "w", newline="") as out:
+            writer = csv.DictWriter(out, fieldnames=CSV_COLUMNS)
+            writer.writeheader()
+            replayer = Replayer(session, writer, out, args.base_url, time.perf_counter() + 0.1, run_id)
+            if args.poisson:
+                await replay_poisson(replayer, iter_poisson(args.step, args.rate, args.duration, args.seed), state)
+            else:
+                meta, records = workload_trace.load_trace(args.trace)
+                await replay_trace(replayer, records, args.speed)
+    print_summary(replayer, time.perf_counter() - replayer.t0)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a request schedule open-loop and record corrected latency")
+    parser.add_argument("trace", nargs="?", help="NDJSON trace from workload_trace.py")
+    parser.add_argument("--speed", type=float, default=1.0, help="Replay the trace this many times faster")
+    parser.add_argument("--poisson", action="store_true", help="Poisson arrivals at one endpoint instead of a trace")
+    parser.add_argument("--step", choices=POISSON_STEPS, default="quick_estimate", help="Endpoint for --poisson")
+    parser.add_argument("--rate", type=float, default=1.0, help="Requests per second for --poisson")
+    parser.add_argument("--duration", type=float, default=60, help="Seconds of arrivals for --poisson")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for --poisson arrivals and bodies")
+    parser.add_argument("--run-id", help="Fills {run} in trace signup emails "
+                        "(default: the start time, so every replay signs up new users)")
+    parser.add_argument("--base-url", default=BASE_URL, help=f"API base URL (default: {BASE_URL})")
+    parser.add_argument("--max-connections", type=int, default=100,
+                        help="Connection pool size; waiting for a connection counts as latency (0 = unlimited)")
+    parser.add_argument("--timeout", type=float, default=180, help="Per-request timeout in seconds")
+    parser.add_argument("-o", "--output-dir", default=RESULTS_DIR, help="Directory for open_loop_<ts>.csv")
+    args = parser.parse_args()
+
+    if not args.poisson and not args.trace:
+        parser.error("pass a trace file or --poisson")
+    if args.speed <= 0:
+        parser.error("--speed must be positive")
+
+    print(f"Replaying {'Poisson ' + args.step if args.poisson else args.trace} against {args.base_url}")
+    path = asyncio.run(run(args))
+    print(f"  ✓ Saved: {path}")
+    print(f"  Visualize: python3 ../gemini_test/results/visualize_results.py --csv {path}")
+
+
+if __name__ == "__main__":
+    main()
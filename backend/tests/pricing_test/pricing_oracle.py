@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Batch UREA Pricing Oracle
+
+Vectorized Python mirror of PricingCalculatorService.calculateSustainabilityRate
+and calculateWithBreakdown, for pricing generate_test_data profiles in bulk
+instead of one HTTP call at a time.
+
+Profile fields map onto the UREA inputs as:
+    fixed costs    = monthly_rent + equipment_cost + utilities_cost
+    variable costs = materials_cost
+
+Usage:
+    python3 pricing_oracle.py                      # 1,000,000 vectorized profiles
+    python3 pricing_oracle.py -n 5000000
+    python3 pricing_oracle.py profiles.ndjson      # Price a generated file
+    python3 pricing_oracle.py profiles_columnar/   # Price a memory-mapped columnar store
+"""
+
+import argparse
+import os
+import time
+from typing import Dict
+
+import numpy as np
+
+import generate_test_data
+
+FIXED_COST_FIELDS = ("monthly_rent", "equipment_cost", "utilities_cost")
+VARIABLE_COST_FIELDS = ("materials_cost",)
+
+# SeniorityMultiplier.MULTIPLIERS and ClientContext.getContextMultiplier()
+SENIORITY_MULTIPLIERS = {"junior": 0.8, "mid": 1.0, "senior": 1.3, "expert": 1.5}
+CLIENT_TYPE_MULTIPLIERS = {"startup": 0.9, "sme": 1.0, "corporate": 1.2, "ngo": 0.85, "government": 1.1}
+REGION_MULTIPLIERS = {"cambodia": 1.0, "southeast_asia": 1.15, "global": 1.3}
+
+
+def ts_round(values: np.ndarray, decimals: int = 2) -> np.ndarray:
+    """Math.round(x * 10^d) / 10^d — rounds halves up, unlike np.round"""
+    scale = 10.0 ** decimals
+    return np.floor(np.asarray(values, dtype=np.float64) * scale + 0.5) / scale
+
+
+def invalid_mask(profit_margin: np.ndarray, billable_hours: np.ndarray) -> np.ndarray:
+    """Rows calculateSustainabilityRate would reject (billable_hours <= 0, margin outside [0, 1])"""
+    return (billable_hours <= 0) | (profit_margin < 0) | (profit_margin > 1)
+
+
+def _urea_components(columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """Unrounded UREA terms, computed in the same order as the TS service"""
+    fixed_total = sum(columns[f].astype(np.float64) for f in FIXED_COST_FIELDS)
+    variable_total = sum(columns[f].astype(np.float64) for f in VARIABLE_COST_FIELDS)
+    desired_income = columns["desired_income"].astype(np.float64)
+    profit_margin = columns["profit_margin"].astype(np.float64)
+    billable_hours = columns["billable_hours"].astype(np.float64)
+
+    valid = ~invalid_mask(profit_margin, billable_hours)
+
+    total_monthly_costs = fixed_total + variable_total + desired_income
+    profit_amount = total_monthly_costs * profit_margin
+    total_required = total_monthly_costs + profit_amount
+    with np.errstate(divide="ignore", invalid="ignore"):
+        base_rate = np.where(valid, total_required / billable_hours, np.nan)
+
+    return {
+        "base_hourly_rate": base_rate,
+        "fixed_costs_total": fixed_total,
+        "variable_costs_total": variable_total,
+        "desired_income": desired_income,
+        "total_monthly_costs": total_monthly_costs,
+        "profit_margin": profit_margin,
+        "profit_amount": profit_amount,
+        "total_required": total_required,
+        "billable_hours": billable_hours,
+        "valid": valid,
+    }
+
+
+def calculate_sustainability_rate(columns: Dict[str, np.ndarray]) -> np.ndarray:
+    """Unrounded base hourly rates; NaN where the TS service would throw"""
+    return _urea_components(columns)["base_hourly_rate"]
+
+
+def calculate_with_breakdown(columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Price every row of a generate_columns-style table.
+
+    Returns the calculateWithBreakdown fields as float64 columns (rounded to
+    2 decimals like the TS service) plus a boolean `valid` mask. Invalid rows
+    are reported through the mask and carry NaN rates instead of raising.
+    """
+    c = _urea_components(columns)
+    return {
+        "base_hourly_rate": ts_round(c["base_hourly_rate"]),
+        "fixed_costs_total": ts_round(c["fixed_costs_total"]),
+        "variable_costs_total": ts_round(c["variable_costs_total"]),
+        "desired_income": ts_round(c["desired_income"]),
+        "total_monthly_costs": ts_round(c["total_monthly_costs"]),
+        "profit_margin_percentage": ts_round(c["profit_margin"] * 100, 0),
+        "profit_amount": ts_round(c["profit_amount"]),
+        "total_required": ts_round(c["total_required"]),
+        "billable_hours": c["billable_hours"],
+        "valid": c["valid"],
+    }
+
+
+def apply_multipliers(base_rate: np.ndarray, seniority_multiplier: np.ndarray,
+                      context_multiplier: np.ndarray) -> np.ndarray:
+    """calculateProjectRateWithBreakdown final_hourly_rate; inputs broadcast against each other"""
+    return ts_round(np.asarray(base_rate) * seniority_multiplier * context_multiplier)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Price generated profiles with the UREA formula")
+    parser.add_argument("input", nargs="?",
+                        help="Generated .json/.ndjson file or columnar directory (default: generate in memory)")
+    parser.add_argument("-n", "--count", type=int, default=1_000_000, help="Profiles to generate without input")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for generated profiles")
+    args = parser.parse_args()
+
+    if args.input and os.path.isdir(args.input):
+        print(f"Mapping: {args.input}")
+        columns = generate_test_data.open_columnar(args.input)
+    elif args.input:
+        print(f"Loading: {args.input}")
+        columns = generate_test_data.load_profiles(args.input)
+    else:
+        columns = generate_test_data.generate_columns(args.count, seed=args.seed)
+
+    start = time.perf_counter()
+    result = calculate_with_breakdown(columns)
+    elapsed = time.perf_counter() - start
+
+    rates = result["base_hourly_rate"][result["valid"]]
+    total = len(result["valid"])
+    print(f"Priced {total} profiles in {elapsed:.3f}s ({total / max(elapsed, 1e-9):,.0f} profiles/s)")
+    print(f"  Invalid rows: {total - len(rates)}")
+    if len(rates):
+        p50, p90 = np.percentile(rates, [50, 90])
+        print(f"  Base rate:    min ${rates.min():.2f}  p50 ${p50:.2f}  p90 ${p90:.2f}  max ${rates.max():.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Startup-Time Benchmark for the Report CLIs
+
+Runs visualize_single.py and compare_results.py in --text-only mode in fresh
+interpreters and reports the median wall time over a bare `python -c pass`.
+Fails (exit 1) if a text-only run imports matplotlib, or if its overhead
+exceeds the budget, so the plotting stack stays lazily loaded.
+
+Uses the newest with_/without_grounding_*.json in results/ as input; the
+compare run's JSON report goes to a temporary directory.
+
+Usage:
+    python3 benchmark_startup.py
+    python3 benchmark_startup.py --runs 10 --budget-ms 250
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+SCRIPT_DIR = Path(__file__).parent
+RESULTS_DIR = SCRIPT_DIR / 'results'
+
+PLOTTING_MODULES = ('matplotlib',)
+
+# Runs a CLI as __main__, then reports which plotting modules ended up imported
+PROBE = '''
+import runpy, sys
+sys.argv = {argv!r}
+sys.path.insert(0, {script_dir!r})
+try:
+    runpy.run_path({script!r}, run_name='__main__')
+finally:
+    loaded = [m for m in {modules!r} if m in sys.modules]
+    sys.stderr.write('\\nPLOTTING_LOADED=' + ','.join(loaded) + '\\n')
+'''
+
+
+class Colors:
+    GREEN = '\033[92m'
+    RED = '\033[91m'
+    YELLOW = '\033[93m'
+    BOLD = '\033[1m'
+    END = '\033[0m'
+
+
+def newest(pattern: str) -> Path:
+    matches = sorted(RESULTS_DIR.glob(pattern))
+    if not matches:
+        print(f"{Colors.RED}No {pattern} in {RESULTS_DIR}{Colors.END}")
+        sys.exit(1)
+    return matches[-1]
+
+
+def time_command(command: List[str], cwd: Path) -> Tuple[float, str]:
+    """(wall seconds, stderr) of one run; exits on failure"""
+    start = time.perf_counter()
+    proc = subprocess.run(command, cwd=cwd, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if proc.returncode != 0:
+        print(f"{Colors.RED}✗ {' '.join(command[:3])} exited {proc.returncode}{Colors.END}")
+        print(proc.stderr[-2000:])
+        sys.exit(1)
+    return elapsed, proc.stderr
+
+
+def probe(script: str, args: List[str]) -> List[str]:
+    code = PROBE.format(argv=[script] + args, script_dir=str(SCRIPT_DIR),
+                        script=str(SCRIPT_DIR / script), modules=PLOTTING_MODULES)
+    return [sys.executable, '-c', code]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark text-only startup of the report CLIs')
+    parser.add_argument('--runs', type=int, default=5, help='Runs per command (default: 5)')
+    parser.add_argument('--budget-ms', type=float, default=300,
+                        help='Allowed median overhead over a bare interpreter (default: 300)')
+    args = parser.parse_args()
+
+    with_file = newest('with_grounding_*.json')
+    without_file = newest('without_grounding_*.json')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cwd = Path(tmp)
+        commands = {
+            'python -c pass': [sys.executable, '-c', 'pass'],
+            'visualize_single --text-only': probe('visualize_single.py', [str(with_file), '--text-only']),
+            'compare_results --text-only': probe('compare_results.py',
+                                                 [str(with_file), str(without_file), '--text-only',
+                                                  '--output-dir', tmp]),
+        }
+
+        medians = {}
+        loaded = {}
+        for name, command in commands.items():
+            times = []
+            for _ in range(args.runs):
+                elapsed, stderr = time_command(command, cwd)
+                times.append(elapsed)
+                for line in stderr.splitlines():
+                    if line.startswith('PLOTTING_LOADED='):
+                        loaded[name] = [m for m in line.split('=', 1)[1].split(',') if m]
+            medians[name] = statistics.median(times)
+
+    baseline = medians.pop('python -c pass')
+    print(f"{Colors.BOLD}Text-only startup ({args.runs} runs, median){Colors.END}")
+    print(f"  {'bare interpreter':<32} {baseline * 1000:>7.0f} ms")
+
+    failed = False
+    for name, median in medians.items():
+        overhead = (median - baseline) * 1000
+        problems = []
+        if loaded.get(name):
+            problems.append(f"imported {', '.join(loaded[name])}")
+        if overhead > args.budget_ms:
+            problems.append(f"over {args.budget_ms:.0f} ms budget")
+        status = f"{Colors.RED}✗ {'; '.join(problems)}{Colors.END}" if problems else f"{Colors.GREEN}✓{Colors.END}"
+        print(f"  {name:<32} {median * 1000:>7.0f} ms  (+{overhead:.0f} ms)  {status}")
+        failed = failed or bool(problems)
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Content-Hash Chart Cache and Stale Report Cleanup
+
+Each chart is keyed by a hash of the data it actually draws (its slice of
+the scenario/comparison fields), the rendering parameters, the matplotlib
+version and the visualizer's own source. A hit reuses the stored figure for
+the PDF and hard-links the stored PNG to the new timestamped name, so
+re-running a visualizer on unchanged input renders nothing.
+
+collect_garbage() keeps single_visual/ and comparison_visual/ under a disk
+budget by deleting whole superseded runs (files sharing a _YYYYmmdd_HHMMSS
+stamp), oldest first; the newest run is always kept. The cache itself is
+trimmed least-recently-used first.
+
+Usage:
+    python3 chart_cache.py                     # Show cache and report sizes
+    python3 chart_cache.py --max-disk-mb 50    # Trim reports and cache to 50 MB each
+    python3 chart_cache.py --clear             # Empty the chart cache
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import re
+import shutil
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from parallel_render import render_all
+
+SCRIPT_DIR = Path(__file__).parent
+RESULTS_DIR = SCRIPT_DIR / 'results'
+CACHE_DIR = RESULTS_DIR / '.cache' / 'charts'
+VISUAL_DIRS = ('single_visual', 'comparison_visual')
+
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+RUN_STAMP = re.compile(r'_(\d{8}_\d{6})\.(?:png|pdf)$')
+
+
+def source_digest(path: Path) -> str:
+    """Short hash of a visualizer's source, so editing a chart invalidates its cache entries"""
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()[:16]
+
+
+def chart_key(name: str, items: Any, fields: Sequence[str], params: Dict[str, Any]) -> str:
+    """
+    Hash of the fields a chart reads plus its rendering parameters.
+
+    items is either a list of records or a columnar table whose attributes
+    are NumPy arrays; numeric and string columns are hashed as raw bytes.
+    """
+    import matplotlib
+
+    payload = {
+        'chart': name,
+        'fields': list(fields),
+        'params': params,
+        'matplotlib': matplotlib.__version__,
+    }
+    digest = hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode())
+    for field in fields:
+        if isinstance(items, (list, tuple)):
+            column = [getattr(item, field) for item in items]
+        else:
+            column = getattr(items, field)
+        if getattr(column, 'dtype', None) is not None and column.dtype.kind in 'biufU':
+            digest.update(f'{field}:{column.dtype.str}:{column.shape}'.encode())
+            digest.update(column.tobytes())
+        else:
+            values = column.tolist() if hasattr(column, 'tolist') else column
+            digest.update(f'{field}:'.encode() + json.dumps(values, default=str).encode())
+    return digest.hexdigest()
+
+
+def _link(source: Path, target: Path):
+    """Hard-link source to target (copy when linking isn't possible)"""
+    try:
+        if target.exists():
+            target.unlink()
+        os.link(source, target)
+    except OSError:
+        shutil.copyfile(source, target)
+
+
+class ChartCache:
+    """<key>.pickle holds the figure, <key>.png the 300-dpi export when one was made"""
+
+    def __init__(self, directory: Path = CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, key: str, png_path: Optional[Path]):
+        """Cached figure (with its PNG linked to png_path when one is wanted), or None"""
+        figure_path = self.directory / f'{key}.pickle'
+        png = self.directory / f'{key}.png'
+        if not figure_path.exists() or (png_path is not None and not png.exists()):
+            self.misses += 1
+            return None
+        try:
+            with open(figure_path, 'rb') as f:
+                fig = pickle.load(f)
+        except Exception:
+            self.misses += 1
+            return None
+
+        if png_path is not None:
+            _link(png, png_path)
+            os.utime(png)
+        os.utime(figure_path)
+        self.hits += 1
+        return fig
+
+    def store(self, key: str, fig, png_path: Optional[Path]):
+        figure_path = self.directory / f'{key}.pickle'
+        tmp = figure_path.with_suffix('.tmp')
+        with open(tmp, 'wb') as f:
+            pickle.dump(fig, f)
+        os.replace(tmp, figure_path)
+        if png_path is not None and png_path.exists():
+            _link(png_path, self.directory / f'{key}.png')
+
+    def evict(self, max_bytes: Optional[int] = None) -> int:
+        """Drop least-recently-used entries until the cache fits; returns files removed"""
+        budget = self.max_bytes if max_bytes is None else max_bytes
+        files = sorted(self.directory.glob('*.*'), key=lambda p: p.stat().st_mtime)
+        total = sum(p.stat().st_size for p in files)
+        removed = 0
+        for path in files:
+            if total <= budget:
+                break
+            total -= path.stat().st_size
+            path.unlink()
+            removed += 1
+        return removed
+
+
+def render_cached(cache: Optional[ChartCache], keys: Sequence[str], render: Callable,
+                  jobs: Sequence[Tuple[str, Optional[Path]]], context: Any, workers: Optional[int]) -> List[Any]:
+    """
+    render_all() for only the (name, png_path) jobs the cache can't satisfy.
+
+    Returns one figure per job, in job order; newly rendered charts are stored.
+    """
+    figures = [cache.load(key, path) if cache else None for key, (_, path) in zip(keys, jobs)]
+    pending = [i for i, fig in enumerate(figures) if fig is None]
+    rendered = render_all(render, [jobs[i] for i in pending], context, workers)
+    for i, fig in zip(pending, rendered):
+        figures[i] = fig
+        if cache:
+            cache.store(keys[i], fig, jobs[i][1])
+    return figures
+
+
+def report_runs(visual_dir: Path) -> Dict[str, List[Path]]:
+    """{run stamp: files} for every timestamped chart or report in the directory"""
+    runs = defaultdict(list)
+    for path in Path(visual_dir).iterdir():
+        match = RUN_STAMP.search(path.name)
+        if match and path.is_file():
+            runs[match.group(1)].append(path)
+    return runs
+
+
+def collect_garbage(visual_dir: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> Tuple[int, int]:
+    """Delete the oldest runs until the directory fits the budget; returns (files removed, bytes freed)"""
+    runs = report_runs(visual_dir)
+    sizes = {stamp: sum(p.stat().st_size for p in files) for stamp, files in runs.items()}
+    total = sum(sizes.values())
+    removed = freed = 0
+    for stamp in sorted(runs)[:-1]:
+        if total <= max_bytes:
+            break
+        for path in runs[stamp]:
+            path.unlink()
+            removed += 1
+        total -= sizes[stamp]
+        freed += sizes[stamp]
+    return removed, freed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Inspect or trim the chart cache and old report runs')
+    parser.add_argument('--results-dir', default=str(RESULTS_DIR), help=f'Results directory (default: {RESULTS_DIR})')
+    parser.add_argument('--max-disk-mb', type=float, help='Trim each report directory and the cache to this size')
+    parser.add_argument('--clear', action='store_true', help='Empty the chart cache')
+    args = parser.parse_args()
+
+    results_dir = Path(args.results_dir)
+    cache = ChartCache(results_dir / '.cache' / 'charts')
+    if args.clear:
+        print(f'  ✓ Removed {cache.evict(0)} cached files')
+
+    if args.max_disk_mb is not None:
+        budget = int(args.max_disk_mb * 1024 * 1024)
+        for name in VISUAL_DIRS:
+            if (results_dir / name).is_dir():
+                removed, freed = collect_garbage(results_dir / name, budget)
+                print(f'  ✓ {name}: removed {removed} files ({freed / 1024 / 1024:.1f} MB)')
+        print(f'  ✓ cache: removed {cache.evict(budget)} files')
+
+    for name in VISUAL_DIRS:
+        if (results_dir / name).is_dir():
+            runs = report_runs(results_dir / name)
+            size = sum(p.stat().st_size for files in runs.values() for p in files)
+            print(f'{name + "/":<20} {len(runs):>4} runs  {size / 1024 / 1024:>8.1f} MB')
+    cached = list(cache.directory.glob('*.pickle'))
+    size = sum(p.stat().st_size for p in cache.directory.glob('*.*'))
+    print(f'{"chart cache":<20} {len(cached):>4} charts {size / 1024 / 1024:>7.1f} MB')
+
+
+if __name__ == '__main__':
+    main()
@@ -10,20 +10,40 @@ Usage:
     python3 compare_results.py <with_grounding.json> <without_grounding.json>
     python3 compare_results.py  # Uses latest results
     python3 compare_results.py --graphs-only  # Only generate graphs
+    python3 compare_results.py --text-only    # Tables + JSON report, no matplotlib
+    python3 compare_results.py --workers 1    # Render charts serially
+    python3 compare_results.py --no-png       # PDF report only
+    python3 compare_results.py --trend        # Trends across every results/with_grounding_*.json
+
+Scenarios are matched on (experience level, skills, occurrence) with a hash
+join, so runs with several skills per level compare row by row; unmatched
+and repeated scenarios are reported alongside the tables and in the JSON.
+
+Charts are rendered in a process pool (parallel_render.py); file names and
+chart order match the serial path. The combined PDF embeds the chart
+figures as vector pages, so the PNGs are optional.
+
+Charts whose input data is unchanged are reused from results/.cache/charts
+(chart_cache.py), and older runs in comparison_visual/ are deleted once it
+grows past --max-disk-mb.
 """
 
+import argparse
 import json
 import sys
 import os
+import time
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+from collections import Counter, defaultdict, deque
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+from dataclasses import asdict, dataclass, field, fields
 from datetime import datetime
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from matplotlib.gridspec import GridSpec
+
 import numpy as np
 
+from chart_cache import DEFAULT_MAX_BYTES, ChartCache, chart_key, collect_garbage, render_cached, source_digest
+from parallel_render import default_workers
+
 # ANSI colors
 class Colors:
     GREEN = '\033[92m'
@@ -35,6 +55,55 @@ class Colors:
     END = '\033[0m'
 
 
+# Plotting stack, imported by load_plotting() only when charts are drawn so
+# text-only runs skip matplotlib's import and font-cache startup
+plt = None
+GridSpec = None
+
+
+def load_plotting():
+    """Import matplotlib into this module on first use"""
+    global plt, GridSpec
+    if plt is None:
+        import matplotlib.pyplot as plt
+        from matplotlib.gridspec import GridSpec
+
+
+# Chart color scheme
+CHART_COLORS = {
+    'with': '#2E86AB',      # Blue
+    'without': '#A23B72',   # Purple
+    'positive': '#06A77D',  # Green
+    'negative': '#D84654',  # Red
+    'neutral': '#F18F01'    # Orange
+}
+
+# Charts in report order; each name is also the PNG file name prefix
+CHART_NAMES = [
+    '01_rate_comparison',
+    '02_rate_difference',
+    '03_cost_comparison',
+    '04_source_comparison',
+    '05_income_comparison',
+    '06_percentage_difference',
+    '07_summary_stats',
+    '08_detailed_rate_analysis',
+]
+
+# ComparisonTable columns each chart draws; the chart cache hashes only these
+CHART_INPUTS = {
+    '01_rate_comparison': ('experience_level', 'skills', 'with_rate', 'without_rate'),
+    '02_rate_difference': ('experience_level', 'skills', 'with_rate', 'without_rate'),
+    '03_cost_comparison': ('experience_level', 'skills', 'with_software_cost', 'with_workspace_cost',
+                           'without_software_cost', 'without_workspace_cost'),
+    '04_source_comparison': ('experience_level', 'skills', 'with_sources_count', 'without_sources_count'),
+    '05_income_comparison': ('experience_level', 'skills', 'with_income', 'without_income'),
+    '06_percentage_difference': ('experience_level', 'skills', 'with_rate', 'without_rate'),
+    '07_summary_stats': ('with_rate', 'without_rate', 'with_has_urls', 'without_has_urls'),
+    '08_detailed_rate_analysis': ('experience_level', 'skills', 'with_rate', 'without_rate'),
+}
+
+
 @dataclass
 class ComparisonResult:
     """Holds comparison data for a single scenario"""
@@ -57,17 +126,102 @@ class ComparisonResult:
     without_workspace_cost: Optional[float]
     without_income: Optional[float]
     
-    @property
-    def rate_difference(self) -> Optional[float]:
-        if self.with_rate and self.without_rate:
-            return self.with_rate - self.without_rate
-        return None
-    
-    @property
-    def rate_diff_percent(self) -> Optional[float]:
-        if self.with_rate and self.without_rate and self.without_rate > 0:
-            return ((self.with_rate - self.without_rate) / self.without_rate) * 100
-        return None
+    # Computed by ComparisonTable
+    rate_difference: Optional[float] = None
+    rate_diff_percent: Optional[float] = None
+
+
+COMPARISON_FIELDS = tuple(f.name for f in fields(ComparisonResult))
+INPUT_FIELDS = COMPARISON_FIELDS[:-2]
+COUNT_FIELDS = ('with_sources_count', 'without_sources_count')
+BOOL_FIELDS = ('with_has_urls', 'without_has_urls')
+
+
+def short_skills(skills: Optional[str], width: int) -> str:
+    """Skills text cut to fit a column or tick label"""
+    skills = skills or 'N/A'
+    return skills if len(skills) <= width else skills[:width - 3] + '...'
+
+
+@dataclass(eq=False)
+class ComparisonTable:
+    """
+    Scenario comparisons stored as one NumPy array per ComparisonResult
+    field (NaN for missing numbers), so large comparisons stay compact.
+
+    rate_difference and rate_diff_percent are computed once for every row
+    on construction; charts, tables and the JSON report all read them.
+    """
+    experience_level: np.ndarray
+    skills: np.ndarray
+    with_rate: np.ndarray
+    with_sources_count: np.ndarray
+    with_has_urls: np.ndarray
+    with_software_cost: np.ndarray
+    with_workspace_cost: np.ndarray
+    with_income: np.ndarray
+    without_rate: np.ndarray
+    without_sources_count: np.ndarray
+    without_has_urls: np.ndarray
+    without_software_cost: np.ndarray
+    without_workspace_cost: np.ndarray
+    without_income: np.ndarray
+    rate_difference: np.ndarray = field(init=False)
+    rate_diff_percent: np.ndarray = field(init=False)
+
+    def __post_init__(self):
+        # Same rule as before: both rates present and non-zero, percent only for a positive baseline
+        with_rate = np.nan_to_num(self.with_rate)
+        without_rate = np.nan_to_num(self.without_rate)
+        both = (with_rate != 0) & (without_rate != 0)
+        difference = with_rate - without_rate
+        self.rate_difference = np.where(both, difference, np.nan)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            percent = difference / without_rate * 100
+        self.rate_diff_percent = np.where(both & (without_rate > 0), percent, np.nan)
+
+    @classmethod
+    def from_rows(cls, rows: List[Tuple]) -> 'ComparisonTable':
+        """Build from tuples of values in INPUT_FIELDS order (None for missing numbers)"""
+        columns = list(zip(*rows)) or [()] * len(INPUT_FIELDS)
+        arrays = {}
+        for name, values in zip(INPUT_FIELDS, columns):
+            if name == 'skills':
+                # Free text, so kept as references to the parsed strings rather than fixed-width
+                arrays[name] = np.empty(len(values), dtype=object)
+                arrays[name][:] = values
+            elif name == 'experience_level':
+                arrays[name] = np.array(values, dtype=str)
+            elif name in BOOL_FIELDS:
+                arrays[name] = np.array(values, dtype=bool)
+            elif name in COUNT_FIELDS:
+                arrays[name] = np.array(values, dtype=np.int64)
+            else:
+                arrays[name] = np.array(values, dtype=float)
+        return cls(**arrays)
+
+    def __len__(self) -> int:
+        return len(self.experience_level)
+
+    def __getitem__(self, index) -> 'ComparisonTable':
+        """Rows picked by a boolean mask, index array or slice (slices are views)"""
+        return ComparisonTable(**{name: getattr(self, name)[index] for name in INPUT_FIELDS})
+
+    def rows(self) -> Iterator[ComparisonResult]:
+        """The rows as ComparisonResult records, with NaN turned back into None"""
+        columns = [getattr(self, name).tolist() for name in COMPARISON_FIELDS]
+        for values in zip(*columns):
+            yield ComparisonResult(*[None if value != value else value for value in values])
+
+    def labels(self, width: int = 24) -> List[str]:
+        """'<level>\\n<skills>' per row; several scenarios usually share a level"""
+        return [f'{level}\n{short_skills(skills, width)}'
+                for level, skills in zip(self.experience_level.tolist(), self.skills.tolist())]
+
+    def present(self, column: str) -> np.ndarray:
+        """Values of a numeric column that are neither missing nor zero"""
+        values = getattr(self, column)
+        return values[np.nan_to_num(values) != 0]
 
 
 def load_json_file(filepath: str) -> Dict[str, Any]:
@@ -110,159 +264,230 @@ def extract_result_data(result: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def compare_results(with_grounding: Dict, without_grounding: Dict) -> List[ComparisonResult]:
-    """Compare results from both test runs"""
-    comparisons = []
-    
-    with_results = {r['experience_level']: r for r in with_grounding.get('results', [])}
-    without_results = {r['experience_level']: r for r in without_grounding.get('results', [])}
-    
-    all_levels = set(with_results.keys()) | set(without_results.keys())
-    
-    for level in sorted(all_levels):
-        with_data = extract_result_data(with_results.get(level, {}))
-        without_data = extract_result_data(without_results.get(level, {}))
+@dataclass
+class JoinStats:
+    """How the rows of the two runs were paired up"""
+    with_rows: int = 0
+    without_rows: int = 0
+    matched: int = 0
+    matched_by_level: int = 0   # One side had no skills recorded (older failed-request rows)
+    with_only: int = 0
+    without_only: int = 0
+    repeated_keys: int = 0      # Rows whose (level, skills) pair already appeared earlier in the same run
+
+
+def scenario_keys(results: List[Dict]) -> List[Tuple[str, Optional[str], int]]:
+    """
+    (experience_level, skills, occurrence) for each result.
+
+    Result files carry no scenario id, so the occurrence number (0 for the
+    first row with a given level and skills, 1 for the next, ...) stands in
+    for it: repeated scenarios pair up in run order instead of overwriting
+    each other.
+    """
+    seen = Counter()
+    keys = []
+    for result in results:
+        pair = (result.get('experience_level', 'Unknown'), result.get('skills'))
+        keys.append(pair + (seen[pair],))
+        seen[pair] += 1
+    return keys
+
+
+def join_results(with_results: List[Dict], without_results: List[Dict]
+                 ) -> Tuple[List[Tuple[Optional[Dict], Optional[Dict]]], JoinStats]:
+    """
+    Hash-join two runs' results on scenario_keys(); O(n) in the number of rows.
+
+    Returns (with_result, without_result) pairs, with None on the side a
+    scenario is missing from, ordered by experience level.
+    """
+    stats = JoinStats(with_rows=len(with_results), without_rows=len(without_results))
+    with_keys = scenario_keys(with_results)
+    without_keys = scenario_keys(without_results)
+    stats.repeated_keys = sum(1 for key in with_keys + without_keys if key[2])
+    
+    index = {key: j for j, key in enumerate(without_keys)}
+    pairs = []
+    unmatched = []
+    for i, key in enumerate(with_keys):
+        j = index.pop(key, None)
+        if j is None:
+            unmatched.append(i)
+        else:
+            pairs.append((with_results[i], without_results[j]))
+    stats.matched = len(pairs)
+    
+    # Failed requests used to be saved without their skills; pair those by level
+    # with a leftover row from the other side, in run order
+    leftover = set(index.values())
+    spare = defaultdict(lambda: (deque(), deque()))  # level -> (rows with skills, rows without)
+    for j, (level, skills, _) in enumerate(without_keys):
+        if j in leftover:
+            spare[level][skills is None].append(j)
+    for i in unmatched:
+        level, skills, _ = with_keys[i]
+        with_skills, no_skills = spare[level]
+        queue = no_skills or (with_skills if skills is None else None)
+        if queue:
+            j = queue.popleft()
+            leftover.discard(j)
+            pairs.append((with_results[i], without_results[j]))
+            stats.matched_by_level += 1
+        else:
+            pairs.append((with_results[i], None))
+            stats.with_only += 1
+    for j in range(len(without_results)):
+        if j in leftover:
+            pairs.append((None, without_results[j]))
+            stats.without_only += 1
+    
+    pairs.sort(key=lambda pair: (pair[1] if pair[0] is None else pair[0]).get('experience_level', 'Unknown'))
+    return pairs, stats
+
+
+def compare_results(with_grounding: Dict, without_grounding: Dict) -> Tuple[ComparisonTable, JoinStats]:
+    """Compare results from both test runs, scenario by scenario"""
+    rows = []
+    pairs, stats = join_results(with_grounding.get('results', []), without_grounding.get('results', []))
+    
+    for with_result, without_result in pairs:
+        with_result = with_result or {}
+        without_result = without_result or {}
+        with_data = extract_result_data(with_result)
+        without_data = extract_result_data(without_result)
         
-        comparison = ComparisonResult(
-            experience_level=level,
-            skills=with_results.get(level, {}).get('skills', 'N/A'),
-            with_rate=with_data['rate'],
-            with_sources_count=with_data['sources_count'],
-            with_has_urls=with_data['has_urls'],
-            with_software_cost=with_data.get('software_cost'),
-            with_workspace_cost=with_data.get('workspace_cost'),
-            with_income=with_data.get('income'),
-            without_rate=without_data['rate'],
-            without_sources_count=without_data['sources_count'],
-            without_has_urls=without_data['has_urls'],
-            without_software_cost=without_data.get('software_cost'),
-            without_workspace_cost=without_data.get('workspace_cost'),
-            without_income=without_data.get('income')
-        )
-        comparisons.append(comparison)
-    
-    return comparisons
-
-
-def create_visualizations(comparisons: List[ComparisonResult], output_dir: Path):
-    """Create all visualization graphs as individual files and combined PDF"""
-    # Set style
+        rows.append((
+            with_result.get('experience_level') or without_result.get('experience_level', 'Unknown'),
+            with_result.get('skills') or without_result.get('skills') or 'N/A',
+            with_data['rate'],
+            with_data['sources_count'] or 0,
+            with_data['has_urls'],
+            with_data.get('software_cost'),
+            with_data.get('workspace_cost'),
+            with_data.get('income'),
+            without_data['rate'],
+            without_data['sources_count'] or 0,
+            without_data['has_urls'],
+            without_data.get('software_cost'),
+            without_data.get('workspace_cost'),
+            without_data.get('income'),
+        ))
+    
+    return ComparisonTable.from_rows(rows), stats
+
+
+def build_chart(name: str, comparisons: ComparisonTable):
+    """Draw one of CHART_NAMES onto a new figure and return the figure"""
+    load_plotting()
     plt.style.use('seaborn-v0_8-darkgrid')
-    colors = {
-        'with': '#2E86AB',      # Blue
-        'without': '#A23B72',   # Purple
-        'positive': '#06A77D',  # Green
-        'negative': '#D84654',  # Red
-        'neutral': '#F18F01'    # Orange
-    }
+    colors = CHART_COLORS
+    
+    if name == '01_rate_comparison':
+        fig, ax = plt.subplots(figsize=(14, 8))
+        create_rate_comparison_chart(ax, comparisons, colors)
+        fig.suptitle('Hourly Rate Comparison', fontsize=18, fontweight='bold', y=0.98)
+    elif name == '02_rate_difference':
+        fig, ax = plt.subplots(figsize=(12, 8))
+        create_rate_difference_chart(ax, comparisons, colors)
+        fig.suptitle('Rate Difference Analysis', fontsize=18, fontweight='bold', y=0.98)
+    elif name == '03_cost_comparison':
+        fig, ax = plt.subplots(figsize=(12, 8))
+        create_cost_comparison_chart(ax, comparisons, colors)
+        fig.suptitle('Monthly Cost Estimates', fontsize=18, fontweight='bold', y=0.98)
+    elif name == '04_source_comparison':
+        fig, ax = plt.subplots(figsize=(12, 8))
+        create_source_comparison_chart(ax, comparisons, colors)
+        fig.suptitle('Data Sources Analysis', fontsize=18, fontweight='bold', y=0.98)
+    elif name == '05_income_comparison':
+        fig, ax = plt.subplots(figsize=(12, 8))
+        create_income_comparison_chart(ax, comparisons, colors)
+        fig.suptitle('Monthly Income Suggestions', fontsize=18, fontweight='bold', y=0.98)
+    elif name == '06_percentage_difference':
+        fig, ax = plt.subplots(figsize=(12, 8))
+        create_percentage_difference_chart(ax, comparisons, colors)
+        fig.suptitle('Percentage Difference Analysis', fontsize=18, fontweight='bold', y=0.98)
+    elif name == '07_summary_stats':
+        fig, ax = plt.subplots(figsize=(12, 10))
+        create_summary_stats(ax, comparisons, colors)
+        fig.suptitle('Summary Statistics', fontsize=18, fontweight='bold', y=0.98)
+    elif name == '08_detailed_rate_analysis':
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 7))
+        create_detailed_rate_charts(ax1, ax2, comparisons, colors)
+        fig.suptitle('Detailed Rate Progression Analysis', fontsize=18, fontweight='bold', y=0.98)
+    else:
+        raise ValueError(f'Unknown chart: {name}')
     
+    return fig
+
+
+def render_chart(comparisons: ComparisonTable, name: str, path: Optional[Path]):
+    """
+    Build one chart and, if path is given, save it as a 300-dpi PNG.
+
+    Runs in a worker process when rendering in parallel; the figure itself is
+    returned (pickled across processes) so the PDF can embed it as vectors.
+    """
+    fig = build_chart(name, comparisons)
+    if path is not None:
+        fig.savefig(path, dpi=300, bbox_inches='tight', facecolor='white')
+    plt.close(fig)
+    return fig
+
+
+def create_visualizations(comparisons: ComparisonTable, output_dir: Path,
+                          workers: Optional[int] = None, png: bool = True,
+                          cache: Optional[ChartCache] = None, max_disk_bytes: Optional[int] = None):
+    """
+    Create all visualization graphs as individual files and combined PDF.
+
+    Charts found in cache are reused instead of re-rendered; with
+    max_disk_bytes, older runs in comparison_visual/ are deleted to fit it.
+    """
     # Create comparison_visual subdirectory
     visual_dir = output_dir / 'comparison_visual'
     visual_dir.mkdir(exist_ok=True, parents=True)
     
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    
-    print(f"\n  {Colors.CYAN}Generating individual chart images...{Colors.END}\n")
-    
-    # Store paths for PDF compilation
-    image_paths = []
-    
-    # 1. Hourly Rate Comparison (Main chart)
-    fig, ax = plt.subplots(figsize=(14, 8))
-    create_rate_comparison_chart(ax, comparisons, colors)
-    fig.suptitle('Hourly Rate Comparison', fontsize=18, fontweight='bold', y=0.98)
-    path = visual_dir / f'01_rate_comparison_{timestamp}.png'
-    plt.savefig(path, dpi=300, bbox_inches='tight', facecolor='white')
-    image_paths.append(path)
-    print(f"  ✓ Saved: {path.name}")
-    plt.close()
-    
-    # 2. Rate Difference Chart
-    fig, ax = plt.subplots(figsize=(12, 8))
-    create_rate_difference_chart(ax, comparisons, colors)
-    fig.suptitle('Rate Difference Analysis', fontsize=18, fontweight='bold', y=0.98)
-    path = visual_dir / f'02_rate_difference_{timestamp}.png'
-    plt.savefig(path, dpi=300, bbox_inches='tight', facecolor='white')
-    image_paths.append(path)
-    print(f"  ✓ Saved: {path.name}")
-    plt.close()
-    
-    # 3. Cost Comparison
-    fig, ax = plt.subplots(figsize=(12, 8))
-    create_cost_comparison_chart(ax, comparisons, colors)
-    fig.suptitle('Monthly Cost Estimates', fontsize=18, fontweight='bold', y=0.98)
-    path = visual_dir / f'03_cost_comparison_{timestamp}.png'
-    plt.savefig(path, dpi=300, bbox_inches='tight', facecolor='white')
-    image_paths.append(path)
-    print(f"  ✓ Saved: {path.name}")
-    plt.close()
-    
-    # 4. Source Count Comparison
-    fig, ax = plt.subplots(figsize=(12, 8))
-    create_source_comparison_chart(ax, comparisons, colors)
-    fig.suptitle('Data Sources Analysis', fontsize=18, fontweight='bold', y=0.98)
-    path = visual_dir / f'04_source_comparison_{timestamp}.png'
-    plt.savefig(path, dpi=300, bbox_inches='tight', facecolor='white')
-    image_paths.append(path)
-    print(f"  ✓ Saved: {path.name}")
-    plt.close()
-    
-    # 5. Income Comparison
-    fig, ax = plt.subplots(figsize=(12, 8))
-    create_income_comparison_chart(ax, comparisons, colors)
-    fig.suptitle('Monthly Income Suggestions', fontsize=18, fontweight='bold', y=0.98)
-    path = visual_dir / f'05_income_comparison_{timestamp}.png'
-    plt.savefig(path, dpi=300, bbox_inches='tight', facecolor='white')
-    image_paths.append(path)
-    print(f"  ✓ Saved: {path.name}")
-    plt.close()
-    
-    # 6. Percentage Difference
-    fig, ax = plt.subplots(figsize=(12, 8))
-    create_percentage_difference_chart(ax, comparisons, colors)
-    fig.suptitle('Percentage Difference Analysis', fontsize=18, fontweight='bold', y=0.98)
-    path = visual_dir / f'06_percentage_difference_{timestamp}.png'
-    plt.savefig(path, dpi=300, bbox_inches='tight', facecolor='white')
-    image_paths.append(path)
-    print(f"  ✓ Saved: {path.name}")
-    plt.close()
-    
-    # 7. Summary Statistics
-    fig, ax = plt.subplots(figsize=(12, 10))
-    create_summary_stats(ax, comparisons, colors)
-    fig.suptitle('Summary Statistics', fontsize=18, fontweight='bold', y=0.98)
-    path = visual_dir / f'07_summary_stats_{timestamp}.png'
-    plt.savefig(path, dpi=300, bbox_inches='tight', facecolor='white')
-    image_paths.append(path)
-    print(f"  ✓ Saved: {path.name}")
-    plt.close()
-    
-    # 8. Detailed Rate Analysis
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 7))
-    create_detailed_rate_charts(ax1, ax2, comparisons, colors)
-    fig.suptitle('Detailed Rate Progression Analysis', fontsize=18, fontweight='bold', y=0.98)
-    path = visual_dir / f'08_detailed_rate_analysis_{timestamp}.png'
-    plt.savefig(path, dpi=300, bbox_inches='tight', facecolor='white')
-    image_paths.append(path)
-    print(f"  ✓ Saved: {path.name}")
-    plt.close()
-    
-    print(f"\n  {Colors.GREEN}✓ All individual charts saved to: {visual_dir}{Colors.END}\n")
+    workers = default_workers(len(CHART_NAMES)) if workers is None else workers
+    
+    print(f"\n  {Colors.CYAN}Generating individual chart images ({workers} worker{'s' if workers > 1 else ''})...{Colors.END}\n")
+    
+    # The comparisons go to each worker once; figures come back in chart order for the PDF
+    start = time.perf_counter()
+    jobs = [(name, visual_dir / f'{name}_{timestamp}.png' if png else None) for name in CHART_NAMES]
+    params = {'dpi': 300, 'colors': CHART_COLORS, 'source': source_digest(Path(__file__))}
+    keys = [chart_key(name, comparisons, CHART_INPUTS[name], params) for name in CHART_NAMES]
+    figures = render_cached(cache, keys, render_chart, jobs, comparisons, workers)
+    cached = f", {cache.hits} from cache" if cache else ""
+    if png:
+        for _, path in jobs:
+            print(f"  ✓ Saved: {path.name}")
+        print(f"\n  {Colors.GREEN}✓ All individual charts saved to: {visual_dir} ({time.perf_counter() - start:.1f}s{cached}){Colors.END}\n")
+    else:
+        print(f"  {Colors.GREEN}✓ Rendered {len(figures)} charts ({time.perf_counter() - start:.1f}s{cached}){Colors.END}\n")
     
     # Create combined PDF
     print(f"  {Colors.CYAN}Creating combined PDF report...{Colors.END}")
-    create_combined_pdf(image_paths, visual_dir / f'FULL_REPORT_{timestamp}.pdf', comparisons)
+    create_combined_pdf(figures, visual_dir / f'FULL_REPORT_{timestamp}.pdf', comparisons)
+    
+    if max_disk_bytes is not None:
+        removed, freed = collect_garbage(visual_dir, max_disk_bytes)
+        if cache:
+            cache.evict()
+        if removed:
+            print(f"  {Colors.YELLOW}Removed {removed} superseded files ({freed / 1024 / 1024:.1f} MB){Colors.END}\n")
     
     return visual_dir
 
 
 def create_rate_comparison_chart(ax, comparisons, colors):
     """Create main hourly rate comparison bar chart"""
-    levels = [c.experience_level for c in comparisons]
-    with_rates = [c.with_rate or 0 for c in comparisons]
-    without_rates = [c.without_rate or 0 for c in comparisons]
+    labels = comparisons.labels()
+    with_rates = np.nan_to_num(comparisons.with_rate)
+    without_rates = np.nan_to_num(comparisons.without_rate)
     
-    x = np.arange(len(levels))
+    x = np.arange(len(labels))
     width = 0.35
     
     bars1 = ax.bar(x - width/2, with_rates, width, label='With Grounding', 
@@ -283,7 +508,7 @@ def create_rate_comparison_chart(ax, comparisons, colors):
     ax.set_ylabel('Hourly Rate ($)', fontsize=12, fontweight='bold')
     ax.set_title('Hourly Rate Comparison by Experience Level', fontsize=14, fontweight='bold', pad=20)
     ax.set_xticks(x)
-    ax.set_xticklabels(levels, rotation=0, ha='center')
+    ax.set_xticklabels(labels, rotation=45, ha='right', fontsize=9)
     ax.legend(loc='upper left', fontsize=11, framealpha=0.95)
     ax.grid(True, alpha=0.3, axis='y')
     ax.set_axisbelow(True)
@@ -291,17 +516,18 @@ def create_rate_comparison_chart(ax, comparisons, colors):
 
 def create_rate_difference_chart(ax, comparisons, colors):
     """Create chart showing rate differences with clear explanations"""
-    levels = [c.experience_level for c in comparisons]
-    differences = [c.rate_difference or 0 for c in comparisons]
+    labels = comparisons.labels()
+    differences = np.nan_to_num(comparisons.rate_difference)
     
     # Get the actual rates for context
-    with_rates = [c.with_rate or 0 for c in comparisons]
-    without_rates = [c.without_rate or 0 for c in comparisons]
+    with_rates = np.nan_to_num(comparisons.with_rate)
+    without_rates = np.nan_to_num(comparisons.without_rate)
     
-    bar_colors = [colors['positive'] if d > 0 else colors['negative'] if d < 0 else colors['neutral'] 
-                  for d in differences]
+    bar_colors = np.select([differences > 0, differences < 0],
+                           [colors['positive'], colors['negative']], colors['neutral']).tolist()
     
-    bars = ax.barh(levels, differences, color=bar_colors, alpha=0.8, edgecolor='black', linewidth=1.5)
+    y = np.arange(len(labels))
+    bars = ax.barh(y, differences, color=bar_colors, alpha=0.8, edgecolor='black', linewidth=1.5)
     
     # Add detailed value labels showing the comparison
     for i, (bar, diff, with_r, without_r) in enumerate(zip(bars, differences, with_rates, without_rates)):
@@ -322,6 +548,8 @@ def create_rate_difference_chart(ax, comparisons, colors):
                    bbox=dict(boxstyle='round,pad=0.4', facecolor='white', 
                             alpha=0.95, edgecolor='black', linewidth=1))
     
+    ax.set_yticks(y)
+    ax.set_yticklabels(labels, fontsize=9)
     ax.axvline(x=0, color='black', linestyle='-', linewidth=2)
     ax.set_xlabel('Rate Difference ($/hr)', fontsize=12, fontweight='bold')
     ax.set_title('Hourly Rate Difference\n(Positive = With Grounding gives MORE | Negative = With Grounding gives LESS)', 
@@ -340,14 +568,14 @@ def create_rate_difference_chart(ax, comparisons, colors):
 
 def create_cost_comparison_chart(ax, comparisons, colors):
     """Create stacked bar chart for cost comparison"""
-    levels = [c.experience_level for c in comparisons]
+    labels = comparisons.labels()
     
-    with_sw = [c.with_software_cost or 0 for c in comparisons]
-    with_ws = [c.with_workspace_cost or 0 for c in comparisons]
-    without_sw = [c.without_software_cost or 0 for c in comparisons]
-    without_ws = [c.without_workspace_cost or 0 for c in comparisons]
+    with_sw = np.nan_to_num(comparisons.with_software_cost)
+    with_ws = np.nan_to_num(comparisons.with_workspace_cost)
+    without_sw = np.nan_to_num(comparisons.without_software_cost)
+    without_ws = np.nan_to_num(comparisons.without_workspace_cost)
     
-    x = np.arange(len(levels))
+    x = np.arange(len(labels))
     width = 0.35
     
     # With grounding stacks
@@ -366,7 +594,7 @@ def create_cost_comparison_chart(ax, comparisons, colors):
     ax.set_ylabel('Monthly Cost ($)', fontsize=11, fontweight='bold')
     ax.set_title('Monthly Cost Estimates', fontsize=12, fontweight='bold', pad=15)
     ax.set_xticks(x)
-    ax.set_xticklabels(levels, rotation=45, ha='right', fontsize=9)
+    ax.set_xticklabels(labels, rotation=45, ha='right', fontsize=9)
     ax.legend(fontsize=8, loc='upper left', ncol=2)
     ax.grid(True, alpha=0.3, axis='y')
     ax.set_axisbelow(True)
@@ -374,11 +602,11 @@ def create_cost_comparison_chart(ax, comparisons, colors):
 
 def create_source_comparison_chart(ax, comparisons, colors):
     """Create chart comparing source counts"""
-    levels = [c.experience_level for c in comparisons]
-    with_sources = [c.with_sources_count for c in comparisons]
-    without_sources = [c.without_sources_count for c in comparisons]
+    labels = comparisons.labels()
+    with_sources = comparisons.with_sources_count
+    without_sources = comparisons.without_sources_count
     
-    x = np.arange(len(levels))
+    x = np.arange(len(labels))
     width = 0.35
     
     bars1 = ax.bar(x - width/2, with_sources, width, label='With Grounding',
@@ -399,7 +627,7 @@ def create_source_comparison_chart(ax, comparisons, colors):
     ax.set_ylabel('Number of Sources', fontsize=11, fontweight='bold')
     ax.set_title('Data Sources Count', fontsize=12, fontweight='bold', pad=15)
     ax.set_xticks(x)
-    ax.set_xticklabels(levels, rotation=45, ha='right', fontsize=9)
+    ax.set_xticklabels(labels, rotation=45, ha='right', fontsize=9)
     ax.legend(fontsize=9)
     ax.grid(True, alpha=0.3, axis='y')
     ax.set_axisbelow(True)
@@ -407,11 +635,11 @@ def create_source_comparison_chart(ax, comparisons, colors):
 
 def create_income_comparison_chart(ax, comparisons, colors):
     """Create income suggestion comparison"""
-    levels = [c.experience_level for c in comparisons]
-    with_income = [c.with_income or 0 for c in comparisons]
-    without_income = [c.without_income or 0 for c in comparisons]
+    labels = comparisons.labels()
+    with_income = np.nan_to_num(comparisons.with_income)
+    without_income = np.nan_to_num(comparisons.without_income)
     
-    x = np.arange(len(levels))
+    x = np.arange(len(labels))
     width = 0.35
     
     bars1 = ax.bar(x - width/2, with_income, width, label='With Grounding',
@@ -432,7 +660,7 @@ def create_income_comparison_chart(ax, comparisons, colors):
     ax.set_ylabel('Monthly Income ($)', fontsize=11, fontweight='bold')
     ax.set_title('Suggested Monthly Income', fontsize=12, fontweight='bold', pad=15)
     ax.set_xticks(x)
-    ax.set_xticklabels(levels, rotation=45, ha='right', fontsize=9)
+    ax.set_xticklabels(labels, rotation=45, ha='right', fontsize=9)
     ax.legend(fontsize=9)
     ax.grid(True, alpha=0.3, axis='y')
     ax.set_axisbelow(True)
@@ -440,17 +668,18 @@ def create_income_comparison_chart(ax, comparisons, colors):
 
 def create_percentage_difference_chart(ax, comparisons, colors):
     """Create percentage difference chart with crystal clear comparison labels"""
-    levels = [c.experience_level for c in comparisons]
-    percentages = [c.rate_diff_percent or 0 for c in comparisons]
+    labels = comparisons.labels()
+    percentages = np.nan_to_num(comparisons.rate_diff_percent)
     
     # Get actual rates for complete context
-    with_rates = [c.with_rate or 0 for c in comparisons]
-    without_rates = [c.without_rate or 0 for c in comparisons]
+    with_rates = np.nan_to_num(comparisons.with_rate)
+    without_rates = np.nan_to_num(comparisons.without_rate)
     
-    bar_colors = [colors['positive'] if p > 0 else colors['negative'] if p < 0 else colors['neutral'] 
-                  for p in percentages]
+    bar_colors = np.select([percentages > 0, percentages < 0],
+                           [colors['positive'], colors['negative']], colors['neutral']).tolist()
     
-    bars = ax.barh(levels, percentages, color=bar_colors, alpha=0.8, edgecolor='black', linewidth=1.5)
+    y = np.arange(len(labels))
+    bars = ax.barh(y, percentages, color=bar_colors, alpha=0.8, edgecolor='black', linewidth=1.5)
     
     # Add comprehensive value labels
     for i, (bar, pct, with_r, without_r) in enumerate(zip(bars, percentages, with_rates, without_rates)):
@@ -471,6 +700,8 @@ def create_percentage_difference_chart(ax, comparisons, colors):
                    bbox=dict(boxstyle='round,pad=0.4', facecolor='white', 
                             alpha=0.95, edgecolor='black', linewidth=1))
     
+    ax.set_yticks(y)
+    ax.set_yticklabels(labels, fontsize=9)
     ax.axvline(x=0, color='black', linestyle='-', linewidth=2)
     ax.set_xlabel('Percentage Difference (%)', fontsize=12, fontweight='bold')
     ax.set_title('Percentage Rate Difference\n(Positive = WITH Grounding is higher than WITHOUT | Negative = WITH Grounding is lower)', 
@@ -492,17 +723,17 @@ def create_summary_stats(ax, comparisons, colors):
     ax.axis('off')
     
     # Calculate statistics
-    with_rates = [c.with_rate for c in comparisons if c.with_rate]
-    without_rates = [c.without_rate for c in comparisons if c.without_rate]
+    with_rates = comparisons.present('with_rate')
+    without_rates = comparisons.present('without_rate')
     
-    with_urls = sum(1 for c in comparisons if c.with_has_urls)
-    without_urls = sum(1 for c in comparisons if c.without_has_urls)
+    with_urls = int(comparisons.with_has_urls.sum())
+    without_urls = int(comparisons.without_has_urls.sum())
     
     stats_text = "SUMMARY STATISTICS\n" + "="*40 + "\n\n"
     
-    if with_rates and without_rates:
-        avg_with = sum(with_rates) / len(with_rates)
-        avg_without = sum(without_rates) / len(without_rates)
+    if len(with_rates) and len(without_rates):
+        avg_with = with_rates.mean()
+        avg_without = without_rates.mean()
         avg_diff = avg_with - avg_without
         avg_diff_pct = (avg_diff / avg_without) * 100 if avg_without > 0 else 0
         
@@ -512,8 +743,8 @@ def create_summary_stats(ax, comparisons, colors):
         stats_text += f"  • Difference:        ${avg_diff:+.2f} ({avg_diff_pct:+.1f}%)\n\n"
         
         stats_text += f"Rate Range:\n"
-        stats_text += f"  • With:    ${min(with_rates):.2f} - ${max(with_rates):.2f}\n"
-        stats_text += f"  • Without: ${min(without_rates):.2f} - ${max(without_rates):.2f}\n\n"
+        stats_text += f"  • With:    ${with_rates.min():.2f} - ${with_rates.max():.2f}\n"
+        stats_text += f"  • Without: ${without_rates.min():.2f} - ${without_rates.max():.2f}\n\n"
     
     stats_text += f"Source Analysis:\n"
     stats_text += f"  • With web URLs (Grounding):  {with_urls}/{len(comparisons)}\n"
@@ -534,16 +765,19 @@ def create_summary_stats(ax, comparisons, colors):
 
 def create_detailed_rate_charts(ax1, ax2, comparisons, colors):
     """Create detailed rate analysis charts"""
-    levels = [c.experience_level for c in comparisons]
-    with_rates = [c.with_rate or 0 for c in comparisons]
-    without_rates = [c.without_rate or 0 for c in comparisons]
+    labels = comparisons.labels()
+    with_rates = np.nan_to_num(comparisons.with_rate)
+    without_rates = np.nan_to_num(comparisons.without_rate)
     
     # Line chart
-    ax1.plot(levels, with_rates, 'o-', label='With Grounding', 
+    x_pos = np.arange(len(labels))
+    ax1.plot(x_pos, with_rates, 'o-', label='With Grounding', 
             color=colors['with'], linewidth=3, markersize=10, markeredgecolor='black', markeredgewidth=2)
-    ax1.plot(levels, without_rates, 's-', label='Without Grounding',
+    ax1.plot(x_pos, without_rates, 's-', label='Without Grounding',
             color=colors['without'], linewidth=3, markersize=10, markeredgecolor='black', markeredgewidth=2)
     
+    ax1.set_xticks(x_pos)
+    ax1.set_xticklabels(labels, rotation=45, ha='right')
     ax1.set_xlabel('Experience Level', fontsize=12, fontweight='bold')
     ax1.set_ylabel('Hourly Rate ($)', fontsize=12, fontweight='bold')
     ax1.set_title('Rate Progression Across Experience Levels', fontsize=14, fontweight='bold')
@@ -552,7 +786,6 @@ def create_detailed_rate_charts(ax1, ax2, comparisons, colors):
     ax1.set_axisbelow(True)
     
     # Scatter plot with trend
-    x_pos = np.arange(len(levels))
     ax2.scatter(x_pos, with_rates, s=200, alpha=0.6, color=colors['with'], 
                edgecolors='black', linewidth=2, label='With Grounding')
     ax2.scatter(x_pos, without_rates, s=200, alpha=0.6, color=colors['without'],
@@ -569,7 +802,7 @@ def create_detailed_rate_charts(ax1, ax2, comparisons, colors):
         ax2.plot(x_pos, p2(x_pos), "--", color=colors['without'], alpha=0.8, linewidth=2)
     
     ax2.set_xticks(x_pos)
-    ax2.set_xticklabels(levels, rotation=45, ha='right')
+    ax2.set_xticklabels(labels, rotation=45, ha='right')
     ax2.set_xlabel('Experience Level', fontsize=12, fontweight='bold')
     ax2.set_ylabel('Hourly Rate ($)', fontsize=12, fontweight='bold')
     ax2.set_title('Rate Distribution with Trends', fontsize=14, fontweight='bold')
@@ -578,8 +811,9 @@ def create_detailed_rate_charts(ax1, ax2, comparisons, colors):
     ax2.set_axisbelow(True)
 
 
-def create_combined_pdf(image_paths: List[Path], output_path: Path, comparisons: List[ComparisonResult]):
-    """Combine all images into a single PDF report with beautiful, well-spaced cover page"""
+def create_combined_pdf(figures: List[Any], output_path: Path, comparisons: ComparisonTable):
+    """Combine all chart figures into a single vector PDF report with a well-spaced cover page"""
+    load_plotting()
     from matplotlib.backends.backend_pdf import PdfPages
     
     with PdfPages(output_path) as pdf:
@@ -592,8 +826,8 @@ def create_combined_pdf(image_paths: List[Path], output_path: Path, comparisons:
         ax.set_ylim(0, 1)
         
         # Calculate statistics
-        with_rates = [c.with_rate for c in comparisons if c.with_rate]
-        without_rates = [c.without_rate for c in comparisons if c.without_rate]
+        with_rates = comparisons.present('with_rate')
+        without_rates = comparisons.present('without_rate')
         
         # Title section with colored box
         title_box = plt.Rectangle((0.08, 0.85), 0.84, 0.11, 
@@ -617,9 +851,9 @@ def create_combined_pdf(image_paths: List[Path], output_path: Path, comparisons:
         ax.plot([0.1, 0.9], [0.79, 0.79], 'k-', linewidth=1.5, transform=ax.transAxes)
         
         # Main statistics section
-        if with_rates and without_rates:
-            avg_with = sum(with_rates) / len(with_rates)
-            avg_without = sum(without_rates) / len(without_rates)
+        if len(with_rates) and len(without_rates):
+            avg_with = with_rates.mean()
+            avg_without = without_rates.mean()
             avg_diff = avg_with - avg_without
             avg_diff_pct = (avg_diff / avg_without) * 100 if avg_without > 0 else 0
             
@@ -692,11 +926,11 @@ def create_combined_pdf(image_paths: List[Path], output_path: Path, comparisons:
         ax.add_patch(info_box)
         
         # Get experience levels
-        exp_levels = ', '.join([c.experience_level.title() for c in comparisons])
+        exp_levels = ', '.join(np.char.title(comparisons.experience_level))
         
         info_text = f"Generated: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}\n\n"
         info_text += f"Scenarios Compared: {len(comparisons)}\n"
-        info_text += f"Charts Included: {len(image_paths)}\n\n"
+        info_text += f"Charts Included: {len(figures)}\n\n"
         info_text += f"Experience Levels:\n{exp_levels}"
         
         ax.text(0.5, info_y - 0.018, info_text,
@@ -737,22 +971,13 @@ def create_combined_pdf(image_paths: List[Path], output_path: Path, comparisons:
         pdf.savefig(fig, bbox_inches='tight')
         plt.close()
         
-        # Add each chart image with page numbers
-        for idx, img_path in enumerate(image_paths, start=2):
-            img = plt.imread(str(img_path))
-            fig = plt.figure(figsize=(8.5, 11))
-            
-            # Add chart
-            ax = fig.add_subplot(111)
-            ax.imshow(img)
-            ax.axis('off')
-            
-            # Add page number
-            fig.text(0.5, 0.02, f'Page {idx} of {len(image_paths) + 1}',
+        # Add each chart as a vector page with page numbers
+        for idx, fig in enumerate(figures, start=2):
+            fig.text(0.5, 0.005, f'Page {idx} of {len(figures) + 1}',
                     ha='center', va='bottom', fontsize=9, color='#999999')
             
-            pdf.savefig(fig, bbox_inches='tight')
-            plt.close()
+            pdf.savefig(fig, bbox_inches='tight', facecolor='white')
+            plt.close(fig)
         
         # Set PDF metadata
         d = pdf.infodict()
@@ -774,7 +999,21 @@ def print_header():
     print()
 
 
-def print_comparison_table(comparisons: List[ComparisonResult]):
+def print_join_summary(stats: JoinStats):
+    """Print how scenarios were matched between the two runs"""
+    matched = stats.matched + stats.matched_by_level
+    print(f"  Scenarios matched:      {matched} ({stats.with_rows} with / {stats.without_rows} without)")
+    if stats.matched_by_level:
+        print(f"  {Colors.YELLOW}Matched by level only:  {stats.matched_by_level} (no skills recorded on one side){Colors.END}")
+    if stats.with_only or stats.without_only:
+        print(f"  {Colors.YELLOW}Unmatched:              {stats.with_only} with grounding only, "
+              f"{stats.without_only} without grounding only{Colors.END}")
+    if stats.repeated_keys:
+        print(f"  {Colors.YELLOW}Repeated scenarios:     {stats.repeated_keys} (paired in run order){Colors.END}")
+    print()
+
+
+def print_comparison_table(comparisons: ComparisonTable):
     """Print main comparison table"""
     print(f"{Colors.BOLD}{'='*80}{Colors.END}")
     print(f"{Colors.BOLD}  HOURLY RATE COMPARISON{Colors.END}")
@@ -782,10 +1021,10 @@ def print_comparison_table(comparisons: List[ComparisonResult]):
     print()
     
     # Header
-    print(f"  {'Level':<15} {'With Grounding':>15} {'Without':>15} {'Difference':>15} {'% Diff':>10}")
-    print(f"  {'-'*15} {'-'*15} {'-'*15} {'-'*15} {'-'*10}")
+    print(f"  {'Level':<13} {'Skills':<28} {'With Grounding':>15} {'Without':>15} {'Difference':>12} {'% Diff':>9}")
+    print(f"  {'-'*13} {'-'*28} {'-'*15} {'-'*15} {'-'*12} {'-'*9}")
     
-    for c in comparisons:
+    for c in comparisons.rows():
         with_str = f"${c.with_rate:.2f}/hr" if c.with_rate else "N/A"
         without_str = f"${c.without_rate:.2f}/hr" if c.without_rate else "N/A"
         
@@ -804,22 +1043,23 @@ def print_comparison_table(comparisons: List[ComparisonResult]):
             pct_str = "N/A"
             diff_color = Colors.YELLOW
         
-        print(f"  {c.experience_level:<15} {with_str:>15} {without_str:>15} {diff_color}{diff_str:>15}{Colors.END} {diff_color}{pct_str:>10}{Colors.END}")
+        print(f"  {c.experience_level:<13} {short_skills(c.skills, 28):<28} {with_str:>15} {without_str:>15} "
+              f"{diff_color}{diff_str:>12}{Colors.END} {diff_color}{pct_str:>9}{Colors.END}")
     
     print()
 
 
-def print_cost_comparison(comparisons: List[ComparisonResult]):
+def print_cost_comparison(comparisons: ComparisonTable):
     """Print cost breakdown comparison"""
     print(f"{Colors.BOLD}{'='*80}{Colors.END}")
     print(f"{Colors.BOLD}  MONTHLY COST ESTIMATES{Colors.END}")
     print(f"{Colors.BOLD}{'='*80}{Colors.END}")
     print()
     
-    print(f"  {'Level':<15} {'Software (W/WO)':>20} {'Workspace (W/WO)':>20} {'Income (W/WO)':>20}")
-    print(f"  {'-'*15} {'-'*20} {'-'*20} {'-'*20}")
+    print(f"  {'Level':<13} {'Skills':<28} {'Software (W/WO)':>19} {'Workspace (W/WO)':>19} {'Income (W/WO)':>19}")
+    print(f"  {'-'*13} {'-'*28} {'-'*19} {'-'*19} {'-'*19}")
     
-    for c in comparisons:
+    for c in comparisons.rows():
         sw_with = f"${c.with_software_cost:.0f}" if c.with_software_cost else "N/A"
         sw_without = f"${c.without_software_cost:.0f}" if c.without_software_cost else "N/A"
         
@@ -829,22 +1069,23 @@ def print_cost_comparison(comparisons: List[ComparisonResult]):
         inc_with = f"${c.with_income:.0f}" if c.with_income else "N/A"
         inc_without = f"${c.without_income:.0f}" if c.without_income else "N/A"
         
-        print(f"  {c.experience_level:<15} {sw_with:>8}/{sw_without:<10} {ws_with:>8}/{ws_without:<10} {inc_with:>8}/{inc_without:<10}")
+        print(f"  {c.experience_level:<13} {short_skills(c.skills, 28):<28} "
+              f"{sw_with:>8}/{sw_without:<10} {ws_with:>8}/{ws_without:<10} {inc_with:>8}/{inc_without:<10}")
     
     print()
 
 
-def print_source_comparison(comparisons: List[ComparisonResult]):
+def print_source_comparison(comparisons: ComparisonTable):
     """Print source count comparison"""
     print(f"{Colors.BOLD}{'='*80}{Colors.END}")
     print(f"{Colors.BOLD}  DATA SOURCES ANALYSIS{Colors.END}")
     print(f"{Colors.BOLD}{'='*80}{Colors.END}")
     print()
     
-    print(f"  {'Level':<15} {'With Grounding':>20} {'Without Grounding':>20} {'Web URLs':>15}")
-    print(f"  {'-'*15} {'-'*20} {'-'*20} {'-'*15}")
+    print(f"  {'Level':<13} {'Skills':<28} {'With Grounding':>17} {'Without Grounding':>18} {'Web URLs':>10}")
+    print(f"  {'-'*13} {'-'*28} {'-'*17} {'-'*18} {'-'*10}")
     
-    for c in comparisons:
+    for c in comparisons.rows():
         with_sources = f"{c.with_sources_count} sources"
         without_sources = f"{c.without_sources_count} sources"
         
@@ -853,12 +1094,12 @@ def print_source_comparison(comparisons: List[ComparisonResult]):
         else:
             url_status = f"{Colors.YELLOW}✗ NO{Colors.END}"
         
-        print(f"  {c.experience_level:<15} {with_sources:>20} {without_sources:>20} {url_status:>15}")
+        print(f"  {c.experience_level:<13} {short_skills(c.skills, 28):<28} {with_sources:>17} {without_sources:>18} {url_status:>10}")
     
     print()
 
 
-def print_insights(comparisons: List[ComparisonResult], with_data: Dict, without_data: Dict):
+def print_insights(comparisons: ComparisonTable, with_data: Dict, without_data: Dict):
     """Print analysis insights"""
     print(f"{Colors.BOLD}{'='*80}{Colors.END}")
     print(f"{Colors.BOLD}  KEY INSIGHTS{Colors.END}")
@@ -866,12 +1107,12 @@ def print_insights(comparisons: List[ComparisonResult], with_data: Dict, without
     print()
     
     # Calculate averages
-    with_rates = [c.with_rate for c in comparisons if c.with_rate]
-    without_rates = [c.without_rate for c in comparisons if c.without_rate]
+    with_rates = comparisons.present('with_rate')
+    without_rates = comparisons.present('without_rate')
     
-    if with_rates and without_rates:
-        avg_with = sum(with_rates) / len(with_rates)
-        avg_without = sum(without_rates) / len(without_rates)
+    if len(with_rates) and len(without_rates):
+        avg_with = with_rates.mean()
+        avg_without = without_rates.mean()
         avg_diff = avg_with - avg_without
         avg_diff_pct = (avg_diff / avg_without) * 100 if avg_without > 0 else 0
         
@@ -882,8 +1123,8 @@ def print_insights(comparisons: List[ComparisonResult], with_data: Dict, without
         print()
     
     # Source analysis
-    with_urls = sum(1 for c in comparisons if c.with_has_urls)
-    without_urls = sum(1 for c in comparisons if c.without_has_urls)
+    with_urls = int(comparisons.with_has_urls.sum())
+    without_urls = int(comparisons.without_has_urls.sum())
     
     print(f"  {Colors.CYAN}Source Quality:{Colors.END}")
     print(f"    • With Grounding has web URLs:    {with_urls}/{len(comparisons)} scenarios")
@@ -926,14 +1167,16 @@ def print_detailed_sources(with_data: Dict, without_data: Dict):
     print()
 
 
-def save_comparison_report(comparisons: List[ComparisonResult], output_path: str):
+def save_comparison_report(comparisons: ComparisonTable, output_path: str, stats: Optional[JoinStats] = None):
     """Save comparison data to JSON file"""
     report = {
         'generated_at': datetime.now().isoformat(),
         'comparisons': []
     }
+    if stats is not None:
+        report['matching'] = asdict(stats)
     
-    for c in comparisons:
+    for c in comparisons.rows():
         report['comparisons'].append({
             'experience_level': c.experience_level,
             'skills': c.skills,
@@ -970,13 +1213,52 @@ def main():
     script_dir = Path(__file__).parent
     results_dir = script_dir / 'results'
     
-    # Check for graphs-only mode
-    graphs_only = '--graphs-only' in sys.argv
+    parser = argparse.ArgumentParser(description='Compare quick estimate results with and without grounding')
+    parser.add_argument('files', nargs='*', metavar='FILE',
+                        help='<with_grounding.json> <without_grounding.json> (default: latest results); '
+                             'with --trend, any number of runs')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--graphs-only', action='store_true', help='Only generate graphs')
+    mode.add_argument('--text-only', action='store_true',
+                      help='Console tables and JSON report only; never imports matplotlib')
+    mode.add_argument('--trend', action='store_true',
+                      help='Rate drift, variance and trend per scenario across every matching run in results/')
+    parser.add_argument('--pattern', default='with_grounding_*.json',
+                        help="Runs --trend loads from results/ (default: 'with_grounding_*.json')")
+    parser.add_argument('--top', type=int, default=20, help='Scenarios listed by --trend (default: 20)')
+    parser.add_argument('-o', '--output-dir', default=str(results_dir),
+                        help='Where charts and the JSON report go (default: results/)')
+    parser.add_argument('--workers', type=int,
+                        help='Chart rendering processes (default: one per core; 1 renders serially)')
+    parser.add_argument('--no-png', action='store_true', help='Only write the PDF report, not the PNG charts')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Re-render every chart (or, with --trend, re-parse every run) instead of using the cache')
+    parser.add_argument('--max-disk-mb', type=float, default=DEFAULT_MAX_BYTES / 1024 / 1024,
+                        help='Delete the oldest report runs (and cached charts) beyond this size (default: 200)')
+    args = parser.parse_args()
+    max_disk_bytes = int(args.max_disk_mb * 1024 * 1024)
+    graphs_only = args.graphs_only
+    
+    if args.trend:
+        # Imported here since trend_analysis itself builds on this module
+        from trend_analysis import run_trend_report
+        
+        paths = [Path(f) for f in args.files] if args.files else sorted(results_dir.glob(args.pattern))
+        if len(paths) < 2:
+            print(f"{Colors.RED}Error: --trend needs at least two runs, found {len(paths)}{Colors.END}")
+            sys.exit(1)
+        output_dir = Path(args.output_dir)
+        output_dir.mkdir(exist_ok=True, parents=True)
+        print(f"Loading {len(paths)} runs...")
+        run_trend_report(paths, output_dir, not args.no_cache, args.top)
+        return
+    
+    if args.files and len(args.files) != 2:
+        parser.error('expected both <with_grounding.json> and <without_grounding.json>')
     
     # Determine input files
-    if len(sys.argv) >= 3 and not graphs_only:
-        with_grounding_file = sys.argv[1]
-        without_grounding_file = sys.argv[2]
+    if args.files:
+        with_grounding_file, without_grounding_file = args.files
     else:
         # Use latest results
         with_grounding_file = results_dir / 'latest_with_grounding.json'
@@ -996,14 +1278,14 @@ def main():
     without_data = load_json_file(str(without_grounding_file))
     
     # Compare
-    comparisons = compare_results(with_data, without_data)
+    comparisons, join_stats = compare_results(with_data, without_data)
     
     # Print report (unless graphs-only mode)
     if not graphs_only:
         print_header()
         print(f"  With Grounding Test:    {with_data.get('timestamp', 'N/A')}")
         print(f"  Without Grounding Test: {without_data.get('timestamp', 'N/A')}")
-        print()
+        print_join_summary(join_stats)
         
         print_comparison_table(comparisons)
         print_cost_comparison(comparisons)
@@ -1011,24 +1293,29 @@ def main():
         print_insights(comparisons, with_data, without_data)
         print_detailed_sources(with_data, without_data)
     
-    # Generate visualizations
-    print()
-    print(f"{Colors.BOLD}Generating visualizations...{Colors.END}")
-    results_dir.mkdir(exist_ok=True)
-    visual_dir = create_visualizations(comparisons, results_dir)
+    # Generate visualizations (unless text-only mode)
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(exist_ok=True, parents=True)
+    if not args.text_only:
+        print()
+        print(f"{Colors.BOLD}Generating visualizations...{Colors.END}")
+        cache = None if args.no_cache else ChartCache(output_dir / '.cache' / 'charts', max_disk_bytes)
+        visual_dir = create_visualizations(comparisons, output_dir, args.workers, not args.no_png,
+                                           cache, max_disk_bytes)
     
     # Save report (unless graphs-only mode)
     if not graphs_only:
-        report_path = results_dir / f'comparison_report_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
-        save_comparison_report(comparisons, str(report_path))
+        report_path = output_dir / f'comparison_report_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
+        save_comparison_report(comparisons, str(report_path), join_stats)
     
     print()
     print(f"{Colors.CYAN}{'='*80}{Colors.END}")
     print(f"{Colors.GREEN}✓ Comparison complete!{Colors.END}")
     print(f"{Colors.CYAN}{'='*80}{Colors.END}")
     print()
-    print(f"  📊 Individual charts: {visual_dir}/")
-    print(f"  📄 Combined PDF:      {visual_dir}/FULL_REPORT_*.pdf")
+    if not args.text_only:
+        print(f"  📊 Individual charts: {visual_dir}/")
+        print(f"  📄 Combined PDF:      {visual_dir}/FULL_REPORT_*.pdf")
     if not graphs_only:
         print(f"  📋 JSON report:       {report_path}")
     print()
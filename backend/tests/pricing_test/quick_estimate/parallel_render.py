@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Process-Pool Chart Rendering
+
+Matplotlib draws on one core, so rendering a report's charts one after
+another is CPU-bound. render_all() hands each chart to a worker process
+instead; the workers use the Agg backend and receive the report data once,
+through the pool initializer, rather than once per chart.
+
+Results come back in job order, so callers can build the combined PDF
+exactly as the serial path would.
+
+Usage (from a visualizer):
+    figures = render_all(render_chart, [(name, png_path), ...], (scenarios, metadata), workers=4)
+"""
+
+import os
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+_context: Any = None
+
+
+def default_workers(jobs: int) -> int:
+    """One worker per core, but never more than there are charts"""
+    return max(1, min(jobs, os.cpu_count() or 1))
+
+
+def _init_worker(context: Any):
+    import matplotlib
+    matplotlib.use('Agg')
+
+    global _context
+    _context = context
+
+
+def _render(job: Tuple[Callable, Tuple]) -> Any:
+    render, args = job
+    return render(_context, *args)
+
+
+def render_all(render: Callable, jobs: Sequence[Tuple], context: Any,
+               workers: Optional[int] = None) -> List[Any]:
+    """
+    Call render(context, *job) for every job, in a process pool when workers > 1.
+
+    render must be a module-level function so it can be pickled by reference.
+    Returns the results in the order of jobs.
+    """
+    workers = default_workers(len(jobs)) if workers is None else workers
+    if workers <= 1 or len(jobs) <= 1:
+        return [render(context, *args) for args in jobs]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs)), initializer=_init_worker,
+                             initargs=(context,)) as pool:
+        return list(pool.map(_render, [(render, args) for args in jobs]))
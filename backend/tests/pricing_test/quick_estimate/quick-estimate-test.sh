@@ -160,7 +160,7 @@ for scenario in "${TEST_SCENARIOS[@]}"; do
         fi
         FIRST_RESULT=false
         
-        echo "{\"experience_level\": \"$exp_level\", \"success\": false, \"error\": $(echo "$RESPONSE" | jq '.message // "Unknown error"')}" >> "$WITH_GROUNDING_FILE"
+        echo "{\"experience_level\": \"$exp_level\", \"skills\": \"$skills\", \"success\": false, \"error\": $(echo "$RESPONSE" | jq '.message // "Unknown error"')}" >> "$WITH_GROUNDING_FILE"
     fi
     
     sleep 1  # Rate limiting
@@ -248,7 +248,7 @@ for scenario in "${TEST_SCENARIOS[@]}"; do
         fi
         FIRST_RESULT=false
         
-        echo "{\"experience_level\": \"$exp_level\", \"success\": false, \"error\": $(echo "$RESPONSE" | jq '.message // "Unknown error"')}" >> "$WITHOUT_GROUNDING_FILE"
+        echo "{\"experience_level\": \"$exp_level\", \"skills\": \"$skills\", \"success\": false, \"error\": $(echo "$RESPONSE" | jq '.message // "Unknown error"')}" >> "$WITHOUT_GROUNDING_FILE"
     fi
     
     sleep 1  # Rate limiting
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Concurrent Quick Estimate Runner
+
+asyncio replacement for quick-estimate-test.sh. Fires the with / without
+Google Search Grounding quick-estimate calls concurrently over one pooled
+keep-alive connection set, bounded by a semaphore, instead of serially
+through curl and jq.
+
+Writes the same results/with_grounding_<ts>.json and
+results/without_grounding_<ts>.json files as the shell script (plus the
+latest_*.json symlinks, re-pointed at the new run, that compare_results.py
+and visualize_single.py default to).
+Each result additionally records:
+    wall_time_ms   time from first attempt to final response, retries included
+    retries        attempts beyond the first
+
+Requires: pip install aiohttp
+
+Usage:
+    python3 run_quick_estimate.py
+    python3 run_quick_estimate.py --concurrency 8 --retries 3
+    python3 run_quick_estimate.py --mode with          # Only the grounding run
+    API_BASE_URL=http://staging:3000/api/v1 python3 run_quick_estimate.py
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import aiohttp
+
+BASE_URL = os.environ.get('API_BASE_URL', 'http://localhost:3000/api/v1')
+TEST_PASSWORD = 'TestPassword123!'
+
+# Same scenarios as quick-estimate-test.sh: (experience_level, skills, hours_per_week, client_type)
+TEST_SCENARIOS = [
+    ('beginner', 'Logo Design, Social Media Graphics', 20, 'sme'),
+    ('intermediate', 'Branding, Print Design', 30, 'startup'),
+    ('experienced', 'UI/UX Design, Web Design', 40, 'corporate'),
+    ('expert', 'Brand Strategy, Motion Graphics', 35, 'corporate'),
+]
+
+MODES = {
+    'with': ('with_grounding', 'with_google_search_grounding', True),
+    'without': ('without_grounding', 'without_google_search_grounding', False),
+}
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+# ANSI colors
+class Colors:
+    GREEN = '\033[92m'
+    RED = '\033[91m'
+    YELLOW = '\033[93m'
+    BLUE = '\033[94m'
+    CYAN = '\033[96m'
+    BOLD = '\033[1m'
+    END = '\033[0m'
+
+
+class RequestFailed(Exception):
+    """Non-retryable error response, or retries exhausted"""
+
+    def __init__(self, message: str, retries: int):
+        super().__init__(message)
+        self.retries = retries
+
+
+async def post_json(session: aiohttp.ClientSession, url: str, payload: Dict[str, Any],
+                    headers: Optional[Dict[str, str]] = None, retries: int = 2,
+                    backoff: float = 1.0) -> Tuple[Dict[str, Any], int]:
+    """
+    POST with retries on connection errors, timeouts, 429 and 5xx.
+
+    Returns (response JSON, retries used). Backoff doubles per attempt with
+    jitter, honouring Retry-After when the server sends one.
+    """
+    attempt = 0
+    while True:
+        delay = backoff * (2 ** attempt) * (0.5 + random.random())
+        try:
+            async with session.post(url, json=payload, headers=headers) as response:
+                if response.status in RETRY_STATUSES and attempt < retries:
+                    retry_after = response.headers.get('Retry-After')
+                    if retry_after and retry_after.isdigit():
+                        delay = float(retry_after)
+                else:
+                    try:
+                        return await response.json(content_type=None), attempt
+                    except json.JSONDecodeError:
+                        raise RequestFailed(f'HTTP {response.status}: non-JSON response', attempt)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            if attempt >= retries:
+                raise RequestFailed(f'{type(e).__name__}: {e}', attempt)
+        attempt += 1
+        await asyncio.sleep(delay)
+
+
+async def setup_user(session: aiohttp.ClientSession, retries: int) -> Tuple[Any, str]:
+    """Sign up and verify a throwaway test user; returns (user_id, auth token)"""
+    email = f'quick_est_{int(time.time())}_{random.randrange(10**6)}@test.com'
+    signup, _ = await post_json(session, f'{BASE_URL}/users/signup', {
+        'email': email,
+        'password': TEST_PASSWORD,
+        'user_name': 'Quick Estimate Test',
+        'role': 'designer',
+    }, retries=retries)
+    data = signup.get('data') or {}
+    user_id = (data.get('user') or {}).get('user_id') or data.get('user_id')
+    if not user_id:
+        raise RequestFailed(f"Failed to create user: {signup.get('message', signup)}", 0)
+
+    verify, _ = await post_json(session, f'{BASE_URL}/users/verify-otp', {
+        'email': email,
+        'otp': str(data.get('otp') or '123456'),
+    }, retries=retries)
+    token = (verify.get('data') or {}).get('token')
+    if not token:
+        raise RequestFailed(f"Failed to get auth token: {verify.get('message', verify)}", 0)
+    return user_id, token
+
+
+def build_result(scenario: Tuple, response: Dict[str, Any]) -> Dict[str, Any]:
+    """The per-scenario object quick-estimate-test.sh builds with jq"""
+    exp_level, skills, hours, client_type = scenario
+    if not response.get('success'):
+        return {'experience_level': exp_level, 'skills': skills, 'success': False,
+                'error': response.get('message', 'Unknown error')}
+
+    data = response.get('data') or {}
+    sources = data.get('sources')
+    return {
+        'experience_level': exp_level,
+        'skills': skills,
+        'hours_per_week': hours,
+        'client_type': client_type,
+        'success': response['success'],
+        'estimate': data.get('estimate'),
+        'ai_researched_costs': data.get('ai_researched_costs'),
+        'ai_researched_income': data.get('ai_researched_income'),
+        'market_research': data.get('market_research'),
+        'calculation_breakdown': data.get('calculation_breakdown'),
+        'sources': sources,
+        'sources_count': len(sources or []),
+        'has_web_urls': any('http' in str(s) for s in sources or []),
+    }
+
+
+async def run_scenario(session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, scenario: Tuple,
+                       grounding: bool, user_id: Any, token: str, retries: int) -> Dict[str, Any]:
+    exp_level, skills, hours, client_type = scenario
+    url = f'{BASE_URL}/pricing/quick-estimate' + ('' if grounding else '?use_grounding=false')
+    payload = {
+        'user_id': user_id,
+        'skills': skills,
+        'experience_level': exp_level,
+        'client_type': client_type,
+        'hours_per_week': hours,
+    }
+
+    async with semaphore:
+        start = time.perf_counter()
+        try:
+            response, used = await post_json(session, url, payload,
+                                             headers={'Authorization': f'Bearer {token}'}, retries=retries)
+            result = build_result(scenario, response)
+        except RequestFailed as e:
+            result = {'experience_level': exp_level, 'skills': skills, 'success': False, 'error': str(e)}
+            used = e.retries
+        result['wall_time_ms'] = round((time.perf_counter() - start) * 1000, 1)
+        result['retries'] = used
+
+    mode = 'with' if grounding else 'without'
+    if result['success']:
+        rate = (result.get('estimate') or {}).get('recommended_rate', 'N/A')
+        print(f"{Colors.GREEN}✓ [{mode}] {exp_level}: ${rate}/hr | Sources: {result['sources_count']} "
+              f"| {result['wall_time_ms'] / 1000:.1f}s, {used} retries{Colors.END}")
+    else:
+        print(f"{Colors.RED}✗ [{mode}] {exp_level}: {result['error']}{Colors.END}")
+    return result
+
+
+def save_results(output_dir: Path, prefix: str, test_type: str, grounding: bool,
+                 results: List[Dict[str, Any]], timestamp: str, started: str) -> Path:
+    path = output_dir / f'{prefix}_{timestamp}.json'
+    with open(path, 'w') as f:
+        json.dump({
+            'test_type': test_type,
+            'timestamp': started,
+            'grounding_enabled': grounding,
+            'results': results,
+        }, f, indent=2)
+    # Re-point the link like quick-estimate-test.sh's `ln -sf`; writing through it
+    # would overwrite the older run it points at
+    latest = output_dir / f'latest_{prefix}.json'
+    latest.unlink(missing_ok=True)
+    latest.symlink_to(path.name)
+    return path
+
+
+async def run(modes: List[str], concurrency: int, retries: int, timeout: float, output_dir: Path) -> List[Path]:
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    started = datetime.now().astimezone().isoformat(timespec='seconds')
+
+    connector = aiohttp.TCPConnector(limit=concurrency, keepalive_timeout=60)
+    async with aiohttp.ClientSession(connector=connector,
+                                     timeout=aiohttp.ClientTimeout(total=timeout)) as session:
+        print(f'{Colors.YELLOW}→ Setting up test user...{Colors.END}')
+        user_id, token = await setup_user(session, retries)
+        print(f'{Colors.GREEN}✓ User created (ID: {user_id}){Colors.END}')
+        print()
+
+        semaphore = asyncio.Semaphore(concurrency)
+        runs = {mode: asyncio.gather(*(run_scenario(session, semaphore, scenario, MODES[mode][2],
+                                                    user_id, token, retries)
+                                       for scenario in TEST_SCENARIOS))
+                for mode in modes}
+        results = dict(zip(runs, await asyncio.gather(*runs.values())))
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for mode, mode_results in results.items():
+        prefix, test_type, grounding = MODES[mode]
+        paths.append(save_results(output_dir, prefix, test_type, grounding, mode_results, timestamp, started))
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the quick-estimate grounding comparison concurrently')
+    parser.add_argument('--concurrency', type=int, default=4, help='Requests in flight at once (default: 4)')
+    parser.add_argument('--retries', type=int, default=2, help='Retries per request (default: 2)')
+    parser.add_argument('--timeout', type=float, default=180, help='Per-request timeout in seconds (default: 180)')
+    parser.add_argument('--mode', choices=['both', 'with', 'without'], default='both',
+                        help='Which grounding runs to make (default: both)')
+    parser.add_argument('-o', '--output-dir', default=str(Path(__file__).parent / 'results'),
+                        help='Results directory (default: results/)')
+    args = parser.parse_args()
+
+    modes = ['with', 'without'] if args.mode == 'both' else [args.mode]
+    print(f'Base URL: {BASE_URL}')
+    print(f'Concurrency: {args.concurrency}  Retries: {args.retries}')
+    print()
+
+    start = time.perf_counter()
+    try:
+        paths = asyncio.run(run(modes, args.concurrency, args.retries, args.timeout, Path(args.output_dir)))
+    except (RequestFailed, aiohttp.ClientError) as e:
+        print(f'{Colors.RED}✗ {e}{Colors.END}')
+        raise SystemExit(1)
+
+    print()
+    print(f'{Colors.GREEN}✓ Completed in {time.perf_counter() - start:.1f}s{Colors.END}')
+    for path in paths:
+        print(f'  📄 {path}')
+    if len(paths) == 2:
+        print()
+        print('To compare results, run:')
+        print(f'  python3 {Path(__file__).parent / "compare_results.py"} {paths[0]} {paths[1]}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Multi-Run Rate Trends for Quick Estimate Results
+
+Loads every run matching a pattern (by default results/with_grounding_*.json,
+as accumulated by the nightly job), aligns scenarios across runs on the same
+(experience level, skills, occurrence) keys compare_results.py joins on, and
+computes per-scenario rate drift, variance and linear trend over a
+scenarios × runs matrix with NaN for runs a scenario failed or was missing in.
+
+Each parsed run is cached under .cache/runs keyed by the file's size and
+mtime, so adding one new run only parses that file.
+
+Used by compare_results.py --trend:
+    python3 compare_results.py --trend
+    python3 compare_results.py --trend --pattern 'without_grounding_*.json'
+    python3 compare_results.py --trend results/with_grounding_2026*.json
+"""
+
+import json
+import os
+import pickle
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from chart_cache import source_digest
+from compare_results import Colors, extract_result_data, load_json_file, scenario_keys
+
+DEFAULT_PATTERN = 'with_grounding_*.json'
+
+
+@dataclass
+class ParsedRun:
+    """The successful rates of one result file, keyed like compare_results.scenario_keys()"""
+    name: str
+    timestamp: Optional[str]
+    scenarios: int
+    keys: List[Tuple[str, Optional[str], int]]
+    rates: np.ndarray
+
+
+@dataclass
+class TrendTable:
+    """Per-scenario statistics over runs; rates is scenarios × runs, NaN where unobserved"""
+    runs: List[ParsedRun]
+    keys: List[Tuple[str, Optional[str], int]]
+    rates: np.ndarray
+    observed: np.ndarray
+    mean: np.ndarray
+    std: np.ndarray
+    variance: np.ndarray
+    first: np.ndarray
+    last: np.ndarray
+    drift: np.ndarray
+    drift_percent: np.ndarray
+    slope: np.ndarray
+
+
+def parse_run(path: Path) -> ParsedRun:
+    """Pull the scenario keys and rates out of one result file; failed scenarios are left out"""
+    data = load_json_file(str(path))
+    results = data.get('results', [])
+    keys = []
+    rates = []
+    for key, result in zip(scenario_keys(results), results):
+        rate = extract_result_data(result)['rate']
+        if rate is not None:
+            keys.append(key)
+            rates.append(rate)
+    return ParsedRun(path.name, data.get('timestamp'), len(results), keys, np.array(rates, dtype=float))
+
+
+class RunCache:
+    """<file name>.pickle holds the ParsedRun plus the size/mtime it was parsed from"""
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.version = source_digest(Path(__file__))
+        self.parsed = 0
+
+    def load(self, path: Path) -> ParsedRun:
+        stat = path.stat()
+        stamp = (stat.st_size, stat.st_mtime_ns, self.version)
+        entry = self.directory / f'{path.name}.pickle'
+        try:
+            with open(entry, 'rb') as f:
+                cached_stamp, run = pickle.load(f)
+            if cached_stamp == stamp:
+                return run
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+            pass
+
+        run = parse_run(path)
+        self.parsed += 1
+        tmp = entry.with_suffix('.tmp')
+        with open(tmp, 'wb') as f:
+            pickle.dump((stamp, run), f)
+        os.replace(tmp, entry)
+        return run
+
+
+def align_runs(runs: Sequence[ParsedRun]) -> Tuple[List[Tuple], np.ndarray]:
+    """Scenario keys in first-seen order, and their scenarios × runs rate matrix"""
+    index: Dict[Tuple, int] = {}
+    columns = []
+    for run in runs:
+        rows = np.fromiter((index.setdefault(key, len(index)) for key in run.keys),
+                           dtype=np.intp, count=len(run.keys))
+        columns.append(rows)
+
+    rates = np.full((len(index), len(runs)), np.nan)
+    for j, (run, rows) in enumerate(zip(runs, columns)):
+        rates[rows, j] = run.rates
+    return list(index), rates
+
+
+def compute_trends(runs: Sequence[ParsedRun]) -> TrendTable:
+    """
+    Drift (last - first observed rate), sample variance and least-squares
+    slope per run for every scenario; needs at least one run.
+    """
+    keys, rates = align_runs(runs)
+    mask = ~np.isnan(rates)
+    observed = mask.sum(axis=1)  # Every aligned scenario has at least one rate
+    values = np.where(mask, rates, 0.0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = values.sum(axis=1) / observed
+        squares = np.where(mask, (rates - mean[:, None]) ** 2, 0.0).sum(axis=1)
+        variance = np.where(observed > 1, squares / (observed - 1), np.nan)
+
+        # First/last observed run of each scenario
+        n_runs = rates.shape[1]
+        rows = np.arange(len(keys))
+        first = rates[rows, mask.argmax(axis=1)]
+        last = rates[rows, n_runs - 1 - mask[:, ::-1].argmax(axis=1)]
+        drift = last - first
+        drift_percent = np.where(first > 0, drift / first * 100, np.nan)
+
+        # Ordinary least squares of rate against run index, over observed runs only
+        x = np.arange(n_runs, dtype=float)
+        sx = (mask * x).sum(axis=1)
+        sxx = (mask * x ** 2).sum(axis=1)
+        sy = values.sum(axis=1)
+        sxy = (values * x).sum(axis=1)
+        denominator = observed * sxx - sx ** 2
+        slope = np.where(denominator > 0, (observed * sxy - sx * sy) / denominator, np.nan)
+
+    return TrendTable(list(runs), keys, rates, observed, mean, np.sqrt(variance), variance,
+                      first, last, drift, drift_percent, slope)
+
+
+def load_runs(paths: Sequence[Path], cache: Optional[RunCache]) -> List[ParsedRun]:
+    """Parse (or fetch from cache) every run, oldest first by file name"""
+    ordered = sorted(paths, key=lambda p: p.name)
+    return [cache.load(path) if cache else parse_run(path) for path in ordered]
+
+
+def _number(value: float) -> Optional[float]:
+    return None if np.isnan(value) else round(float(value), 4)
+
+
+def _money(value: float, signed: bool = False) -> str:
+    if np.isnan(value):
+        return 'N/A'
+    return f'${value:+.2f}' if signed else f'${value:.2f}'
+
+
+def print_trend_report(trends: TrendTable, top: int = 20):
+    """Per-run averages, then the scenarios with the largest absolute drift"""
+    runs = trends.runs
+    print()
+    print(f"{Colors.BOLD}{'='*80}{Colors.END}")
+    print(f"{Colors.BOLD}  RATE TRENDS ACROSS {len(runs)} RUNS{Colors.END}")
+    print(f"{Colors.BOLD}{'='*80}{Colors.END}")
+    print()
+
+    run_means = np.full(len(runs), np.nan)
+    for j, run in enumerate(runs):
+        if len(run.rates):
+            run_means[j] = run.rates.mean()
+    print(f"  {'Run':<40} {'Rated':>10} {'Avg Rate':>12}")
+    print(f"  {'-'*40} {'-'*10} {'-'*12}")
+    for run, run_mean in zip(runs, run_means):
+        print(f"  {run.name:<40} {f'{len(run.rates)}/{run.scenarios}':>10} {_money(run_mean):>12}")
+    print()
+
+    if not len(trends.keys):
+        print(f"  {Colors.YELLOW}No successful scenarios to compare{Colors.END}")
+        print()
+        return
+
+    order = np.argsort(-np.nan_to_num(np.abs(trends.drift), nan=-1.0), kind='stable')[:top]
+    print(f"  {'Level':<13} {'Skills':<28} {'Runs':>5} {'Mean':>9} {'Std':>8} {'Drift':>10} {'Drift %':>8} {'Trend/run':>10}")
+    print(f"  {'-'*13} {'-'*28} {'-'*5} {'-'*9} {'-'*8} {'-'*10} {'-'*8} {'-'*10}")
+    for i in order:
+        level, skills, occurrence = trends.keys[i]
+        skills = skills or 'N/A'
+        if occurrence:
+            skills = f'{skills} #{occurrence + 1}'
+        if len(skills) > 28:
+            skills = skills[:25] + '...'
+        drift = trends.drift[i]
+        color = Colors.GREEN if drift > 0 else Colors.RED if drift < 0 else Colors.YELLOW
+        pct = 'N/A' if np.isnan(trends.drift_percent[i]) else f'{trends.drift_percent[i]:+.1f}%'
+        slope = 'N/A' if np.isnan(trends.slope[i]) else f'{trends.slope[i]:+.2f}'
+        print(f"  {level:<13} {skills:<28} {trends.observed[i]:>5} {_money(trends.mean[i]):>9} "
+              f"{_money(trends.std[i]):>8} {color}{_money(drift, True):>10}{Colors.END} {pct:>8} {slope:>10}")
+    if len(trends.keys) > top:
+        print(f"  ... {len(trends.keys) - top} more scenarios in the JSON report")
+    print()
+
+    drifting = int((np.abs(np.nan_to_num(trends.drift_percent)) > 10).sum())
+    print(f"  Scenarios: {len(trends.keys)}  |  Seen in every run: {int((trends.observed == len(runs)).sum())}"
+          f"  |  Drifted > 10%: {drifting}")
+    print()
+
+
+def save_trend_report(trends: TrendTable, output_path: Path):
+    """Save per-run and per-scenario statistics to JSON"""
+    report = {
+        'generated_at': datetime.now().isoformat(),
+        'runs': [{'file': run.name, 'timestamp': run.timestamp, 'scenarios': run.scenarios,
+                  'rated': len(run.rates)} for run in trends.runs],
+        'scenarios': [],
+    }
+    for i, (level, skills, occurrence) in enumerate(trends.keys):
+        report['scenarios'].append({
+            'experience_level': level,
+            'skills': skills,
+            'occurrence': occurrence,
+            'runs_observed': int(trends.observed[i]),
+            'mean': _number(trends.mean[i]),
+            'std': _number(trends.std[i]),
+            'variance': _number(trends.variance[i]),
+            'first': _number(trends.first[i]),
+            'last': _number(trends.last[i]),
+            'drift': _number(trends.drift[i]),
+            'drift_percent': _number(trends.drift_percent[i]),
+            'slope_per_run': _number(trends.slope[i]),
+            'rates': [_number(value) for value in trends.rates[i]],
+        })
+
+    with open(output_path, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"  {Colors.GREEN}✓ Trend report saved to: {output_path}{Colors.END}")
+
+
+def run_trend_report(paths: Sequence[Path], output_dir: Path, use_cache: bool = True, top: int = 20) -> TrendTable:
+    """Load the runs, print the trend tables and write trend_report_<ts>.json"""
+    cache = RunCache(output_dir / '.cache' / 'runs') if use_cache else None
+    runs = load_runs(paths, cache)
+    if cache:
+        print(f"  Parsed {cache.parsed} of {len(runs)} runs ({len(runs) - cache.parsed} from cache)")
+    trends = compute_trends(runs)
+    print_trend_report(trends, top)
+    save_trend_report(trends, output_dir / f'trend_report_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json')
+    return trends
@@ -5,22 +5,38 @@ Single Result Visualizer for Quick Estimate API Tests
 Visualizes results from a single quick estimate API test run.
 Works with both grounded and non-grounded results.
 
+Charts are rendered in a process pool (parallel_render.py), one worker per
+core, and collected in report order. The combined PDF embeds the chart
+figures as vector pages; the 300-dpi PNGs are optional (--no-png).
+
+Charts whose input data is unchanged are reused from results/.cache/charts
+(chart_cache.py), and older runs in single_visual/ are deleted once it
+grows past --max-disk-mb.
+
 Usage:
     python3 visualize_single.py <result_file.json>
     python3 visualize_single.py  # Uses latest_with_grounding.json
+    python3 visualize_single.py --workers 1  # Render charts serially
+    python3 visualize_single.py --no-png     # PDF report only
+    python3 visualize_single.py --text-only  # Console report, no matplotlib
 """
 
+import argparse
 import json
 import sys
+import time
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+from dataclasses import dataclass, fields
 from datetime import datetime
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from matplotlib.gridspec import GridSpec
+from functools import cached_property
+from operator import attrgetter
+
 import numpy as np
 
+from chart_cache import DEFAULT_MAX_BYTES, ChartCache, chart_key, collect_garbage, render_cached, source_digest
+from parallel_render import default_workers
+
 # ANSI colors
 class Colors:
     GREEN = '\033[92m'
@@ -32,6 +48,54 @@ class Colors:
     END = '\033[0m'
 
 
+# Plotting stack, imported by load_plotting() only when charts are drawn so
+# text-only runs skip matplotlib's import and font-cache startup
+plt = None
+GridSpec = None
+
+
+def load_plotting():
+    """Import matplotlib into this module on first use"""
+    global plt, GridSpec
+    if plt is None:
+        import matplotlib.pyplot as plt
+        from matplotlib.gridspec import GridSpec
+
+
+# Chart color scheme
+CHART_COLORS = {
+    'primary': '#2E86AB',
+    'secondary': '#06A77D',
+    'accent': '#F18F01',
+    'danger': '#D84654',
+    'neutral': '#6C757D'
+}
+
+# Charts in report order; each name is also the PNG file name prefix
+CHART_NAMES = [
+    '01_hourly_rates',
+    '02_cost_breakdown',
+    '03_income_vs_expenses',
+    '04_rate_progression',
+    '05_sources_analysis',
+    '06_rate_distribution',
+    '07_summary_dashboard',
+]
+
+# ScenarioTable columns each chart draws; the chart cache hashes only these
+CHART_INPUTS = {
+    '01_hourly_rates': ('experience_level', 'skills', 'success', 'rate'),
+    '02_cost_breakdown': ('experience_level', 'skills', 'success', 'software_cost', 'workspace_cost',
+                          'equipment_cost', 'total_expenses'),
+    '03_income_vs_expenses': ('experience_level', 'skills', 'success', 'suggested_income', 'total_expenses'),
+    '04_rate_progression': ('experience_level', 'skills', 'success', 'rate', 'market_median'),
+    '05_sources_analysis': ('experience_level', 'skills', 'success', 'sources_count', 'has_web_urls'),
+    '06_rate_distribution': ('experience_level', 'skills', 'success', 'rate'),
+    '07_summary_dashboard': ('experience_level', 'skills', 'success', 'rate', 'software_cost', 'workspace_cost',
+                             'equipment_cost', 'sources_count', 'has_web_urls', 'sources'),
+}
+
+
 @dataclass
 class ScenarioResult:
     """Holds data for a single test scenario"""
@@ -51,14 +115,101 @@ class ScenarioResult:
     market_position: Optional[str]
 
 
+SCENARIO_FIELDS = tuple(f.name for f in fields(ScenarioResult))
+FLOAT_FIELDS = ('rate', 'software_cost', 'workspace_cost', 'equipment_cost',
+                'total_expenses', 'suggested_income', 'market_median')
+OBJECT_FIELDS = ('sources', 'market_position')
+
+
+def _object_column(values: List[Any]) -> np.ndarray:
+    column = np.empty(len(values), dtype=object)
+    for i, value in enumerate(values):
+        column[i] = value
+    return column
+
+
+@dataclass(eq=False)
+class ScenarioTable:
+    """
+    Scenario results stored column by column, one NumPy array per
+    ScenarioResult field; missing numbers are NaN.
+
+    The success filter is applied once (`successful`, `rated`) and charts
+    read those columns directly instead of re-filtering a list per field.
+    """
+    experience_level: np.ndarray
+    skills: np.ndarray
+    success: np.ndarray
+    rate: np.ndarray
+    software_cost: np.ndarray
+    workspace_cost: np.ndarray
+    equipment_cost: np.ndarray
+    total_expenses: np.ndarray
+    suggested_income: np.ndarray
+    sources_count: np.ndarray
+    has_web_urls: np.ndarray
+    sources: np.ndarray
+    market_median: np.ndarray
+    market_position: np.ndarray
+
+    @classmethod
+    def from_records(cls, records: List[ScenarioResult]) -> 'ScenarioTable':
+        columns = list(zip(*map(attrgetter(*SCENARIO_FIELDS), records))) or [()] * len(SCENARIO_FIELDS)
+        arrays = {}
+        for name, values in zip(SCENARIO_FIELDS, columns):
+            if name in FLOAT_FIELDS:
+                arrays[name] = np.array(values, dtype=float)
+            elif name in OBJECT_FIELDS:
+                arrays[name] = _object_column(values)
+            elif name in ('success', 'has_web_urls'):
+                arrays[name] = np.array(values, dtype=bool)
+            elif name == 'sources_count':
+                arrays[name] = np.array(values, dtype=np.int64)
+            else:
+                arrays[name] = np.array(values, dtype=str)
+        return cls(**arrays)
+
+    def __len__(self) -> int:
+        return len(self.success)
+
+    def __getitem__(self, index) -> 'ScenarioTable':
+        """Rows picked by a boolean mask, index array or slice (slices are views)"""
+        return ScenarioTable(**{name: getattr(self, name)[index] for name in SCENARIO_FIELDS})
+
+    @cached_property
+    def successful(self) -> 'ScenarioTable':
+        return self[self.success]
+
+    @cached_property
+    def rated(self) -> 'ScenarioTable':
+        """Successful rows with a non-zero rate"""
+        return self[self.success & (np.nan_to_num(self.rate) != 0)]
+
+    def labels(self, width: int = 24) -> List[str]:
+        """'<level>\\n<skills>' per row; large runs test several skill sets per level"""
+        labels = []
+        for level, skills in zip(self.experience_level.tolist(), self.skills.tolist()):
+            skills = skills or 'N/A'
+            if len(skills) > width:
+                skills = skills[:width - 3] + '...'
+            labels.append(f'{level}\n{skills}')
+        return labels
+
+    def rows(self) -> Iterator[ScenarioResult]:
+        """The rows as ScenarioResult records, with NaN turned back into None"""
+        columns = [getattr(self, name).tolist() for name in SCENARIO_FIELDS]
+        for values in zip(*columns):
+            yield ScenarioResult(*[None if value != value else value for value in values])
+
+
 def load_json_file(filepath: str) -> Dict[str, Any]:
     """Load and parse a JSON file"""
     with open(filepath, 'r') as f:
         return json.load(f)
 
 
-def parse_results(data: Dict[str, Any]) -> List[ScenarioResult]:
-    """Parse JSON data into ScenarioResult objects"""
+def parse_results(data: Dict[str, Any]) -> ScenarioTable:
+    """Parse JSON data into a columnar ScenarioTable"""
     scenarios = []
     
     for result in data.get('results', []):
@@ -77,129 +228,130 @@ def parse_results(data: Dict[str, Any]) -> List[ScenarioResult]:
             equipment_cost=costs.get('monthly_equipment_cost'),
             total_expenses=costs.get('total_monthly_expenses'),
             suggested_income=income_data.get('suggested_monthly_income'),
-            sources_count=result.get('sources_count', 0),
+            sources_count=result.get('sources_count') or 0,
             has_web_urls=result.get('has_web_urls', False),
             sources=result.get('sources', []),
             market_median=market.get('median_rate'),
             market_position=market.get('position')
         )
         scenarios.append(scenario)
-    
-    return scenarios
+
+    return ScenarioTable.from_records(scenarios)
 
 
-def create_visualizations(scenarios: List[ScenarioResult], metadata: Dict, output_dir: Path):
-    """Create all visualization graphs"""
+def build_chart(name: str, table: ScenarioTable, metadata: Dict):
+    """Draw one of CHART_NAMES onto a new figure and return the figure"""
+    load_plotting()
     plt.style.use('seaborn-v0_8-darkgrid')
+    colors = CHART_COLORS
     
-    # Color scheme
-    colors = {
-        'primary': '#2E86AB',
-        'secondary': '#06A77D',
-        'accent': '#F18F01',
-        'danger': '#D84654',
-        'neutral': '#6C757D'
-    }
+    if name == '01_hourly_rates':
+        fig, ax = plt.subplots(figsize=(14, 8))
+        create_rates_chart(ax, table, colors)
+        title = 'Hourly Rates by Experience Level'
+        if metadata.get('grounding_enabled') is not None:
+            title += f" ({'With' if metadata['grounding_enabled'] else 'Without'} Google Search Grounding)"
+        fig.suptitle(title, fontsize=18, fontweight='bold', y=0.98)
+    elif name == '02_cost_breakdown':
+        fig, ax = plt.subplots(figsize=(14, 8))
+        create_cost_breakdown_chart(ax, table, colors)
+        fig.suptitle('Monthly Cost Breakdown', fontsize=18, fontweight='bold', y=0.98)
+    elif name == '03_income_vs_expenses':
+        fig, ax = plt.subplots(figsize=(14, 8))
+        create_income_vs_expenses_chart(ax, table, colors)
+        fig.suptitle('Monthly Income vs Total Expenses', fontsize=18, fontweight='bold', y=0.98)
+    elif name == '04_rate_progression':
+        fig, ax = plt.subplots(figsize=(14, 8))
+        create_rate_progression_chart(ax, table, colors)
+        fig.suptitle('Rate Progression & Market Position', fontsize=18, fontweight='bold', y=0.98)
+    elif name == '05_sources_analysis':
+        fig, ax = plt.subplots(figsize=(12, 8))
+        create_sources_chart(ax, table, colors)
+        fig.suptitle('Data Sources Analysis', fontsize=18, fontweight='bold', y=0.98)
+    elif name == '06_rate_distribution':
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 7))
+        create_rate_distribution_charts(ax1, ax2, table, colors)
+        fig.suptitle('Rate Distribution Analysis', fontsize=18, fontweight='bold', y=0.98)
+    elif name == '07_summary_dashboard':
+        fig = plt.figure(figsize=(16, 10))
+        create_summary_dashboard(fig, table, metadata, colors)
+        fig.suptitle('Summary Dashboard', fontsize=20, fontweight='bold', y=0.98)
+    else:
+        raise ValueError(f'Unknown chart: {name}')
     
+    return fig
+
+
+def render_chart(context: Tuple[ScenarioTable, Dict], name: str, path: Optional[Path]):
+    """
+    Build one chart and, if path is given, save it as a 300-dpi PNG.
+
+    Runs in a worker process when rendering in parallel; the figure itself is
+    returned (pickled across processes) so the PDF can embed it as vectors.
+    """
+    table, metadata = context
+    fig = build_chart(name, table, metadata)
+    if path is not None:
+        fig.savefig(path, dpi=300, bbox_inches='tight', facecolor='white')
+    plt.close(fig)
+    return fig
+
+
+def create_visualizations(table: ScenarioTable, metadata: Dict, output_dir: Path,
+                          workers: Optional[int] = None, png: bool = True,
+                          cache: Optional[ChartCache] = None, max_disk_bytes: Optional[int] = None):
+    """
+    Create all visualization graphs (in parallel unless workers == 1).
+
+    Charts found in cache are reused instead of re-rendered; with
+    max_disk_bytes, older runs in single_visual/ are deleted to fit it.
+    """
     visual_dir = output_dir / 'single_visual'
     visual_dir.mkdir(exist_ok=True, parents=True)
     
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     test_type = "with_grounding" if metadata.get('grounding_enabled', True) else "without_grounding"
-    
-    print(f"\n  {Colors.CYAN}Generating visualization charts...{Colors.END}\n")
-    
-    image_paths = []
-    
-    # 1. Hourly Rates Chart
-    fig, ax = plt.subplots(figsize=(14, 8))
-    create_rates_chart(ax, scenarios, colors)
-    title = 'Hourly Rates by Experience Level'
-    if metadata.get('grounding_enabled') is not None:
-        title += f" ({'With' if metadata['grounding_enabled'] else 'Without'} Google Search Grounding)"
-    fig.suptitle(title, fontsize=18, fontweight='bold', y=0.98)
-    path = visual_dir / f'01_hourly_rates_{test_type}_{timestamp}.png'
-    plt.savefig(path, dpi=300, bbox_inches='tight', facecolor='white')
-    image_paths.append(path)
-    print(f"  ✓ Saved: {path.name}")
-    plt.close()
-    
-    # 2. Cost Breakdown Chart
-    fig, ax = plt.subplots(figsize=(14, 8))
-    create_cost_breakdown_chart(ax, scenarios, colors)
-    fig.suptitle('Monthly Cost Breakdown', fontsize=18, fontweight='bold', y=0.98)
-    path = visual_dir / f'02_cost_breakdown_{test_type}_{timestamp}.png'
-    plt.savefig(path, dpi=300, bbox_inches='tight', facecolor='white')
-    image_paths.append(path)
-    print(f"  ✓ Saved: {path.name}")
-    plt.close()
-    
-    # 3. Income vs Expenses Chart
-    fig, ax = plt.subplots(figsize=(14, 8))
-    create_income_vs_expenses_chart(ax, scenarios, colors)
-    fig.suptitle('Monthly Income vs Total Expenses', fontsize=18, fontweight='bold', y=0.98)
-    path = visual_dir / f'03_income_vs_expenses_{test_type}_{timestamp}.png'
-    plt.savefig(path, dpi=300, bbox_inches='tight', facecolor='white')
-    image_paths.append(path)
-    print(f"  ✓ Saved: {path.name}")
-    plt.close()
-    
-    # 4. Rate Progression Chart
-    fig, ax = plt.subplots(figsize=(14, 8))
-    create_rate_progression_chart(ax, scenarios, colors)
-    fig.suptitle('Rate Progression & Market Position', fontsize=18, fontweight='bold', y=0.98)
-    path = visual_dir / f'04_rate_progression_{test_type}_{timestamp}.png'
-    plt.savefig(path, dpi=300, bbox_inches='tight', facecolor='white')
-    image_paths.append(path)
-    print(f"  ✓ Saved: {path.name}")
-    plt.close()
-    
-    # 5. Sources Analysis Chart
-    fig, ax = plt.subplots(figsize=(12, 8))
-    create_sources_chart(ax, scenarios, colors)
-    fig.suptitle('Data Sources Analysis', fontsize=18, fontweight='bold', y=0.98)
-    path = visual_dir / f'05_sources_analysis_{test_type}_{timestamp}.png'
-    plt.savefig(path, dpi=300, bbox_inches='tight', facecolor='white')
-    image_paths.append(path)
-    print(f"  ✓ Saved: {path.name}")
-    plt.close()
-    
-    # 6. Rate Distribution Chart
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 7))
-    create_rate_distribution_charts(ax1, ax2, scenarios, colors)
-    fig.suptitle('Rate Distribution Analysis', fontsize=18, fontweight='bold', y=0.98)
-    path = visual_dir / f'06_rate_distribution_{test_type}_{timestamp}.png'
-    plt.savefig(path, dpi=300, bbox_inches='tight', facecolor='white')
-    image_paths.append(path)
-    print(f"  ✓ Saved: {path.name}")
-    plt.close()
-    
-    # 7. Summary Dashboard
-    fig = plt.figure(figsize=(16, 10))
-    create_summary_dashboard(fig, scenarios, metadata, colors)
-    fig.suptitle('Summary Dashboard', fontsize=20, fontweight='bold', y=0.98)
-    path = visual_dir / f'07_summary_dashboard_{test_type}_{timestamp}.png'
-    plt.savefig(path, dpi=300, bbox_inches='tight', facecolor='white')
-    image_paths.append(path)
-    print(f"  ✓ Saved: {path.name}")
-    plt.close()
-    
-    print(f"\n  {Colors.GREEN}✓ All charts saved to: {visual_dir}{Colors.END}\n")
+    workers = default_workers(len(CHART_NAMES)) if workers is None else workers
+    
+    print(f"\n  {Colors.CYAN}Generating visualization charts ({workers} worker{'s' if workers > 1 else ''})...{Colors.END}\n")
+    
+    start = time.perf_counter()
+    jobs = [(name, visual_dir / f'{name}_{test_type}_{timestamp}.png' if png else None) for name in CHART_NAMES]
+    params = {'grounding_enabled': metadata.get('grounding_enabled'), 'dpi': 300,
+              'colors': CHART_COLORS, 'source': source_digest(Path(__file__))}
+    keys = [chart_key(name, table, CHART_INPUTS[name], params) for name in CHART_NAMES]
+    figures = render_cached(cache, keys, render_chart, jobs, (table, metadata), workers)
+    cached = f", {cache.hits} from cache" if cache else ""
+    if png:
+        for _, path in jobs:
+            print(f"  ✓ Saved: {path.name}")
+        print(f"\n  {Colors.GREEN}✓ All charts saved to: {visual_dir} ({time.perf_counter() - start:.1f}s{cached}){Colors.END}\n")
+    else:
+        print(f"  {Colors.GREEN}✓ Rendered {len(figures)} charts ({time.perf_counter() - start:.1f}s{cached}){Colors.END}\n")
     
     # Create combined PDF
     print(f"  {Colors.CYAN}Creating combined PDF report...{Colors.END}")
-    create_combined_pdf(image_paths, visual_dir / f'REPORT_{test_type}_{timestamp}.pdf', 
-                       scenarios, metadata)
+    create_combined_pdf(figures, visual_dir / f'REPORT_{test_type}_{timestamp}.pdf', 
+                       table, metadata)
+    
+    if max_disk_bytes is not None:
+        removed, freed = collect_garbage(visual_dir, max_disk_bytes)
+        if cache:
+            cache.evict()
+        if removed:
+            print(f"  {Colors.YELLOW}Removed {removed} superseded files ({freed / 1024 / 1024:.1f} MB){Colors.END}\n")
     
     return visual_dir
 
 
-def create_rates_chart(ax, scenarios, colors):
+def create_rates_chart(ax, table, colors):
     """Create main hourly rates bar chart"""
-    levels = [s.experience_level for s in scenarios if s.success]
-    rates = [s.rate or 0 for s in scenarios if s.success]
+    ok = table.successful
+    labels = ok.labels()
+    rates = np.nan_to_num(ok.rate)
     
-    bars = ax.bar(levels, rates, color=colors['primary'], alpha=0.8, 
+    x = np.arange(len(labels))
+    bars = ax.bar(x, rates, color=colors['primary'], alpha=0.8, 
                   edgecolor='black', linewidth=2)
     
     # Add value labels
@@ -213,59 +365,62 @@ def create_rates_chart(ax, scenarios, colors):
     ax.set_xlabel('Experience Level', fontsize=13, fontweight='bold')
     ax.set_ylabel('Hourly Rate ($)', fontsize=13, fontweight='bold')
     ax.set_title('Recommended Hourly Rates', fontsize=15, fontweight='bold', pad=20)
+    ax.set_xticks(x)
+    ax.set_xticklabels(labels, rotation=45, ha='right', fontsize=9)
     ax.grid(True, alpha=0.3, axis='y')
     ax.set_axisbelow(True)
     
     # Calculate and show average
-    if rates:
-        avg_rate = sum(rates) / len(rates)
+    if len(rates):
+        avg_rate = rates.mean()
         ax.axhline(y=avg_rate, color=colors['accent'], linestyle='--', 
                   linewidth=2, label=f'Average: ${avg_rate:.2f}/hr')
         ax.legend(fontsize=11)
 
 
-def create_cost_breakdown_chart(ax, scenarios, colors):
+def create_cost_breakdown_chart(ax, table, colors):
     """Create stacked bar chart for cost breakdown"""
-    levels = [s.experience_level for s in scenarios if s.success]
-    software = [s.software_cost or 0 for s in scenarios if s.success]
-    workspace = [s.workspace_cost or 0 for s in scenarios if s.success]
-    equipment = [s.equipment_cost or 0 for s in scenarios if s.success]
+    ok = table.successful
+    labels = ok.labels()
+    software = np.nan_to_num(ok.software_cost)
+    workspace = np.nan_to_num(ok.workspace_cost)
+    equipment = np.nan_to_num(ok.equipment_cost)
     
-    x = np.arange(len(levels))
+    x = np.arange(len(labels))
     width = 0.6
     
     p1 = ax.bar(x, software, width, label='Software', 
                 color=colors['primary'], alpha=0.9, edgecolor='black', linewidth=1.5)
     p2 = ax.bar(x, workspace, width, bottom=software, label='Workspace',
                 color=colors['secondary'], alpha=0.9, edgecolor='black', linewidth=1.5)
-    p3 = ax.bar(x, equipment, width, bottom=np.array(software) + np.array(workspace),
+    p3 = ax.bar(x, equipment, width, bottom=software + workspace,
                 label='Equipment', color=colors['accent'], alpha=0.9, 
                 edgecolor='black', linewidth=1.5)
     
     # Add total labels
-    totals = [s.total_expenses or 0 for s in scenarios if s.success]
-    for i, total in enumerate(totals):
-        if total > 0:
-            ax.text(i, total, f'${total:.0f}',
-                   ha='center', va='bottom', fontweight='bold', fontsize=10)
+    totals = np.nan_to_num(ok.total_expenses)
+    for i in np.flatnonzero(totals > 0):
+        ax.text(i, totals[i], f'${totals[i]:.0f}',
+               ha='center', va='bottom', fontweight='bold', fontsize=10)
     
     ax.set_xlabel('Experience Level', fontsize=13, fontweight='bold')
     ax.set_ylabel('Monthly Cost ($)', fontsize=13, fontweight='bold')
     ax.set_title('Monthly Operational Costs', fontsize=15, fontweight='bold', pad=20)
     ax.set_xticks(x)
-    ax.set_xticklabels(levels, rotation=0)
+    ax.set_xticklabels(labels, rotation=45, ha='right', fontsize=9)
     ax.legend(fontsize=11, loc='upper left')
     ax.grid(True, alpha=0.3, axis='y')
     ax.set_axisbelow(True)
 
 
-def create_income_vs_expenses_chart(ax, scenarios, colors):
+def create_income_vs_expenses_chart(ax, table, colors):
     """Create chart comparing income vs expenses"""
-    levels = [s.experience_level for s in scenarios if s.success]
-    income = [s.suggested_income or 0 for s in scenarios if s.success]
-    expenses = [s.total_expenses or 0 for s in scenarios if s.success]
+    ok = table.successful
+    labels = ok.labels()
+    income = np.nan_to_num(ok.suggested_income)
+    expenses = np.nan_to_num(ok.total_expenses)
     
-    x = np.arange(len(levels))
+    x = np.arange(len(labels))
     width = 0.35
     
     bars1 = ax.bar(x - width/2, income, width, label='Suggested Income',
@@ -283,33 +438,34 @@ def create_income_vs_expenses_chart(ax, scenarios, colors):
                        ha='center', va='bottom', fontweight='bold', fontsize=9)
     
     # Add profit margin annotations
-    for i, (inc, exp) in enumerate(zip(income, expenses)):
-        if inc > 0 and exp > 0:
-            profit = inc - exp
-            margin = (profit / inc) * 100
-            y_pos = max(inc, exp) * 1.05
-            color = colors['secondary'] if profit > 0 else colors['danger']
-            ax.text(i, y_pos, f'{margin:.0f}% margin',
-                   ha='center', va='bottom', fontsize=8, fontweight='bold',
-                   color=color)
+    profit = income - expenses
+    with np.errstate(divide='ignore', invalid='ignore'):
+        margin = profit / income * 100
+    y_pos = np.maximum(income, expenses) * 1.05
+    for i in np.flatnonzero((income > 0) & (expenses > 0)):
+        color = colors['secondary'] if profit[i] > 0 else colors['danger']
+        ax.text(i, y_pos[i], f'{margin[i]:.0f}% margin',
+               ha='center', va='bottom', fontsize=8, fontweight='bold',
+               color=color)
     
     ax.set_xlabel('Experience Level', fontsize=13, fontweight='bold')
     ax.set_ylabel('Monthly Amount ($)', fontsize=13, fontweight='bold')
     ax.set_title('Income vs Expenses Analysis', fontsize=15, fontweight='bold', pad=20)
     ax.set_xticks(x)
-    ax.set_xticklabels(levels, rotation=0)
+    ax.set_xticklabels(labels, rotation=45, ha='right', fontsize=9)
     ax.legend(fontsize=11)
     ax.grid(True, alpha=0.3, axis='y')
     ax.set_axisbelow(True)
 
 
-def create_rate_progression_chart(ax, scenarios, colors):
+def create_rate_progression_chart(ax, table, colors):
     """Create line chart showing rate progression"""
-    levels = [s.experience_level for s in scenarios if s.success]
-    rates = [s.rate or 0 for s in scenarios if s.success]
-    market_medians = [s.market_median or 0 for s in scenarios if s.success]
+    ok = table.successful
+    labels = ok.labels()
+    rates = np.nan_to_num(ok.rate)
+    market_medians = np.nan_to_num(ok.market_median)
     
-    x = np.arange(len(levels))
+    x = np.arange(len(labels))
     
     # Plot actual rates
     ax.plot(x, rates, 'o-', label='Recommended Rate', 
@@ -317,40 +473,40 @@ def create_rate_progression_chart(ax, scenarios, colors):
            markeredgecolor='black', markeredgewidth=2)
     
     # Plot market medians if available
-    if any(market_medians):
+    if market_medians.any():
         ax.plot(x, market_medians, 's--', label='Market Median',
                color=colors['accent'], linewidth=2.5, markersize=10,
                markeredgecolor='black', markeredgewidth=1.5, alpha=0.7)
     
     # Add value labels
-    for i, (rate, level) in enumerate(zip(rates, levels)):
-        if rate > 0:
-            ax.text(i, rate, f'${rate:.2f}',
-                   ha='center', va='bottom', fontweight='bold', fontsize=10,
-                   bbox=dict(boxstyle='round,pad=0.3', facecolor='white', 
-                            alpha=0.8, edgecolor=colors['primary'], linewidth=1.5))
+    for i in np.flatnonzero(rates > 0):
+        ax.text(i, rates[i], f'${rates[i]:.2f}',
+               ha='center', va='bottom', fontweight='bold', fontsize=10,
+               bbox=dict(boxstyle='round,pad=0.3', facecolor='white', 
+                        alpha=0.8, edgecolor=colors['primary'], linewidth=1.5))
     
     ax.set_xlabel('Experience Level', fontsize=13, fontweight='bold')
     ax.set_ylabel('Hourly Rate ($)', fontsize=13, fontweight='bold')
     ax.set_title('Rate Progression Across Experience Levels', fontsize=15, fontweight='bold', pad=20)
     ax.set_xticks(x)
-    ax.set_xticklabels(levels, rotation=0)
+    ax.set_xticklabels(labels, rotation=45, ha='right', fontsize=9)
     ax.legend(fontsize=11)
     ax.grid(True, alpha=0.3)
     ax.set_axisbelow(True)
 
 
-def create_sources_chart(ax, scenarios, colors):
+def create_sources_chart(ax, table, colors):
     """Create chart showing source counts and web URL presence"""
-    levels = [s.experience_level for s in scenarios if s.success]
-    source_counts = [s.sources_count for s in scenarios if s.success]
-    has_urls = [s.has_web_urls for s in scenarios if s.success]
+    ok = table.successful
+    labels = ok.labels()
+    source_counts = ok.sources_count
+    has_urls = ok.has_web_urls
     
     # Create bars
-    bar_colors = [colors['secondary'] if has_url else colors['neutral'] 
-                  for has_url in has_urls]
+    bar_colors = np.where(has_urls, colors['secondary'], colors['neutral']).tolist()
     
-    bars = ax.bar(levels, source_counts, color=bar_colors, alpha=0.8,
+    x = np.arange(len(labels))
+    bars = ax.bar(x, source_counts, color=bar_colors, alpha=0.8,
                   edgecolor='black', linewidth=2)
     
     # Add value labels and URL indicators
@@ -363,6 +519,8 @@ def create_sources_chart(ax, scenarios, colors):
     ax.set_xlabel('Experience Level', fontsize=13, fontweight='bold')
     ax.set_ylabel('Number of Sources', fontsize=13, fontweight='bold')
     ax.set_title('Data Sources Count & Type', fontsize=15, fontweight='bold', pad=20)
+    ax.set_xticks(x)
+    ax.set_xticklabels(labels, rotation=45, ha='right', fontsize=9)
     ax.grid(True, alpha=0.3, axis='y')
     ax.set_axisbelow(True)
     
@@ -375,19 +533,18 @@ def create_sources_chart(ax, scenarios, colors):
     ax.legend(handles=legend_elements, fontsize=10, loc='upper left')
 
 
-def create_rate_distribution_charts(ax1, ax2, scenarios, colors):
+def create_rate_distribution_charts(ax1, ax2, table, colors):
     """Create rate distribution visualizations"""
-    successful = [s for s in scenarios if s.success and s.rate]
-    levels = [s.experience_level for s in successful]
-    rates = [s.rate for s in successful]
+    labels = table.rated.labels()
+    rates = table.rated.rate
     
-    if not rates:
+    if not len(rates):
         ax1.text(0.5, 0.5, 'No rate data available', ha='center', va='center')
         ax2.text(0.5, 0.5, 'No rate data available', ha='center', va='center')
         return
     
     # Scatter plot with trend
-    x = np.arange(len(levels))
+    x = np.arange(len(labels))
     ax1.scatter(x, rates, s=300, alpha=0.6, color=colors['primary'],
                edgecolors='black', linewidth=2)
     
@@ -399,7 +556,7 @@ def create_rate_distribution_charts(ax1, ax2, scenarios, colors):
                 label=f'Trend: ${z[0]:.2f}/level')
     
     ax1.set_xticks(x)
-    ax1.set_xticklabels(levels, rotation=45, ha='right')
+    ax1.set_xticklabels(labels, rotation=45, ha='right')
     ax1.set_xlabel('Experience Level', fontsize=12, fontweight='bold')
     ax1.set_ylabel('Hourly Rate ($)', fontsize=12, fontweight='bold')
     ax1.set_title('Rate Distribution with Trend', fontsize=13, fontweight='bold')
@@ -407,18 +564,20 @@ def create_rate_distribution_charts(ax1, ax2, scenarios, colors):
     ax1.grid(True, alpha=0.3)
     
     # Box plot
-    ax2.boxplot([rates], labels=['All Levels'], widths=0.6,
+    ax2.boxplot([rates], widths=0.6,
                 patch_artist=True,
                 boxprops=dict(facecolor=colors['primary'], alpha=0.6, linewidth=2),
                 medianprops=dict(color='red', linewidth=3),
                 whiskerprops=dict(linewidth=2),
                 capprops=dict(linewidth=2))
+    ax2.set_xticks([1])
+    ax2.set_xticklabels(['All Levels'])
     
     # Add statistics
-    mean_rate = np.mean(rates)
+    mean_rate = rates.mean()
     median_rate = np.median(rates)
-    min_rate = min(rates)
-    max_rate = max(rates)
+    min_rate = rates.min()
+    max_rate = rates.max()
     
     stats_text = f"Min: ${min_rate:.2f}\n"
     stats_text += f"Max: ${max_rate:.2f}\n"
@@ -433,12 +592,12 @@ def create_rate_distribution_charts(ax1, ax2, scenarios, colors):
     ax2.grid(True, alpha=0.3, axis='y')
 
 
-def create_summary_dashboard(fig, scenarios, metadata, colors):
+def create_summary_dashboard(fig, table, metadata, colors):
     """Create comprehensive summary dashboard"""
     gs = GridSpec(3, 2, figure=fig, hspace=0.4, wspace=0.3)
     
-    successful = [s for s in scenarios if s.success]
-    rates = [s.rate for s in successful if s.rate]
+    successful = table.successful
+    rates = table.rated.rate
     
     # Top section: Key metrics
     ax_metrics = fig.add_subplot(gs[0, :])
@@ -446,17 +605,17 @@ def create_summary_dashboard(fig, scenarios, metadata, colors):
     
     metrics_text = "KEY METRICS\n" + "="*60 + "\n\n"
     
-    if rates:
-        avg_rate = sum(rates) / len(rates)
-        min_rate = min(rates)
-        max_rate = max(rates)
+    if len(rates):
+        avg_rate = rates.mean()
+        min_rate = rates.min()
+        max_rate = rates.max()
         
         metrics_text += f"Average Hourly Rate: ${avg_rate:.2f}\n"
         metrics_text += f"Rate Range: ${min_rate:.2f} - ${max_rate:.2f}\n\n"
     
-    total_scenarios = len(scenarios)
+    total_scenarios = len(table)
     success_count = len(successful)
-    web_sources = sum(1 for s in successful if s.has_web_urls)
+    web_sources = int(successful.has_web_urls.sum())
     
     metrics_text += f"Test Scenarios: {success_count}/{total_scenarios} successful\n"
     metrics_text += f"Web Sources: {web_sources}/{success_count} scenarios\n"
@@ -471,20 +630,21 @@ def create_summary_dashboard(fig, scenarios, metadata, colors):
     
     # Middle left: Rate comparison
     ax_rate = fig.add_subplot(gs[1, 0])
-    levels = [s.experience_level for s in successful if s.rate]
-    rates_plot = [s.rate for s in successful if s.rate]
-    if rates_plot:
-        ax_rate.barh(levels, rates_plot, color=colors['primary'], alpha=0.7, edgecolor='black')
+    if len(rates):
+        y = np.arange(len(rates))
+        ax_rate.barh(y, rates, color=colors['primary'], alpha=0.7, edgecolor='black')
+        ax_rate.set_yticks(y)
+        ax_rate.set_yticklabels(table.rated.labels(), fontsize=8)
         ax_rate.set_xlabel('Rate ($)', fontsize=10, fontweight='bold')
         ax_rate.set_title('Rates by Level', fontsize=11, fontweight='bold')
         ax_rate.grid(True, alpha=0.3, axis='x')
     
     # Middle right: Cost breakdown
     ax_cost = fig.add_subplot(gs[1, 1])
-    if successful:
-        avg_software = np.mean([s.software_cost or 0 for s in successful])
-        avg_workspace = np.mean([s.workspace_cost or 0 for s in successful])
-        avg_equipment = np.mean([s.equipment_cost or 0 for s in successful])
+    if len(successful):
+        avg_software = np.nan_to_num(successful.software_cost).mean()
+        avg_workspace = np.nan_to_num(successful.workspace_cost).mean()
+        avg_equipment = np.nan_to_num(successful.equipment_cost).mean()
         
         costs = [avg_software, avg_workspace, avg_equipment]
         labels = ['Software', 'Workspace', 'Equipment']
@@ -500,7 +660,7 @@ def create_summary_dashboard(fig, scenarios, metadata, colors):
     
     sources_text = "SOURCE ANALYSIS\n" + "="*60 + "\n\n"
     
-    for s in successful[:3]:  # Show first 3 scenarios
+    for s in successful[:3].rows():  # Show first 3 scenarios
         sources_text += f"{s.experience_level.upper()}: {s.sources_count} sources"
         if s.has_web_urls:
             sources_text += " (includes web URLs 🌐)\n"
@@ -520,8 +680,9 @@ def create_summary_dashboard(fig, scenarios, metadata, colors):
                    bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.2))
 
 
-def create_combined_pdf(image_paths, output_path, scenarios, metadata):
-    """Create combined PDF report"""
+def create_combined_pdf(figures, output_path, table, metadata):
+    """Create combined PDF report; chart figures are written as vector pages"""
+    load_plotting()
     from matplotlib.backends.backend_pdf import PdfPages
     
     with PdfPages(output_path) as pdf:
@@ -556,13 +717,13 @@ def create_combined_pdf(image_paths, output_path, scenarios, metadata):
         ax.plot([0.1, 0.9], [0.79, 0.79], 'k-', linewidth=1.5, transform=ax.transAxes)
         
         # Statistics
-        successful = [s for s in scenarios if s.success]
-        rates = [s.rate for s in successful if s.rate]
+        successful = table.successful
+        rates = table.rated.rate
         
-        if rates:
-            avg_rate = sum(rates) / len(rates)
-            min_rate = min(rates)
-            max_rate = max(rates)
+        if len(rates):
+            avg_rate = rates.mean()
+            min_rate = rates.min()
+            max_rate = rates.max()
             
             ax.text(0.5, 0.72, 'AVERAGE HOURLY RATE',
                    transform=ax.transAxes, fontsize=14, fontweight='bold',
@@ -600,10 +761,10 @@ def create_combined_pdf(image_paths, output_path, scenarios, metadata):
             test_time_str = test_time
         
         info_text = f"Generated: {test_time_str}\n\n"
-        info_text += f"Scenarios: {len(successful)}/{len(scenarios)} successful\n"
-        info_text += f"Charts: {len(image_paths)}\n"
+        info_text += f"Scenarios: {len(successful)}/{len(table)} successful\n"
+        info_text += f"Charts: {len(figures)}\n"
         
-        web_sources = sum(1 for s in successful if s.has_web_urls)
+        web_sources = int(successful.has_web_urls.sum())
         info_text += f"Web Sources: {web_sources}/{len(successful)}"
         
         ax.text(0.5, info_y - 0.018, info_text,
@@ -623,17 +784,12 @@ def create_combined_pdf(image_paths, output_path, scenarios, metadata):
         pdf.savefig(fig, bbox_inches='tight')
         plt.close()
         
-        # Add chart images
-        for idx, img_path in enumerate(image_paths, start=2):
-            img = plt.imread(str(img_path))
-            fig = plt.figure(figsize=(8.5, 11))
-            ax = fig.add_subplot(111)
-            ax.imshow(img)
-            ax.axis('off')
-            fig.text(0.5, 0.02, f'Page {idx} of {len(image_paths) + 1}',
+        # Add charts
+        for idx, fig in enumerate(figures, start=2):
+            fig.text(0.5, 0.005, f'Page {idx} of {len(figures) + 1}',
                     ha='center', va='bottom', fontsize=9, color='#999999')
-            pdf.savefig(fig, bbox_inches='tight')
-            plt.close()
+            pdf.savefig(fig, bbox_inches='tight', facecolor='white')
+            plt.close(fig)
         
         # Set metadata
         d = pdf.infodict()
@@ -645,7 +801,7 @@ def create_combined_pdf(image_paths, output_path, scenarios, metadata):
     print(f"  {Colors.GREEN}✓ PDF report saved to: {output_path}{Colors.END}\n")
 
 
-def print_text_report(scenarios: List[ScenarioResult], metadata: Dict):
+def print_text_report(table: ScenarioTable, metadata: Dict):
     """Print text-based report to console"""
     print()
     print(f"{Colors.CYAN}╔══════════════════════════════════════════════════════════════════════════╗{Colors.END}")
@@ -673,7 +829,7 @@ def print_text_report(scenarios: List[ScenarioResult], metadata: Dict):
     print(f"  {'Level':<12} {'Rate':>12} {'Income':>12} {'Expenses':>12} {'Sources':>10} {'Web':>8}")
     print(f"  {'-'*12} {'-'*12} {'-'*12} {'-'*12} {'-'*10} {'-'*8}")
     
-    for s in scenarios:
+    for s in table.rows():
         if s.success:
             rate_str = f"${s.rate:.2f}/hr" if s.rate else "N/A"
             income_str = f"${s.suggested_income:.0f}" if s.suggested_income else "N/A"
@@ -688,24 +844,24 @@ def print_text_report(scenarios: List[ScenarioResult], metadata: Dict):
     print()
     
     # Statistics
-    successful = [s for s in scenarios if s.success]
-    rates = [s.rate for s in successful if s.rate]
+    successful = table.successful
+    rates = table.rated.rate
     
-    if rates:
+    if len(rates):
         print(f"{Colors.BOLD}{'='*80}{Colors.END}")
         print(f"{Colors.BOLD}  STATISTICS{Colors.END}")
         print(f"{Colors.BOLD}{'='*80}{Colors.END}")
         print()
         
-        avg_rate = sum(rates) / len(rates)
-        min_rate = min(rates)
-        max_rate = max(rates)
+        avg_rate = rates.mean()
+        min_rate = rates.min()
+        max_rate = rates.max()
         
         print(f"  Average Rate: ${avg_rate:.2f}/hr")
         print(f"  Range: ${min_rate:.2f} - ${max_rate:.2f}/hr")
-        print(f"  Scenarios: {len(successful)}/{len(scenarios)} successful")
+        print(f"  Scenarios: {len(successful)}/{len(table)} successful")
         
-        web_count = sum(1 for s in successful if s.has_web_urls)
+        web_count = int(successful.has_web_urls.sum())
         print(f"  Web Sources: {web_count}/{len(successful)}")
         print()
 
@@ -715,9 +871,24 @@ def main():
     script_dir = Path(__file__).parent
     results_dir = script_dir / 'results'
     
+    parser = argparse.ArgumentParser(description='Visualize a single quick estimate test run')
+    parser.add_argument('file', nargs='?', help='Result JSON (default: results/latest_with_grounding.json)')
+    parser.add_argument('--text-only', action='store_true',
+                        help='Console report only; never imports matplotlib')
+    parser.add_argument('-o', '--output-dir', default=str(results_dir),
+                        help='Where charts and the PDF report go (default: results/)')
+    parser.add_argument('--workers', type=int,
+                        help='Chart rendering processes (default: one per core; 1 renders serially)')
+    parser.add_argument('--no-png', action='store_true', help='Only write the PDF report, not the PNG charts')
+    parser.add_argument('--no-cache', action='store_true', help='Re-render every chart instead of reusing cached ones')
+    parser.add_argument('--max-disk-mb', type=float, default=DEFAULT_MAX_BYTES / 1024 / 1024,
+                        help='Delete the oldest report runs (and cached charts) beyond this size (default: 200)')
+    args = parser.parse_args()
+    max_disk_bytes = int(args.max_disk_mb * 1024 * 1024)
+    
     # Determine input file
-    if len(sys.argv) >= 2:
-        input_file = Path(sys.argv[1])
+    if args.file:
+        input_file = Path(args.file)
     else:
         # Use latest with grounding by default
         input_file = results_dir / 'latest_with_grounding.json'
@@ -732,7 +903,7 @@ def main():
     data = load_json_file(str(input_file))
     
     # Parse results
-    scenarios = parse_results(data)
+    table = parse_results(data)
     metadata = {
         'timestamp': data.get('timestamp'),
         'grounding_enabled': data.get('grounding_enabled'),
@@ -740,12 +911,18 @@ def main():
     }
     
     # Print text report
-    print_text_report(scenarios, metadata)
+    print_text_report(table, metadata)
+    
+    if args.text_only:
+        return
     
     # Generate visualizations
     print(f"{Colors.BOLD}Generating visualizations...{Colors.END}")
-    results_dir.mkdir(exist_ok=True)
-    visual_dir = create_visualizations(scenarios, metadata, results_dir)
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(exist_ok=True, parents=True)
+    cache = None if args.no_cache else ChartCache(output_dir / '.cache' / 'charts', max_disk_bytes)
+    visual_dir = create_visualizations(table, metadata, output_dir, args.workers, not args.no_png,
+                                       cache, max_disk_bytes)
     
     print()
     print(f"{Colors.CYAN}{'='*80}{Colors.END}")
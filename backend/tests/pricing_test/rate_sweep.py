@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+UREA Rate Surface Sweep
+
+Evaluates the project hourly rate over the full cross product of
+seniority level × client type × client region × billable hours × profit
+margin in one broadcast expression (no nested loops), using the same
+multipliers as SeniorityMultiplier and ClientContext.
+
+The result is a RateSurface: a 5-D rates array plus its axis labels, saved
+as .npz so it can be sliced later without recomputation.
+
+Usage:
+    python3 rate_sweep.py
+    python3 rate_sweep.py --hours 60:160:10 --margins 0.05:0.30:0.05
+    python3 rate_sweep.py -o rate_surface.npz
+    python3 rate_sweep.py --load rate_surface.npz --select seniority=senior region=global
+"""
+
+import argparse
+from dataclasses import dataclass
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from pricing_oracle import (
+    CLIENT_TYPE_MULTIPLIERS,
+    REGION_MULTIPLIERS,
+    SENIORITY_MULTIPLIERS,
+    apply_multipliers,
+    calculate_sustainability_rate,
+)
+
+AXES = ("seniority", "client_type", "region", "billable_hours", "profit_margin")
+
+
+@dataclass
+class RateSurface:
+    """Rates over AXES; labels[axis] names each index along that axis"""
+    rates: np.ndarray
+    labels: Dict[str, np.ndarray]
+
+    def sel(self, **selection) -> "RateSurface":
+        """Fix axes by label, e.g. sel(seniority='senior', billable_hours=120); returns a view"""
+        index = []
+        labels = {}
+        for axis in self.labels:
+            if axis in selection:
+                index.append(self._position(axis, selection[axis]))
+            else:
+                index.append(slice(None))
+                labels[axis] = self.labels[axis]
+        return RateSurface(self.rates[tuple(index)], labels)
+
+    def _position(self, axis: str, value) -> int:
+        values = self.labels[axis]
+        matches = np.flatnonzero(np.isclose(values, value) if values.dtype.kind == "f" else values == value)
+        if not len(matches):
+            raise KeyError(f"{value!r} is not a label on axis {axis!r}")
+        return int(matches[0])
+
+    def save(self, path: str):
+        np.savez_compressed(path, rates=self.rates,
+                            **{f"axis_{axis}": values for axis, values in self.labels.items()})
+
+    @classmethod
+    def load(cls, path: str) -> "RateSurface":
+        with np.load(path) as data:
+            labels = {axis: data[f"axis_{axis}"] for axis in AXES if f"axis_{axis}" in data}
+            return cls(data["rates"], labels)
+
+
+def sweep(billable_hours: Sequence[float], profit_margins: Sequence[float],
+          fixed_costs: float, variable_costs: float, desired_income: float) -> RateSurface:
+    """Compute the rate surface for one cost profile over every multiplier and grid point"""
+    hours = np.asarray(billable_hours, dtype=np.float64)
+    margins = np.asarray(profit_margins, dtype=np.float64)
+
+    # (hours, margin) grid of base rates, priced by the batch oracle
+    grid_hours, grid_margins = np.meshgrid(hours, margins, indexing="ij")
+    base = calculate_sustainability_rate({
+        "monthly_rent": np.full(grid_hours.shape, fixed_costs),
+        "equipment_cost": np.zeros(grid_hours.shape),
+        "utilities_cost": np.zeros(grid_hours.shape),
+        "materials_cost": np.full(grid_hours.shape, variable_costs),
+        "desired_income": np.full(grid_hours.shape, desired_income),
+        "billable_hours": grid_hours,
+        "profit_margin": grid_margins,
+    })
+
+    seniority = np.array(list(SENIORITY_MULTIPLIERS.values()))
+    client_type = np.array(list(CLIENT_TYPE_MULTIPLIERS.values()))
+    region = np.array(list(REGION_MULTIPLIERS.values()))
+    context = client_type[:, None] * region[None, :]
+
+    rates = apply_multipliers(
+        base[None, None, None, :, :],
+        seniority[:, None, None, None, None],
+        context[None, :, :, None, None],
+    )
+
+    return RateSurface(rates, {
+        "seniority": np.array(list(SENIORITY_MULTIPLIERS)),
+        "client_type": np.array(list(CLIENT_TYPE_MULTIPLIERS)),
+        "region": np.array(list(REGION_MULTIPLIERS)),
+        "billable_hours": hours,
+        "profit_margin": margins,
+    })
+
+
+def parse_range(spec: str) -> np.ndarray:
+    """'start:stop:step' (inclusive) or a comma-separated list"""
+    if ":" in spec:
+        start, stop, step = (float(v) for v in spec.split(":"))
+        count = int(round((stop - start) / step)) + 1
+        return np.round(start + step * np.arange(count), 6)
+    return np.array([float(v) for v in spec.split(",")])
+
+
+def parse_selection(items: List[str]) -> Dict[str, object]:
+    selection = {}
+    for item in items:
+        axis, _, value = item.partition("=")
+        if axis not in AXES:
+            raise SystemExit(f"Unknown axis: {axis} (choose from {', '.join(AXES)})")
+        selection[axis] = float(value) if axis in ("billable_hours", "profit_margin") else value
+    return selection
+
+
+def print_surface(surface: RateSurface):
+    print(f"  Shape: {surface.rates.shape}  "
+          f"({' × '.join(f'{a}[{len(v)}]' for a, v in surface.labels.items())})")
+    finite = surface.rates[np.isfinite(surface.rates)]
+    if len(finite):
+        print(f"  Rate range: ${finite.min():.2f} - ${finite.max():.2f}/hr  (mean ${finite.mean():.2f})")
+    if surface.rates.ndim == 2:
+        row_axis, col_axis = surface.labels
+        print()
+        print(f"  {row_axis:<16}" + "".join(f"{str(c):>10}" for c in surface.labels[col_axis]))
+        for label, row in zip(surface.labels[row_axis], surface.rates):
+            print(f"  {str(label):<16}" + "".join(f"{r:>10.2f}" for r in row))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep UREA project rates across multipliers and grids")
+    parser.add_argument("--hours", default="60:160:10", help="Billable hours grid (default: 60:160:10)")
+    parser.add_argument("--margins", default="0.05:0.30:0.05", help="Profit margin grid (default: 0.05:0.30:0.05)")
+    parser.add_argument("--fixed-costs", type=float, default=450, help="Monthly fixed costs (default: 450)")
+    parser.add_argument("--variable-costs", type=float, default=60, help="Monthly variable costs (default: 60)")
+    parser.add_argument("--desired-income", type=float, default=1400, help="Monthly desired income (default: 1400)")
+    parser.add_argument("-o", "--output", help="Save the surface as .npz")
+    parser.add_argument("--load", help="Load a saved .npz surface instead of computing one")
+    parser.add_argument("--select", nargs="*", default=[], help="axis=label filters, e.g. seniority=senior")
+    args = parser.parse_args()
+
+    if args.load:
+        print(f"Loading: {args.load}")
+        surface = RateSurface.load(args.load)
+    else:
+        surface = sweep(parse_range(args.hours), parse_range(args.margins),
+                        args.fixed_costs, args.variable_costs, args.desired_income)
+        print(f"Computed {surface.rates.size} rates")
+
+    if args.output:
+        surface.save(args.output)
+        print(f"  ✓ Saved: {args.output}")
+
+    print_surface(surface.sel(**parse_selection(args.select)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Skill Inverted Index for Generated Profiles
+
+Maps each SKILLS_POOL entry to the sorted row ids of profiles carrying it,
+built from the `skills_mask` column of generate_test_data tables or columnar
+stores. Skill-filtered subsets (e.g. every profile with UI Design and Brand
+Identity) are then selected without scanning the whole dataset.
+
+A saved skill_index.npz records a digest of the skills_mask it was built
+from and is rebuilt when the store has since been rewritten.
+
+Usage:
+    python3 skill_index.py <columnar_dir> "UI Design" "Brand Identity"
+    python3 skill_index.py <columnar_dir> "UI Design" "UX Design" --any
+    python3 skill_index.py <columnar_dir> --save    # Persist skill_index.npz in the store
+"""
+
+import argparse
+import hashlib
+import os
+import time
+from typing import Dict, Iterable
+
+import numpy as np
+
+import generate_test_data
+from generate_test_data import SKILL_BITS, SKILLS_POOL
+
+INDEX_FILE = "skill_index.npz"
+
+
+def mask_digest(skills_mask: np.ndarray) -> str:
+    """SHA-256 of the skills_mask column (dtype and values), to tell a saved index is still current"""
+    skills_mask = np.ascontiguousarray(skills_mask)
+    digest = hashlib.sha256(skills_mask.dtype.str.encode())
+    digest.update(memoryview(skills_mask).cast("B"))
+    return digest.hexdigest()
+
+
+class SkillIndex:
+    """
+    Two CSR-style inverted indexes over the skills_mask column:
+
+    - per skill: rows[offsets[i]:offsets[i + 1]] are the sorted row ids with SKILLS_POOL[i]
+    - per skill set: by_mask[mask_offsets[m]:mask_offsets[m + 1]] are the rows whose
+      skills_mask is exactly m, so any all/any query is a concatenation of a few slices
+    """
+
+    def __init__(self, offsets: np.ndarray, rows: np.ndarray,
+                 mask_offsets: np.ndarray, by_mask: np.ndarray, digest: str = ""):
+        self.offsets = offsets
+        self.rows = rows
+        self.mask_offsets = mask_offsets
+        self.by_mask = by_mask
+        self.digest = digest
+
+    @classmethod
+    def build(cls, skills_mask: np.ndarray) -> "SkillIndex":
+        skills_mask = np.asarray(skills_mask)
+        row_dtype = np.int32 if len(skills_mask) < 2**31 else np.int64
+
+        postings = [np.flatnonzero(skills_mask & bit).astype(row_dtype) for bit in SKILL_BITS.values()]
+        offsets = np.zeros(len(postings) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(p) for p in postings])
+
+        by_mask = np.argsort(skills_mask, kind="stable").astype(row_dtype)
+        mask_offsets = np.zeros(2 ** len(SKILLS_POOL) + 1, dtype=np.int64)
+        mask_offsets[1:] = np.cumsum(np.bincount(skills_mask, minlength=2 ** len(SKILLS_POOL)))
+
+        return cls(offsets, np.concatenate(postings), mask_offsets, by_mask, mask_digest(skills_mask))
+
+    def posting(self, skill: str) -> np.ndarray:
+        """Sorted row ids of profiles with `skill` (a view, no copy)"""
+        i = SKILLS_POOL.index(skill)
+        return self.rows[self.offsets[i]:self.offsets[i + 1]]
+
+    def counts(self) -> Dict[str, int]:
+        return dict(zip(SKILLS_POOL, np.diff(self.offsets).tolist()))
+
+    def select(self, skills: Iterable[str], match_all: bool = True, sort: bool = True) -> np.ndarray:
+        """Row ids having all (default) or any of `skills`; pass sort=False to skip ordering them"""
+        skills = list(skills)
+        if len(skills) == 1:
+            return self.posting(skills[0])
+
+        wanted = generate_test_data.skills_to_mask(skills)
+        masks = np.arange(len(self.mask_offsets) - 1)
+        hits = (masks & wanted) == wanted if match_all else (masks & wanted) != 0
+        hits &= self.mask_offsets[1:] > self.mask_offsets[:-1]
+        if not wanted or not hits.any():
+            return self.rows[:0]
+
+        rows = np.concatenate([self.by_mask[self.mask_offsets[m]:self.mask_offsets[m + 1]]
+                               for m in np.flatnonzero(hits)])
+        return np.sort(rows) if sort else rows
+
+    def save(self, path: str):
+        np.savez(path, offsets=self.offsets, rows=self.rows,
+                 mask_offsets=self.mask_offsets, by_mask=self.by_mask, digest=self.digest)
+
+    @classmethod
+    def load(cls, path: str) -> "SkillIndex":
+        with np.load(path) as data:
+            digest = str(data["digest"]) if "digest" in data.files else ""
+            return cls(data["offsets"], data["rows"], data["mask_offsets"], data["by_mask"], digest)
+
+
+def open_store_index(directory: str) -> SkillIndex:
+    """
+    SkillIndex for a columnar store, reusing a saved skill_index.npz only if it
+    was built from the store's current skills_mask (write_columnar rewrites
+    stores in place, which would leave a stale index's row ids pointing at
+    different profiles).
+    """
+    path = os.path.join(directory, INDEX_FILE)
+    skills_mask = generate_test_data.open_columnar(directory, fields=["skills_mask"])["skills_mask"]
+    if os.path.exists(path):
+        index = SkillIndex.load(path)
+        if index.digest == mask_digest(skills_mask):
+            return index
+    return SkillIndex.build(skills_mask)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Select generated profiles by skill")
+    parser.add_argument("store", help="Columnar directory written by generate_test_data.py --format columnar")
+    parser.add_argument("skills", nargs="*", help=f"Skills from SKILLS_POOL ({', '.join(SKILLS_POOL)})")
+    parser.add_argument("--any", action="store_true", help="Match any of the skills instead of all")
+    parser.add_argument("--save", action="store_true", help=f"Save the index as {INDEX_FILE} in the store")
+    args = parser.parse_args()
+
+    unknown = [s for s in args.skills if s not in SKILL_BITS]
+    if unknown:
+        parser.error(f"unknown skills: {', '.join(unknown)}")
+
+    start = time.perf_counter()
+    index = open_store_index(args.store)
+    print(f"Index ready in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    if args.save:
+        index.save(os.path.join(args.store, INDEX_FILE))
+        print(f"  ✓ Saved: {os.path.join(args.store, INDEX_FILE)}")
+
+    if not args.skills:
+        for skill, count in index.counts().items():
+            print(f"  {skill:<22} {count:>10}")
+        return
+
+    start = time.perf_counter()
+    rows = index.select(args.skills, match_all=not args.any)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    mode = "any" if args.any else "all"
+    print(f"  {len(rows)} profiles with {mode} of {', '.join(args.skills)} ({elapsed_ms:.3f} ms)")
+    if len(rows):
+        print(f"  First rows: {rows[:10].tolist()}")
+
+
+if __name__ == "__main__":
+    main()
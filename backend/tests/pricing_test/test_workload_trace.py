@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+Tests for workload_trace.py
+
+Usage:
+    python3 -m pytest test_workload_trace.py -q
+"""
+
+import os
+import subprocess
+import sys
+
+import workload_trace
+
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "workload_trace.py")
+
+
+def test_sessions_without_duration_terminate_on_zero_tail(tmp_path):
+    # Run as a subprocess so a regression fails on the timeout instead of hanging the suite
+    output = tmp_path / "trace.ndjson"
+    result = subprocess.run([sys.executable, SCRIPT, "-n", "1000", "--rate", "0:1,10:0", "-o", str(output)],
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    meta, records = workload_trace.load_trace(str(output))
+    starts = [record["t"] for record in records if record["seq"] == 0]
+    assert meta["sessions"] == 1000
+    assert 0 < len(starts) < 1000
+    assert max(starts) < 10
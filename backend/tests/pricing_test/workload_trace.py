@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Workload Trace Generator for Multi-Endpoint Load Tests
+
+Emits time-stamped request traces that model whole user sessions instead of
+the isolated calls in quick-estimate-test.sh and pricing-api-test.sh. Each
+session gets its own generate_test_data profile and walks a subset of:
+
+    signup → verify-otp → onboarding start/answers → base-rate
+           → project-rate / quick-estimate → PDF extraction
+
+Sessions arrive as a Poisson process (optionally with a piecewise rate
+schedule) and overlap; requests are streamed to disk as NDJSON in global
+time order, so traces of any length use bounded memory. The same seed
+always produces the same trace.
+
+Trace format (one JSON object per line):
+    {"meta": {...}}                                    # first line: generation settings
+    {"t": 1.234567, "session": 0, "seq": 0, "kind": "full", "step": "signup",
+     "method": "POST", "path": "/users/signup", "body": {...}}
+
+Paths are relative to the API base URL (e.g. http://localhost:3000/api/v1).
+"{otp}", "{user_id}" and "{session_id}" are placeholders the replayer fills
+in from earlier responses of the same session, and "{run}" (in signup
+emails) is a per-replay id, so one trace can be replayed against the same
+database more than once; pdf_extract steps carry a "pdf" file name from
+gemini_test/samples/pdf instead of a JSON body.
+
+Usage:
+    python3 workload_trace.py                                   # 100 sessions at 1/s
+    python3 workload_trace.py -n 10000 --rate 5 -o trace.ndjson
+    python3 workload_trace.py --rate 0:1,300:10,600:2 --duration 900
+    python3 workload_trace.py --mix full=0.5,quick_estimate=0.5 --seed 7
+"""
+
+import argparse
+import heapq
+import json
+import os
+import random
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import generate_test_data
+from pricing_oracle import CLIENT_TYPE_MULTIPLIERS, REGION_MULTIPLIERS
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PDF_SAMPLES_DIR = os.path.join(SCRIPT_DIR, "..", "gemini_test", "samples", "pdf")
+
+TEST_PASSWORD = "TestPassword123!"
+
+# Steps each session kind walks through, in order
+SESSION_KINDS = {
+    "full": ["signup", "verify_otp", "onboarding", "base_rate", "project_rate", "quick_estimate", "pdf_extract"],
+    "onboarding": ["signup", "verify_otp", "onboarding", "base_rate", "project_rate"],
+    "quick_estimate": ["signup", "verify_otp", "quick_estimate"],
+    "pdf": ["signup", "verify_otp", "pdf_extract"],
+}
+DEFAULT_MIX = {"full": 0.4, "onboarding": 0.3, "quick_estimate": 0.2, "pdf": 0.1}
+
+# Mean user think time (seconds) before each step; answers are quick, PDFs need picking
+THINK_TIME = {
+    "signup": 0.0,
+    "verify_otp": 20.0,
+    "onboarding_start": 5.0,
+    "onboarding_answer": 8.0,
+    "onboarding_session": 2.0,
+    "base_rate": 3.0,
+    "project_rate": 10.0,
+    "quick_estimate": 15.0,
+    "pdf_extract": 30.0,
+}
+
+# The quick-estimate endpoint uses its own experience labels
+QUICK_ESTIMATE_LEVELS = {
+    "junior": "beginner",
+    "mid": "intermediate",
+    "senior": "experienced",
+    "expert": "expert",
+}
+
+SAMPLE_PDFS = sorted(f for f in os.listdir(PDF_SAMPLES_DIR) if f.endswith(".pdf")) \
+    if os.path.isdir(PDF_SAMPLES_DIR) else []
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """'full=0.4,pdf=0.1' -> normalized weights over SESSION_KINDS"""
+    mix = {}
+    for item in spec.split(","):
+        kind, _, weight = item.partition("=")
+        kind = kind.strip()
+        if kind not in SESSION_KINDS:
+            raise SystemExit(f"Unknown session kind: {kind} (choose from {', '.join(SESSION_KINDS)})")
+        mix[kind] = float(weight)
+    total = sum(mix.values())
+    if total <= 0:
+        raise SystemExit("Session mix weights must sum to a positive number")
+    return {kind: weight / total for kind, weight in mix.items()}
+
+
+def parse_rate(spec: str) -> List[Tuple[float, float]]:
+    """'2' (constant sessions/s) or 'start:rate,...' piecewise schedule, e.g. '0:1,300:10'"""
+    if ":" not in spec:
+        return [(0.0, float(spec))]
+    schedule = sorted((float(t), float(r)) for t, r in (item.split(":") for item in spec.split(",")))
+    if schedule[0][0] > 0:
+        schedule.insert(0, (0.0, 0.0))
+    return schedule
+
+
+def rate_at(schedule: List[Tuple[float, float]], t: float) -> float:
+    rate = schedule[0][1]
+    for start, r in schedule:
+        if start > t:
+            break
+        rate = r
+    return rate
+
+
+def iter_arrivals(rng: random.Random, schedule: List[Tuple[float, float]],
+                  duration: Optional[float] = None) -> Iterator[float]:
+    """
+    Session start times of a (non-homogeneous) Poisson process, by thinning.
+    Ends at `duration`, or once the schedule's last segment has rate 0.
+    """
+    peak = max(r for _, r in schedule)
+    if peak <= 0:
+        return
+    last_start, last_rate = schedule[-1]
+    t = 0.0
+    while True:
+        t += rng.expovariate(peak)
+        if duration is not None and t > duration:
+            return
+        if last_rate <= 0 and t >= last_start:
+            return
+        if rng.random() * peak < rate_at(schedule, t):
+            yield t
+
+
+ONBOARDING_STEPS = ["onboarding_start"] + ["onboarding_answer"] * 10 + ["onboarding_session"]
+
+
+def onboarding_answers(profile: Dict) -> List[str]:
+    """The 10 answers in OnboardingSession.createDefaultQuestions() order"""
+    return [
+        str(profile["monthly_rent"]),
+        str(profile["equipment_cost"]),
+        str(profile["utilities_cost"]),
+        str(profile["materials_cost"]),
+        str(profile["desired_income"]),
+        str(profile["billable_hours"]),
+        str(profile["profit_margin"]),
+        str(profile["years_experience"]),
+        ", ".join(profile["skills"]),
+        profile["seniority"],
+    ]
+
+
+def session_requests(session: int, kind: str, profile: Dict, rng: random.Random, seed: int) -> List[Dict]:
+    """Requests for one session, without timestamps"""
+    email = f"trace_{seed}_{session}_{{run}}@test.com"
+    client_type = rng.choice(list(CLIENT_TYPE_MULTIPLIERS))
+    client_region = rng.choice(list(REGION_MULTIPLIERS))
+
+    requests = []
+    for step in SESSION_KINDS[kind]:
+        if step == "signup":
+            requests.append({"step": step, "method": "POST", "path": "/users/signup", "body": {
+                "email": email, "password": TEST_PASSWORD,
+                "user_name": f"Trace User {session}", "role": "designer"}})
+        elif step == "verify_otp":
+            requests.append({"step": step, "method": "POST", "path": "/users/verify-otp",
+                             "body": {"email": email, "otp": "{otp}"}})
+        elif step == "onboarding":
+            requests.append({"step": "onboarding_start", "method": "POST", "path": "/pricing/onboarding/start",
+                             "body": {"user_id": "{user_id}"}})
+            for answer in onboarding_answers(profile):
+                requests.append({"step": "onboarding_answer", "method": "POST",
+                                 "path": "/pricing/onboarding/answer",
+                                 "body": {"session_id": "{session_id}", "answer": answer}})
+            requests.append({"step": "onboarding_session", "method": "GET",
+                             "path": "/pricing/onboarding/session/{session_id}"})
+        elif step == "base_rate":
+            requests.append({"step": step, "method": "POST", "path": "/pricing/calculate/base-rate",
+                             "body": {"user_id": "{user_id}", "session_id": "{session_id}"}})
+        elif step == "project_rate":
+            requests.append({"step": step, "method": "POST", "path": "/pricing/calculate/project-rate",
+                             "body": {"user_id": "{user_id}", "client_type": client_type,
+                                      "client_region": client_region}})
+        elif step == "quick_estimate":
+            requests.append({"step": step, "method": "POST", "path": "/pricing/quick-estimate",
+                             "body": {"user_id": "{user_id}", "skills": ", ".join(profile["skills"]),
+                                      "experience_level": QUICK_ESTIMATE_LEVELS[profile["seniority"]],
+                                      "client_type": client_type,
+                                      "hours_per_week": max(1, round(profile["billable_hours"] / 4))}})
+        elif step == "pdf_extract":
+            requests.append({"step": step, "method": "POST", "path": "/pdf/extract",
+                             "pdf": rng.choice(SAMPLE_PDFS) if SAMPLE_PDFS else None,
+                             "form": {"user_id": "{user_id}"}})
+    return requests
+
+
+def session_length(kind: str) -> int:
+    """Number of requests session_requests() emits for a session kind"""
+    return sum(len(ONBOARDING_STEPS) if step == "onboarding" else 1 for step in SESSION_KINDS[kind])
+
+
+def iter_trace(sessions: Optional[int] = 100, rate: str = "1", mix: Optional[Dict[str, float]] = None,
+               duration: Optional[float] = None, think_scale: float = 1.0, seed: int = 42) -> Iterator[Dict]:
+    """
+    Trace records in timestamp order. Stops after `sessions` sessions or
+    `duration` seconds of arrivals, whichever comes first.
+
+    Sessions are generated lazily in arrival order and their requests are
+    merged through a heap, so only sessions still in flight are held in memory.
+    """
+    mix = mix or DEFAULT_MIX
+    kinds, weights = list(mix), list(mix.values())
+    rng = random.Random(seed)
+    arrivals = iter_arrivals(random.Random(seed + 1), parse_rate(rate), duration)
+
+    pending = []  # (t, session, seq, record)
+    session = 0
+    next_arrival = next(arrivals, None)
+    while next_arrival is not None or pending:
+        if next_arrival is not None and (sessions is None or session < sessions) and \
+                (not pending or next_arrival <= pending[0][0]):
+            kind = rng.choices(kinds, weights)[0]
+            profile = generate_test_data.generate_profile(rng)
+            t = next_arrival
+            for seq, request in enumerate(session_requests(session, kind, profile, rng, seed)):
+                mean = THINK_TIME.get(request["step"], 0.0) * think_scale
+                if seq and mean > 0:
+                    t += rng.expovariate(1 / mean)
+                record = {"t": round(t, 6), "session": session, "seq": seq, "kind": kind, **request}
+                heapq.heappush(pending, (record["t"], session, seq, record))
+            session += 1
+            next_arrival = next(arrivals, None)
+            if sessions is not None and session >= sessions:
+                next_arrival = None
+        else:
+            yield heapq.heappop(pending)[3]
+
+
+def write_trace(records: Iterator[Dict], path: str, meta: Optional[Dict] = None) -> Dict[str, int]:
+    """Stream trace records to NDJSON; returns request counts per step"""
+    counts = {}
+    with open(path, "w") as f:
+        if meta is not None:
+            f.write(json.dumps({"meta": meta}, separators=(",", ":")) + "\n")
+        for record in records:
+            f.write(json.dumps(record, separators=(",", ":")) + "\n")
+            counts[record["step"]] = counts.get(record["step"], 0) + 1
+    return counts
+
+
+def load_trace(path: str) -> Tuple[Optional[Dict], Iterator[Dict]]:
+    """(meta, lazy record iterator) for a trace written by write_trace()"""
+    f = open(path)
+    first = f.readline()
+    meta = json.loads(first).get("meta") if first.strip() else None
+
+    def records():
+        with f:
+            if meta is None and first.strip():
+                yield json.loads(first)
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    return meta, records()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate time-stamped multi-endpoint session traces")
+    parser.add_argument("-n", "--sessions", type=int, default=100, help="Number of sessions (default: 100)")
+    parser.add_argument("--duration", type=float, help="Stop arrivals after this many seconds")
+    parser.add_argument("--rate", default="1",
+                        help="Session arrivals per second, or a 'start:rate,...' schedule (default: 1)")
+    parser.add_argument("--mix", help=f"Session mix, e.g. "
+                        f"{','.join(f'{k}={v}' for k, v in DEFAULT_MIX.items())} (default)")
+    parser.add_argument("--think-scale", type=float, default=1.0,
+                        help="Multiply every mean think time (0 = fire steps back to back)")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for a reproducible trace")
+    parser.add_argument("-o", "--output", default="workload_trace.ndjson", help="Output NDJSON file")
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix) if args.mix else DEFAULT_MIX
+    sessions = args.sessions if args.sessions > 0 else None
+    if sessions is None and args.duration is None:
+        parser.error("unbounded trace: pass --sessions > 0 or --duration")
+
+    meta = {"seed": args.seed, "sessions": sessions, "duration": args.duration, "rate": args.rate,
+            "mix": mix, "think_scale": args.think_scale}
+    print(f"Writing trace: {args.output}")
+    counts = write_trace(iter_trace(sessions, args.rate, mix, args.duration, args.think_scale, args.seed),
+                         args.output, meta)
+
+    print(f"  ✓ {sum(counts.values())} requests")
+    for step, count in sorted(counts.items(), key=lambda item: -item[1]):
+        print(f"  {step:<20} {count:>10}")
+
+
+if __name__ == "__main__":
+    main()